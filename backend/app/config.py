@@ -21,11 +21,33 @@ class Settings(BaseSettings):
     # Database – optional so the server can start without a configured DB
     # (first-run wizard writes the real URL to .env)
     DATABASE_URL: str = "not_configured"
+    # Connection pool (per worker process). Sized above the threadpool's
+    # typical concurrency so sync handlers don't queue on QueuePool.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    # Server-side cap per statement (PostgreSQL), 0 disables
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
 
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # argon2id cost for new password hashes (OWASP minimum: 19 MiB, t=2, p=1).
+    # Hashes with other costs, and older bcrypt hashes, are upgraded on the
+    # user's next successful login. Raise them to the host's budget with
+    # tune_password_hashing.py.
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456  # KiB
+    ARGON2_PARALLELISM: int = 1
+    # Optional secret HMAC key mixed into every password before hashing.
+    # Hashes record PASSWORD_PEPPER_ID. To rotate, give the new key a new id
+    # and list the old one in PASSWORD_PEPPERS_PREVIOUS ("id:key,id:key") so
+    # existing hashes still verify; they are upgraded on the next login.
+    PASSWORD_PEPPER: str = ""
+    PASSWORD_PEPPER_ID: str = "v1"
+    PASSWORD_PEPPERS_PREVIOUS: str = ""
 
     # Firebase
     FIREBASE_CREDENTIALS_PATH: str = ""
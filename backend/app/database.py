@@ -92,10 +92,30 @@ def _read_env_key(key: str) -> str | None:
 
 
 def _build_engine(url: str):
+    pool_options = {}
+    if url.startswith("postgresql") and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        # A stuck query fails instead of pinning a pooled connection forever
+        pool_options["connect_args"] = {
+            "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+        }
+    if not url.startswith("sqlite"):
+        # Default QueuePool (5 + 10 overflow) is exhausted by a burst of
+        # concurrent threadpool handlers; recycle drops connections before
+        # server-side idle timeouts kill them.
+        pool_options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        })
     return create_engine(
         url,
         pool_pre_ping=True,
         echo=getattr(settings, "DEBUG", False),
+        # Compiled-statement LRU (SQLAlchemy default is 500); sized so the
+        # admin/reporting queries aren't evicted by the ORM's own statements.
+        query_cache_size=1200,
+        **pool_options,
     )
 
 
@@ -123,7 +143,11 @@ def reinitialize_engine(new_url: str | None = None) -> bool:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
 
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        # expire_on_commit=False: request-scoped sessions don't need every
+        # attribute re-SELECTed after commit just to build the response.
+        SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+        )
         logger.info("Database engine initialised: %s", url.split("@")[-1])
         return True
     except Exception as exc:
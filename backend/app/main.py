@@ -10,7 +10,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from .config import settings
@@ -41,6 +41,9 @@ from .routes import (
 from .services.reminder_scheduler import reminder_scheduler
 from .services.backup_scheduler import backup_scheduler
 from .services.verification_cleanup_scheduler import verification_cleanup_scheduler
+from .services.revenue_view import revenue_view_scheduler
+from .services.booking_status_scheduler import booking_status_scheduler
+from .services.email_service import close_smtp_sessions
 
 # Create database tables (guarded – DB may not be configured on first run)
 try:
@@ -77,6 +80,49 @@ def _apply_incremental_migrations():
         except Exception as exc:
             print(f"⚠️  [MIGRATION] Could not add active_session_token: {exc}")
 
+    # ── users.full_name generated column (Oct 2026) ───────────────────────────
+    # Replaces the Python full_name property. A pre-existing plain column of
+    # the same name is left alone (it may hold data): drop it by hand and
+    # restart to get the generated one.
+    try:
+        with engine.connect() as conn:
+            if engine.dialect.name == "postgresql":
+                generated = conn.execute(text(
+                    "SELECT is_generated FROM information_schema.columns "
+                    "WHERE table_name = 'users' AND column_name = 'full_name'"
+                )).scalar()
+                exists, is_generated = generated is not None, generated == "ALWAYS"
+                add_sql = (
+                    "ALTER TABLE users ADD COLUMN full_name VARCHAR "
+                    "GENERATED ALWAYS AS (first_name || ' ' || last_name) STORED"
+                )
+            elif engine.dialect.name == "sqlite":
+                # table_xinfo also lists generated columns (hidden 2 = virtual, 3 = stored)
+                hidden = {
+                    row[1]: row[6] for row in conn.execute(text("PRAGMA table_xinfo(users)"))
+                }.get("full_name")
+                exists, is_generated = hidden is not None, hidden in (2, 3)
+                # SQLite can only ADD a VIRTUAL generated column
+                add_sql = (
+                    "ALTER TABLE users ADD COLUMN full_name TEXT "
+                    "GENERATED ALWAYS AS (first_name || ' ' || last_name) VIRTUAL"
+                )
+            else:
+                exists = is_generated = True
+                add_sql = None
+
+            if not exists:
+                conn.execute(text(add_sql))
+                conn.commit()
+                print("✅ [MIGRATION] Added generated full_name column to users table")
+            elif not is_generated:
+                print(
+                    "⚠️  [MIGRATION] users.full_name exists as a plain column; not replacing it. "
+                    "Drop it manually and restart to add the generated column."
+                )
+    except Exception as exc:
+        print(f"⚠️  [MIGRATION] Could not add full_name to users: {exc}")
+
     # ── Instructor initial-setup token (Feb 2026) ─────────────────────────────
     try:
         existing_instructor_cols = [col["name"] for col in inspector.get_columns("instructors")]
@@ -135,6 +181,175 @@ def _apply_incremental_migrations():
     except Exception as exc:
         print(f"⚠️  [MIGRATION] Booking indexes: {exc}")
 
+    # ── Admin filter indexes (Oct 2026) ────────────────────────────────────────
+    # Match the admin dashboard predicates: per-instructor status filters,
+    # role/status user counts, completed-revenue SUMs and the pending-
+    # verification list. instructors.user_id / students.user_id are already
+    # covered by their UNIQUE constraints.
+    try:
+        admin_indexes = [
+            ("ix_bookings_instructor_status", "bookings(instructor_id, status)"),
+            ("ix_users_role_status", "users(role, status)"),
+        ]
+        if engine.dialect.name == "postgresql":
+            admin_indexes += [
+                # Covering index: SUM(amount) WHERE status = ... is index-only
+                ("ix_bookings_status_amount", "bookings(status) INCLUDE (amount)"),
+                ("ix_instructors_unverified", "instructors(is_verified) WHERE is_verified = false"),
+                # First-admin lookups (global settings holder, admin_exists)
+                ("ix_users_admin_id", "users(id) WHERE role = 'ADMIN'"),
+                # Keyset pagination of the admin bookings list
+                ("ix_bookings_lesson_date_id", "bookings(lesson_date DESC, id DESC)"),
+                # Per-instructor completed revenue (revenue/by-instructor,
+                # top-earner aggregate, revenue view refresh)
+                (
+                    "ix_bookings_completed_instructor_amount",
+                    "bookings(instructor_id) INCLUDE (amount) WHERE status = 'COMPLETED'",
+                ),
+            ]
+        with engine.connect() as conn:
+            for idx_name, idx_target in admin_indexes:
+                try:
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {idx_target}"))
+                    conn.commit()
+                except Exception as idx_exc:
+                    conn.rollback()
+                    print(f"⚠️  [MIGRATION] Could not create {idx_name}: {idx_exc}")
+    except Exception as exc:
+        print(f"⚠️  [MIGRATION] Admin filter indexes: {exc}")
+
+    # ── instructors.total_earnings (Oct 2026) ─────────────────────────────────
+    # Denormalised completed+paid earnings for /auth/me. On PostgreSQL a row
+    # trigger on bookings keeps it in step with every status/payment/amount
+    # change (including bulk UPDATEs); backfilled once when the column is added.
+    # Elsewhere it is summed per request from a covering index.
+    try:
+        instructor_cols = [col["name"] for col in inspector.get_columns("instructors")]
+        added = "total_earnings" not in instructor_cols
+        with engine.connect() as conn:
+            if added:
+                conn.execute(text(
+                    "ALTER TABLE instructors ADD COLUMN total_earnings "
+                    "FLOAT NOT NULL DEFAULT 0"
+                ))
+            if engine.dialect.name == "postgresql":
+                conn.execute(text("""
+                    CREATE OR REPLACE FUNCTION sync_instructor_total_earnings() RETURNS trigger AS $$
+                    BEGIN
+                        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                            IF OLD.status = 'COMPLETED' AND OLD.payment_status = 'PAID' THEN
+                                UPDATE instructors SET total_earnings = total_earnings - OLD.amount
+                                WHERE id = OLD.instructor_id;
+                            END IF;
+                        END IF;
+                        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                            IF NEW.status = 'COMPLETED' AND NEW.payment_status = 'PAID' THEN
+                                UPDATE instructors SET total_earnings = total_earnings + NEW.amount
+                                WHERE id = NEW.instructor_id;
+                            END IF;
+                        END IF;
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                """))
+                conn.execute(text("DROP TRIGGER IF EXISTS trg_bookings_total_earnings ON bookings"))
+                conn.execute(text(
+                    "CREATE TRIGGER trg_bookings_total_earnings "
+                    "AFTER INSERT OR DELETE OR UPDATE OF status, payment_status, amount, instructor_id "
+                    "ON bookings FOR EACH ROW EXECUTE FUNCTION sync_instructor_total_earnings()"
+                ))
+                if added:
+                    conn.execute(text(
+                        "UPDATE instructors i SET total_earnings = COALESCE(("
+                        "SELECT SUM(b.amount) FROM bookings b WHERE b.instructor_id = i.id "
+                        "AND b.status = 'COMPLETED' AND b.payment_status = 'PAID'), 0)"
+                    ))
+            else:
+                # No trigger here: /auth/me sums live, index-only with this
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_bookings_instructor_paid_amount "
+                    "ON bookings(instructor_id, status, payment_status, amount)"
+                ))
+            conn.commit()
+        if added:
+            print("✅ [MIGRATION] Added total_earnings column to instructors table")
+    except Exception as exc:
+        print(f"⚠️  [MIGRATION] Could not set up instructors.total_earnings: {exc}")
+
+    # ── users.profile_roles (Oct 2026) ────────────────────────────────────────
+    # Bitmask of instructor (2) / student (4) profiles read by login. Row
+    # triggers on instructors and students keep it in sync on PostgreSQL;
+    # backfilled once when the column is added.
+    if "profile_roles" not in existing_columns or engine.dialect.name == "postgresql":
+        try:
+            added = "profile_roles" not in existing_columns
+            with engine.connect() as conn:
+                if added:
+                    conn.execute(text(
+                        "ALTER TABLE users ADD COLUMN profile_roles SMALLINT NOT NULL DEFAULT 0"
+                    ))
+                if engine.dialect.name == "postgresql":
+                    conn.execute(text("""
+                        CREATE OR REPLACE FUNCTION sync_user_profile_roles() RETURNS trigger AS $$
+                        DECLARE
+                            flag SMALLINT := CASE TG_TABLE_NAME WHEN 'instructors' THEN 2 ELSE 4 END;
+                        BEGIN
+                            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                                UPDATE users SET profile_roles = profile_roles & ~flag
+                                WHERE id = OLD.user_id;
+                            END IF;
+                            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                                UPDATE users SET profile_roles = profile_roles | flag
+                                WHERE id = NEW.user_id;
+                            END IF;
+                            RETURN NULL;
+                        END;
+                        $$ LANGUAGE plpgsql
+                    """))
+                    for table in ("instructors", "students"):
+                        conn.execute(text(f"DROP TRIGGER IF EXISTS trg_{table}_profile_roles ON {table}"))
+                        conn.execute(text(
+                            f"CREATE TRIGGER trg_{table}_profile_roles "
+                            f"AFTER INSERT OR DELETE OR UPDATE OF user_id ON {table} "
+                            f"FOR EACH ROW EXECUTE FUNCTION sync_user_profile_roles()"
+                        ))
+                    if added:
+                        conn.execute(text(
+                            "UPDATE users u SET profile_roles = "
+                            "(CASE WHEN EXISTS (SELECT 1 FROM instructors i WHERE i.user_id = u.id) THEN 2 ELSE 0 END) | "
+                            "(CASE WHEN EXISTS (SELECT 1 FROM students s WHERE s.user_id = u.id) THEN 4 ELSE 0 END)"
+                        ))
+                conn.commit()
+            if added:
+                print("✅ [MIGRATION] Added profile_roles column to users table")
+        except Exception as exc:
+            print(f"⚠️  [MIGRATION] Could not set up users.profile_roles: {exc}")
+
+    # ── One active password-reset token per user (Oct 2026) ───────────────────
+    # Partial unique index that forgot-password upserts against. Older unused
+    # duplicates (only the newest was ever honoured by the e-mail) are dropped
+    # first so the index can be built.
+    if engine.dialect.name in ("postgresql", "sqlite"):
+        try:
+            with engine.connect() as conn:
+                conn.execute(text(
+                    "DELETE FROM password_reset_tokens WHERE used_at IS NULL AND id NOT IN "
+                    "(SELECT MAX(id) FROM password_reset_tokens WHERE used_at IS NULL GROUP BY user_id)"
+                ))
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_password_reset_tokens_active_user "
+                    "ON password_reset_tokens(user_id) WHERE used_at IS NULL"
+                ))
+                conn.commit()
+        except Exception as exc:
+            print(f"⚠️  [MIGRATION] Could not create ux_password_reset_tokens_active_user: {exc}")
+
+    # ── Revenue materialized views (PostgreSQL only) ──────────────────────────
+    # Pre-aggregated top-earner data and revenue totals for
+    # /admin/revenue/stats; refreshed by revenue_view_scheduler.
+    from .services.revenue_view import ensure_view
+    ensure_view(engine)
+
 
 _apply_incremental_migrations()
 
@@ -179,6 +394,17 @@ async def lifespan(app: FastAPI):
         os.environ["ENCRYPTION_KEY"] = settings.ENCRYPTION_KEY
         print("🔐 Encryption key loaded from settings")
 
+    # Sync handlers (and their Session) run in AnyIO's worker threads. Match
+    # the thread count to the connection pool's capacity so a burst of
+    # requests waits for a thread rather than timing out on QueuePool.
+    # Other blocking DB work must go through run_in_threadpool to share this
+    # limiter; async def handlers that query directly still bypass it.
+    import anyio.to_thread
+
+    db_threads = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    anyio.to_thread.current_default_thread_limiter().total_tokens = db_threads
+    print(f"🧵 Worker threads: {db_threads} (DB pool {settings.DB_POOL_SIZE} + {settings.DB_MAX_OVERFLOW} overflow)")
+
     # Create all tables (if they don't exist)
     print("\n📊 Ensuring database tables exist...")
     try:
@@ -251,6 +477,14 @@ async def lifespan(app: FastAPI):
     print("🧹 Starting verification cleanup scheduler...")
     verification_cleanup_task = asyncio.create_task(verification_cleanup_scheduler.start())
 
+    # Start revenue materialized-view refresh scheduler
+    print("📈 Starting revenue view refresh scheduler...")
+    revenue_view_task = asyncio.create_task(revenue_view_scheduler.start())
+
+    # Start booking status scheduler (marks past PENDING bookings COMPLETED)
+    print("📅 Starting booking status scheduler...")
+    booking_status_task = asyncio.create_task(booking_status_scheduler.start())
+
     yield
 
     # Shutdown
@@ -284,6 +518,29 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    # Stop revenue view refresh scheduler
+    print("🛑 Stopping revenue view refresh scheduler...")
+    await revenue_view_scheduler.stop()
+    if revenue_view_task:
+        revenue_view_task.cancel()
+        try:
+            await revenue_view_task
+        except asyncio.CancelledError:
+            pass
+
+    # Stop booking status scheduler
+    print("🛑 Stopping booking status scheduler...")
+    await booking_status_scheduler.stop()
+    if booking_status_task:
+        booking_status_task.cancel()
+        try:
+            await booking_status_task
+        except asyncio.CancelledError:
+            pass
+
+    # Close pooled SMTP connections
+    close_smtp_sessions()
+
 
 # Create FastAPI app with lifespan
 _is_production = settings.ENVIRONMENT == "production"
@@ -297,6 +554,8 @@ app = FastAPI(
     description="API for South African driving school booking system",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes the (large) admin/list payloads in native code
+    default_response_class=ORJSONResponse,
     docs_url=None if _is_production else "/docs",
     redoc_url=None if _is_production else "/redoc",
     openapi_url=None if _is_production else "/openapi.json",
@@ -344,7 +603,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "Accept", "X-Requested-With", "Idempotency-Key"],
-    expose_headers=["X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset", "Idempotent-Replayed"],
+    expose_headers=[
+        "X-RateLimit-Limit",
+        "X-RateLimit-Remaining",
+        "X-RateLimit-Reset",
+        "Idempotent-Replayed",
+        "X-Total-Count",
+        "X-Next-Cursor",
+    ],
 )
 
 # Idempotency-Key replay protection (Stripe-style). Applies to all mutating
@@ -2,26 +2,126 @@
 Admin authentication and authorization middleware
 """
 
-from typing import Annotated
+import hashlib
+from typing import Annotated, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Cookie, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models.user import User, UserRole, UserStatus
-from ..routes.auth import get_current_user
+from ..routes.auth import forget_session_principals, get_current_principal, get_current_user
+from ..utils.response_cache import response_cache
+
+# Admin dashboards poll many endpoints at once. The resolved identity comes
+# from the per-session principal cache (see get_current_principal); rejected
+# tokens are negative-cached here per token so polling with a stale token
+# doesn't hit the database either.
+ADMIN_PRINCIPAL_CACHE_NAMESPACE = "admin_principal"
+ADMIN_PRINCIPAL_CACHE_TTL_SECONDS = 30
+
+
+def _request_token(request: Request, access_token: Optional[str]) -> Optional[str]:
+    """Token from the HTTP-only cookie, falling back to the Authorization header."""
+    if access_token:
+        return access_token
+    authorization = request.headers.get("Authorization")
+    if authorization and authorization.startswith("Bearer "):
+        return authorization.replace("Bearer ", "")
+    return None
+
+
+def _principal_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def invalidate_admin_principal_cache(token: Optional[str] = None) -> None:
+    """
+    Drop cached identities: just the given token's rejection entry, or all
+    cached principals and rejections (after a user is suspended, deleted or
+    has their password reset).
+    """
+    if token:
+        response_cache.delete(ADMIN_PRINCIPAL_CACHE_NAMESPACE, _principal_cache_key(token))
+    else:
+        response_cache.clear(ADMIN_PRINCIPAL_CACHE_NAMESPACE)
+        forget_session_principals()
+
+
+# Set on a session whose flush changed a user's status or role (or deleted a
+# user); the cached principals are dropped once that transaction commits, so
+# suspensions and role edits take effect immediately whichever route made them.
+# Only ORM flushes are seen: bulk update(User) statements must call
+# invalidate_admin_principal_cache() themselves.
+_PRINCIPALS_STALE_KEY = "principals_stale"
+
+
+@event.listens_for(Session, "after_flush")
+def _note_principal_changes(session: Session, flush_context) -> None:
+    if session.info.get(_PRINCIPALS_STALE_KEY):
+        return
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            session.info[_PRINCIPALS_STALE_KEY] = True
+            return
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            attrs = inspect(obj).attrs
+            if attrs.status.history.has_changes() or attrs.role.history.has_changes():
+                session.info[_PRINCIPALS_STALE_KEY] = True
+                return
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_stale_principals(session: Session) -> None:
+    if session.info.pop(_PRINCIPALS_STALE_KEY, False):
+        invalidate_admin_principal_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_principal_changes(session: Session) -> None:
+    session.info.pop(_PRINCIPALS_STALE_KEY, None)
 
 
 async def require_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
+    request: Request,
     db: Session = Depends(get_db),
+    access_token: Optional[str] = Cookie(None),
 ) -> User:
     """
     Dependency to ensure the current user is an admin
 
+    On a cache hit the returned User is a transient object carrying only
+    id, role, status and active_role.
+
     Raises:
         HTTPException: If user is not an admin or account is not active
     """
+    token = _request_token(request, access_token)
+    cache_key = _principal_cache_key(token) if token else None
+
+    if cache_key:
+        cached = response_cache.get(ADMIN_PRINCIPAL_CACHE_NAMESPACE, cache_key)
+        if cached is not None and "error" in cached:
+            raise HTTPException(**cached["error"])
+
+    try:
+        # Blocking (cache / DB access) - keep it off the event loop
+        current_user = await run_in_threadpool(get_current_principal, request, db, access_token)
+    except HTTPException as exc:
+        # Negative-cache rejected tokens so repeated polling with a stale
+        # token doesn't hit the database either.
+        if cache_key and exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            response_cache.set(
+                ADMIN_PRINCIPAL_CACHE_NAMESPACE,
+                cache_key,
+                {"error": {"status_code": exc.status_code, "detail": exc.detail, "headers": exc.headers}},
+                ADMIN_PRINCIPAL_CACHE_TTL_SECONDS,
+            )
+        raise
+
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -2,10 +2,11 @@
 Password Reset Token Model
 """
 
+import hashlib
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -21,6 +22,7 @@ class PasswordResetToken(Base):
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
+    # SHA-256 hex digest of the emailed token; the raw token is never stored
     token = Column(String, unique=True, index=True, nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -29,11 +31,27 @@ class PasswordResetToken(Base):
     # Relationships
     user = relationship("User", back_populates="password_reset_tokens")
 
+    __table_args__ = (
+        # At most one unused token per user; forgot-password upserts on it
+        Index(
+            "ux_password_reset_tokens_active_user",
+            "user_id",
+            unique=True,
+            postgresql_where=text("used_at IS NULL"),
+            sqlite_where=text("used_at IS NULL"),
+        ),
+    )
+
     @staticmethod
     def generate_token() -> str:
         """Generate a unique reset token"""
         return str(uuid4())
 
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Digest stored in (and looked up by) the ``token`` column"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
     @staticmethod
     def get_expiration_time() -> datetime:
         """Get token expiration time (1 hour from now)"""
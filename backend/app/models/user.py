@@ -5,9 +5,9 @@ User models for authentication and profiles
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime
+from sqlalchemy import Boolean, Column, Computed, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Integer, SmallInteger, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -39,10 +39,18 @@ class UserStatus(str, enum.Enum):
     SUSPENDED = "suspended"
 
 
+# User.profile_roles bits
+PROFILE_INSTRUCTOR = 2
+PROFILE_STUDENT = 4
+
+
 class User(Base):
     """Base user model"""
 
     __tablename__ = "users"
+    # Fetch server-generated values (created_at, updated_at, full_name) via
+    # RETURNING during flush instead of a follow-up SELECT / db.refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -50,8 +58,15 @@ class User(Base):
     password_hash = Column(String, nullable=False)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
+    # Stored generated column so list queries can SELECT the display name
+    # directly (NULL until the row is flushed)
+    full_name = Column(String, Computed("first_name || ' ' || last_name", persisted=True))
     id_number = Column(String, nullable=True)  # South African ID number (nullable for legacy users)
     role = Column(SQLEnum(UserRole), nullable=False)
+    # Bitmask of attached profiles (PROFILE_INSTRUCTOR | PROFILE_STUDENT) so
+    # login can list a user's roles without probing instructors/students.
+    # Maintained by triggers on those tables (PostgreSQL) - never written by the app.
+    profile_roles = Column(SmallInteger, nullable=False, server_default="0")
     status = Column(SQLEnum(UserStatus), default=UserStatus.ACTIVE)
     firebase_uid = Column(String, unique=True, nullable=True, index=True)
 
@@ -113,15 +128,14 @@ class User(Base):
         "Certification", back_populates="user", cascade="all, delete-orphan"
     )
 
-    @property
-    def full_name(self):
-        return f"{self.first_name} {self.last_name}"
-
 
 class Instructor(Base):
     """Instructor profile model"""
 
     __tablename__ = "instructors"
+    # Fetch server-generated values (created_at, updated_at) via
+    # RETURNING during flush instead of a follow-up SELECT / db.refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
@@ -162,6 +176,10 @@ class Instructor(Base):
     rating = Column(Float, default=0.0)
     total_reviews = Column(Integer, default=0)
 
+    # Sum of completed + paid booking amounts. Maintained by a trigger on
+    # bookings (PostgreSQL) - never written by the app.
+    total_earnings = Column(Float, nullable=False, server_default="0")
+
     # Bio
     bio = Column(Text, nullable=True)
 
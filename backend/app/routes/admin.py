@@ -2,16 +2,19 @@
 Admin dashboard routes for system management
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, func, or_, select, tuple_, update
+from sqlalchemy.orm import Bundle, Session, aliased, load_only
 
 from ..database import get_db
-from ..middleware.admin import require_admin
+from ..middleware.admin import invalidate_admin_principal_cache, require_admin
 from ..models.availability import InstructorSchedule, TimeOffException
 from ..models.booking import Booking, BookingStatus
 from ..models.booking_credit import BookingCredit, CreditStatus
@@ -20,9 +23,16 @@ from ..models.company import Company
 from ..schemas.admin import (
     AdminCreateRequest,
     AdminCreateResponse,
+    AdminInstructorUpdate,
+    AdminRevenueSummary,
     AdminSettingsUpdate,
+    AdminStudentUpdate,
     AdminStats,
+    AdminStatsCounters,
     BookingOverview,
+    BulkBookingCancelRequest,
+    BulkInstructorVerificationRequest,
+    BulkUserStatusUpdate,
     InstructorVerificationRequest,
     InstructorVerificationResponse,
     RevenueStats,
@@ -33,12 +43,74 @@ from ..schemas.availability import (
     InstructorScheduleUpdate,
     TimeOffExceptionCreate,
 )
+from ..services import revenue_view
+from ..services.admin_config import invalidate_admin_config
+from ..services.schedule_cache import (
+    SCHEDULE_CACHE_NAMESPACE,
+    SCHEDULE_CACHE_TTL_SECONDS,
+    invalidate_instructor_schedule_cache,
+)
 from ..utils.auth import get_password_hash
 from ..utils.encryption import EncryptionService
+from ..utils.response_cache import response_cache
 
 router = APIRouter(prefix="/admin", tags=["Admin Dashboard"])
 logger = logging.getLogger(__name__)
 
+# Dashboard aggregates are global (identical for every admin), so they are
+# served from a short-TTL cache and invalidated by the admin writes below.
+# Headline counts move with every booking; the revenue breakdown is heavier
+# to compute and tolerates a little more staleness.
+STATS_CACHE_NAMESPACE = "admin_stats"
+STATS_CACHE_TTL_SECONDS = 30
+REVENUE_CACHE_TTL_SECONDS = 60
+# /admin/stats is served stale-while-revalidate: after STATS_CACHE_TTL_SECONDS
+# the cached payload is still returned (and refreshed in the background)
+# until it is STATS_STALE_TTL_SECONDS old, so a slow database never blocks
+# the dashboard while an older snapshot exists.
+STATS_STALE_TTL_SECONDS = 300
+
+
+def _invalidate_stats_cache() -> None:
+    """Drop cached /admin/stats and /admin/revenue/stats payloads."""
+    response_cache.clear(STATS_CACHE_NAMESPACE)
+
+
+# The pending-verification list only changes when instructors register or
+# an admin verifies/rejects/edits one, but the verification screen polls it.
+PENDING_INSTRUCTORS_CACHE_NAMESPACE = "pending_instructors"
+PENDING_INSTRUCTORS_CACHE_TTL_SECONDS = 30
+
+
+def invalidate_pending_instructors_cache() -> None:
+    """Drop every cached page of /admin/instructors/pending-verification."""
+    response_cache.clear(PENDING_INSTRUCTORS_CACHE_NAMESPACE)
+
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+# Opaque keyset cursor for the next page. Passing it back as ?cursor=...
+# replaces OFFSET, so deep pages cost the same as the first one.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _paginate_with_total(query, skip: int, limit: int):
+    """
+    Fetch one page plus the unpaginated match count in a single round-trip
+    using COUNT(*) OVER (). Returns (items, total).
+    """
+    rows = (
+        query.add_columns(func.count().over().label("total_count"))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if rows:
+        # Strip the trailing window count; single-entity queries yield the entity
+        items = [row[0] if len(row) == 2 else tuple(row[:-1]) for row in rows]
+        return items, rows[0].total_count
+    # Page past the end: no row to carry the window count
+    return [], (query.count() if skip else 0)
+
 
 # ==================== Admin Management ====================
 
@@ -59,8 +131,20 @@ async def create_admin(
     """
     from ..utils.auth import verify_password
     
-    # Check if email already exists
-    existing_user = db.query(User).filter(User.email == admin_data.email).first()
+    # Check if email already exists. Only the columns needed to check the
+    # password and promote the account are selected (a plain Row, no ORM
+    # object is built for it).
+    existing_user = (
+        db.query(
+            User.id,
+            User.role,
+            User.password_hash,
+            User.first_name,
+            User.last_name,
+        )
+        .filter(User.email == admin_data.email)
+        .first()
+    )
 
     if existing_user:
         # Check if user already has admin role
@@ -77,13 +161,16 @@ async def create_admin(
                 detail=f"Email is already registered with a different password. Please use the correct password to add admin role.",
             )
         
-        # Update existing user to admin role (active immediately, keep current status)
-        existing_user.role = UserRole.ADMIN
-        # Don't change status — keep whatever it was (ACTIVE stays ACTIVE)
-        if existing_user.status != UserStatus.ACTIVE:
-            existing_user.status = UserStatus.ACTIVE
+        # Update existing user to admin role, active immediately
+        db.execute(
+            update(User)
+            .where(User.id == existing_user.id)
+            .values(role=UserRole.ADMIN, status=UserStatus.ACTIVE)
+        )
         db.commit()
-        db.refresh(existing_user)
+        # Bulk UPDATE bypasses the ORM flush hook; login may have cached the old role
+        invalidate_admin_principal_cache()
+        _invalidate_stats_cache()
         
         # Trigger backup after successful role addition
         try:
@@ -131,7 +218,7 @@ async def create_admin(
 
     db.add(new_admin)
     db.commit()
-    db.refresh(new_admin)
+    _invalidate_stats_cache()
 
     # Trigger backup after successful admin creation
     try:
@@ -154,67 +241,220 @@ async def create_admin(
     }
 
 
+# The dashboard/revenue aggregates are textually identical on every call, so
+# they are built once here; SQLAlchemy's compiled cache then skips the
+# per-request SQL compilation (the handlers only bind an optional filter).
+_USER_COUNTS_STMT = select(
+    func.count().label("total"),
+    func.count().filter(User.status == UserStatus.ACTIVE).label("active"),
+    func.count().filter(User.role == UserRole.INSTRUCTOR).label("instructors"),
+    func.count().filter(User.role == UserRole.STUDENT).label("students"),
+).select_from(User)
+
+_INSTRUCTOR_COUNTS_STMT = select(
+    func.count().filter(Instructor.is_verified == True).label("verified"),
+    func.count().filter(Instructor.is_verified == False).label("pending"),
+).select_from(Instructor)
+
+# Counts only - no SUM over amount
+_BOOKING_STATUS_COUNTS_STMT = select(
+    func.count().label("total"),
+    func.count().filter(Booking.status == BookingStatus.PENDING).label("pending"),
+    func.count().filter(Booking.status == BookingStatus.COMPLETED).label("completed"),
+    func.count().filter(Booking.status == BookingStatus.CANCELLED).label("cancelled"),
+).select_from(Booking)
+
+# Booking stats + revenue (completed bookings only)
+_BOOKING_COUNTS_STMT = _BOOKING_STATUS_COUNTS_STMT.add_columns(
+    func.sum(Booking.amount).filter(Booking.status == BookingStatus.COMPLETED).label("revenue"),
+)
+
+_REVENUE_TOTALS_STMT = select(
+    func.sum(Booking.amount).filter(Booking.status == BookingStatus.COMPLETED).label("completed"),
+    func.sum(Booking.amount).filter(Booking.status == BookingStatus.PENDING).label("pending"),
+    func.count().filter(Booking.status == BookingStatus.COMPLETED).label("completed_count"),
+).select_from(Booking)
+
+
+def _user_counts(db: Session):
+    return db.execute(_USER_COUNTS_STMT).one()
+
+
+def _instructor_counts(db: Session):
+    return db.execute(_INSTRUCTOR_COUNTS_STMT).one()
+
+
+def _booking_counts(db: Session):
+    return db.execute(_BOOKING_COUNTS_STMT).one()
+
+
+def _booking_status_counts(db: Session):
+    return db.execute(_BOOKING_STATUS_COUNTS_STMT).one()
+
+
+def _in_own_session(aggregate):
+    """Run one aggregate query in a short-lived session (called off the event loop)."""
+    from ..database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return aggregate(db)
+    finally:
+        db.close()
+
+
+async def _compute_admin_stats() -> AdminStats:
+    """Run the dashboard aggregates (one query per table, concurrently)."""
+    # The three aggregates touch different tables and don't depend on each
+    # other, so a cold /admin/stats runs them concurrently, each on its own
+    # pooled connection in a worker thread (bounded to one per table).
+    user_counts, instructor_counts, booking_counts = await asyncio.gather(
+        run_in_threadpool(_in_own_session, _user_counts),
+        run_in_threadpool(_in_own_session, _instructor_counts),
+        run_in_threadpool(_in_own_session, _booking_counts),
+    )
+
+    completed_bookings = booking_counts.completed
+    total_revenue = float(booking_counts.revenue) if booking_counts.revenue else 0.0
+
+    # Calculate average booking value
+    avg_booking_value = (
+        total_revenue / completed_bookings if completed_bookings > 0 else 0.0
+    )
+
+    return AdminStats(
+        total_users=user_counts.total,
+        active_users=user_counts.active,
+        total_instructors=user_counts.instructors,
+        total_students=user_counts.students,
+        verified_instructors=instructor_counts.verified,
+        pending_verification=instructor_counts.pending,
+        total_bookings=booking_counts.total,
+        pending_bookings=booking_counts.pending,
+        completed_bookings=completed_bookings,
+        cancelled_bookings=booking_counts.cancelled,
+        total_revenue=total_revenue,
+        avg_booking_value=avg_booking_value,
+    )
+
+
+def _store_admin_stats(stats: AdminStats) -> None:
+    response_cache.set(
+        STATS_CACHE_NAMESPACE,
+        "stats",
+        {"generated_at": time.time(), "payload": stats.model_dump()},
+        STATS_STALE_TTL_SECONDS,
+    )
+
+
+async def _refresh_admin_stats() -> None:
+    """Recompute /admin/stats in the background after a stale hit."""
+    try:
+        _store_admin_stats(await _compute_admin_stats())
+    except Exception as e:
+        logger.warning("Background admin stats refresh failed: %s", e)
+
+
+# In-flight background refresh, so concurrent stale hits start only one
+_stats_refresh_task: Optional[asyncio.Task] = None
+
+
+def _schedule_admin_stats_refresh() -> None:
+    global _stats_refresh_task
+    if _stats_refresh_task is not None and not _stats_refresh_task.done():
+        return
+    _stats_refresh_task = asyncio.create_task(_refresh_admin_stats())
+
+
 @router.get("/stats", response_model=AdminStats)
 async def get_admin_stats(
     current_admin: Annotated[User, Depends(require_admin)],
-    db: Session = Depends(get_db),
 ):
     """
     Get overall system statistics
     """
-    # User counts
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.status == UserStatus.ACTIVE).count()
-    total_instructors = db.query(User).filter(User.role == UserRole.INSTRUCTOR).count()
-    total_students = db.query(User).filter(User.role == UserRole.STUDENT).count()
+    cached = response_cache.get(STATS_CACHE_NAMESPACE, "stats")
+    if cached is not None and "payload" in cached:
+        if time.time() - cached["generated_at"] >= STATS_CACHE_TTL_SECONDS:
+            _schedule_admin_stats_refresh()
+        return AdminStats(**cached["payload"])
 
-    # Instructor verification stats
-    verified_instructors = (
-        db.query(Instructor).filter(Instructor.is_verified == True).count()
-    )
-    pending_verification = (
-        db.query(Instructor).filter(Instructor.is_verified == False).count()
-    )
+    stats = await _compute_admin_stats()
+    _store_admin_stats(stats)
+    return stats
+
+
+@router.get("/stats/counters", response_model=AdminStatsCounters)
+async def get_admin_stats_counters(
+    current_admin: Annotated[User, Depends(require_admin)],
+):
+    """
+    Dashboard counters only (no revenue aggregates), for the initial
+    dashboard render. Revenue comes from /stats/revenue-summary.
+    """
+    cached = response_cache.get(STATS_CACHE_NAMESPACE, "counters")
+    if cached is not None:
+        return AdminStatsCounters(**cached)
 
-    # Booking stats
-    total_bookings = db.query(Booking).count()
-    pending_bookings = (
-        db.query(Booking).filter(Booking.status == BookingStatus.PENDING).count()
+    user_counts, instructor_counts, booking_counts = await asyncio.gather(
+        run_in_threadpool(_in_own_session, _user_counts),
+        run_in_threadpool(_in_own_session, _instructor_counts),
+        run_in_threadpool(_in_own_session, _booking_status_counts),
     )
-    completed_bookings = (
-        db.query(Booking).filter(Booking.status == BookingStatus.COMPLETED).count()
+    counters = AdminStatsCounters(
+        total_users=user_counts.total,
+        active_users=user_counts.active,
+        total_instructors=user_counts.instructors,
+        total_students=user_counts.students,
+        verified_instructors=instructor_counts.verified,
+        pending_verification=instructor_counts.pending,
+        total_bookings=booking_counts.total,
+        pending_bookings=booking_counts.pending,
+        completed_bookings=booking_counts.completed,
+        cancelled_bookings=booking_counts.cancelled,
     )
-    cancelled_bookings = (
-        db.query(Booking).filter(Booking.status == BookingStatus.CANCELLED).count()
+    response_cache.set(
+        STATS_CACHE_NAMESPACE, "counters", counters.model_dump(), STATS_CACHE_TTL_SECONDS
     )
+    return counters
 
-    # Revenue stats (completed bookings only)
-    revenue_result = (
-        db.query(func.sum(Booking.amount))
-        .filter(Booking.status == BookingStatus.COMPLETED)
-        .scalar()
-    )
-    total_revenue = float(revenue_result) if revenue_result else 0.0
 
-    # Calculate average booking value
-    avg_booking_value = (
-        total_revenue / completed_bookings if completed_bookings > 0 else 0.0
-    )
+@router.get("/stats/revenue-summary", response_model=AdminRevenueSummary)
+async def get_admin_revenue_summary(
+    current_admin: Annotated[User, Depends(require_admin)],
+    db: Session = Depends(get_db),
+):
+    """
+    Dashboard revenue figures, fetched separately from the counters so the
+    UI can load them lazily. Read from mv_revenue_stats when available.
+    """
+    cached = response_cache.get(STATS_CACHE_NAMESPACE, "revenue_summary")
+    if cached is not None:
+        return AdminRevenueSummary(**cached)
+
+    totals = revenue_view.fetch_revenue_totals(db)
+    if totals is None:
+        row = db.query(
+            func.sum(Booking.amount).label("revenue"),
+            func.count().label("completed"),
+        ).filter(Booking.status == BookingStatus.COMPLETED).one()
+        totals = {
+            "total_revenue": float(row.revenue) if row.revenue else 0.0,
+            "completed_bookings": row.completed,
+        }
 
-    return AdminStats(
-        total_users=total_users,
-        active_users=active_users,
-        total_instructors=total_instructors,
-        total_students=total_students,
-        verified_instructors=verified_instructors,
-        pending_verification=pending_verification,
-        total_bookings=total_bookings,
-        pending_bookings=pending_bookings,
+    completed_bookings = totals["completed_bookings"]
+    summary = AdminRevenueSummary(
+        total_revenue=totals["total_revenue"],
         completed_bookings=completed_bookings,
-        cancelled_bookings=cancelled_bookings,
-        total_revenue=total_revenue,
-        avg_booking_value=avg_booking_value,
+        avg_booking_value=(
+            totals["total_revenue"] / completed_bookings if completed_bookings > 0 else 0.0
+        ),
+    )
+    response_cache.set(
+        STATS_CACHE_NAMESPACE, "revenue_summary", summary.model_dump(), REVENUE_CACHE_TTL_SECONDS
     )
+    return summary
 
 
 # ==================== Instructor Verification ====================
@@ -231,17 +471,76 @@ def _notify_after_admin_decision(svc, db, instructor, approved: bool, reason: st
         pass
 
 
+# Columns read by _build_instructor_verification_response; list endpoints
+# load only these instead of the full instructor/user rows.
+_VERIFICATION_INSTRUCTOR_COLUMNS = (
+    Instructor.id,
+    Instructor.user_id,
+    Instructor.license_number,
+    Instructor.license_types,
+    Instructor.id_number,
+    Instructor.vehicle_registration,
+    Instructor.vehicle_make,
+    Instructor.vehicle_model,
+    Instructor.vehicle_year,
+    Instructor.is_verified,
+    Instructor.verification_status,
+    Instructor.company_id,
+    Instructor.is_company_owner,
+)
+_VERIFICATION_USER_COLUMNS = (
+    User.id,
+    User.email,
+    User.phone,
+    User.full_name,
+    User.created_at,
+)
+
+
+def _instructors_with_users(db: Session):
+    """
+    (Instructor, User) pairs fetched in one JOIN, limited to the columns the
+    verification response needs. Instructors without a user row are skipped.
+    """
+    return (
+        db.query(Instructor, User)
+        .join(User, User.id == Instructor.user_id)
+        .options(
+            load_only(*_VERIFICATION_INSTRUCTOR_COLUMNS),
+            load_only(*_VERIFICATION_USER_COLUMNS),
+        )
+    )
+
+
+def _company_names(db: Session, instructors) -> dict:
+    """Map company_id -> name for a page of instructors in one WHERE IN query."""
+    company_ids = {i.company_id for i in instructors if i.company_id}
+    if not company_ids:
+        return {}
+    return dict(
+        db.query(Company.id, Company.name).filter(Company.id.in_(company_ids)).all()
+    )
+
+
 def _build_instructor_verification_response(
     instructor: Instructor,
     user: User,
     db: Session,
+    company_names: Optional[dict] = None,
 ) -> InstructorVerificationResponse:
-    """Build a full InstructorVerificationResponse including company name."""
+    """
+    Build a full InstructorVerificationResponse including company name.
+    List endpoints pass ``company_names`` (from _company_names) so the name
+    isn't looked up once per instructor.
+    """
     company_name: Optional[str] = None
     if instructor.company_id:
-        company = db.query(Company).filter(Company.id == instructor.company_id).first()
-        if company:
-            company_name = company.name
+        if company_names is not None:
+            company_name = company_names.get(instructor.company_id)
+        else:
+            company = db.query(Company).filter(Company.id == instructor.company_id).first()
+            if company:
+                company_name = company.name
 
     return InstructorVerificationResponse(
         id=instructor.id,
@@ -270,6 +569,7 @@ def _build_instructor_verification_response(
     response_model=List[InstructorVerificationResponse],
 )
 async def get_all_instructors_admin(
+    response: Response,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
     verification_status: Optional[str] = Query(None),
@@ -280,19 +580,19 @@ async def get_all_instructors_admin(
     Get list of all instructors with optional verification_status filter.
     Replaces the old pending-only endpoint with a filterable view.
     """
-    query = db.query(Instructor)
+    query = _instructors_with_users(db)
     if verification_status:
         query = query.filter(
             Instructor.verification_status == verification_status
         )
 
-    instructors = query.offset(skip).limit(limit).all()
-    result = []
-    for instructor in instructors:
-        user = db.query(User).filter(User.id == instructor.user_id).first()
-        if user:
-            result.append(_build_instructor_verification_response(instructor, user, db))
-    return result
+    rows, total = _paginate_with_total(query, skip, limit)
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    company_names = _company_names(db, (instructor for instructor, _ in rows))
+    return [
+        _build_instructor_verification_response(instructor, user, db, company_names)
+        for instructor, user in rows
+    ]
 
 
 @router.get(
@@ -300,6 +600,7 @@ async def get_all_instructors_admin(
     response_model=List[InstructorVerificationResponse],
 )
 async def get_pending_instructors(
+    response: Response,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
@@ -308,19 +609,27 @@ async def get_pending_instructors(
     """
     Get list of instructors pending verification (legacy endpoint kept for backwards compat).
     """
-    instructors = (
-        db.query(Instructor)
-        .filter(Instructor.is_verified == False)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    cache_key = f"{skip}:{limit}"
+    cached = response_cache.get(PENDING_INSTRUCTORS_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(cached["total"])
+        return [InstructorVerificationResponse(**item) for item in cached["items"]]
 
-    result = []
-    for instructor in instructors:
-        user = db.query(User).filter(User.id == instructor.user_id).first()
-        if user:
-            result.append(_build_instructor_verification_response(instructor, user, db))
+    rows, total = _paginate_with_total(
+        _instructors_with_users(db).filter(Instructor.is_verified == False), skip, limit
+    )
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    company_names = _company_names(db, (instructor for instructor, _ in rows))
+    result = [
+        _build_instructor_verification_response(instructor, user, db, company_names)
+        for instructor, user in rows
+    ]
+    response_cache.set(
+        PENDING_INSTRUCTORS_CACHE_NAMESPACE,
+        cache_key,
+        {"items": [item.model_dump() for item in result], "total": total},
+        PENDING_INSTRUCTORS_CACHE_TTL_SECONDS,
+    )
     return result
 
 
@@ -340,13 +649,15 @@ async def verify_instructor(
     """
     from ..models.user import InstructorVerificationStatus as IVS
 
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
-    if not instructor:
+    row = (
+        db.query(Instructor, User)
+        .join(User, User.id == Instructor.user_id)
+        .filter(Instructor.id == instructor_id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Instructor not found")
-
-    user = db.query(User).filter(User.id == instructor.user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    instructor, user = row
 
     if verification_data.is_verified:
         instructor.is_verified = True
@@ -368,16 +679,86 @@ async def verify_instructor(
         if verification_data.deactivate_account:
             user.status = UserStatus.SUSPENDED
 
+    # Build the response from the in-session objects before committing so the
+    # just-written rows don't have to be re-SELECTed after commit expires them.
+    approved = (
+        verification_data.is_verified
+        and instructor.verification_status == IVS.VERIFIED.value
+    )
+    response = _build_instructor_verification_response(instructor, user, db)
+
     db.commit()
-    db.refresh(instructor)
-    db.refresh(user)
+    _invalidate_stats_cache()
+    invalidate_pending_instructors_cache()
     # Notify instructor of admin decision
     from ..services.instructor_verification_service import InstructorVerificationService as IVSvc
-    _notify_after_admin_decision(
-        IVSvc, db, instructor,
-        approved=verification_data.is_verified and instructor.verification_status == IVS.VERIFIED.value,
-    )
-    return _build_instructor_verification_response(instructor, user, db)
+    _notify_after_admin_decision(IVSvc, db, instructor, approved=approved)
+    return response
+
+
+@router.post("/instructors/bulk-verify")
+async def bulk_verify_instructors(
+    payload: BulkInstructorVerificationRequest,
+    current_admin: Annotated[User, Depends(require_admin)],
+    db: Session = Depends(get_db),
+):
+    """
+    Approve or reject several instructors in one action.
+
+    Applies the same rules as /instructors/{id}/verify with set-based UPDATEs
+    instead of one request per instructor. Decision emails are not sent for
+    bulk actions.
+    """
+    from ..models.user import InstructorVerificationStatus as IVS
+
+    ids = set(payload.ids)
+    # Independent instructors and company owners need no company approval
+    independent = or_(Instructor.company_id.is_(None), Instructor.is_company_owner == True)
+
+    if payload.is_verified:
+        result = db.execute(
+            update(Instructor)
+            .where(Instructor.id.in_(ids))
+            .values(
+                is_verified=True,
+                verified_by_admin_id=current_admin.id,
+                verification_status=case(
+                    (independent, IVS.VERIFIED.value),
+                    else_=IVS.PENDING_COMPANY.value,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        user_filter = select(Instructor.user_id).where(Instructor.id.in_(ids), independent)
+        new_user_status = UserStatus.ACTIVE
+    else:
+        result = db.execute(
+            update(Instructor)
+            .where(Instructor.id.in_(ids))
+            .values(is_verified=False, verification_status=IVS.REJECTED.value)
+            .execution_options(synchronize_session=False)
+        )
+        user_filter = select(Instructor.user_id).where(Instructor.id.in_(ids))
+        new_user_status = UserStatus.SUSPENDED if payload.deactivate_account else None
+
+    if new_user_status is not None:
+        db.execute(
+            update(User)
+            .where(User.id.in_(user_filter))
+            .values(status=new_user_status)
+            .execution_options(synchronize_session=False)
+        )
+
+    db.commit()
+    if new_user_status is not None:
+        invalidate_admin_principal_cache()
+    _invalidate_stats_cache()
+    invalidate_pending_instructors_cache()
+
+    return {
+        "message": f"{result.rowcount} instructor(s) {'approved' if payload.is_verified else 'rejected'}",
+        "updated": result.rowcount,
+    }
 
 
 @router.post("/instructors/{instructor_id}/reject")
@@ -392,11 +773,11 @@ async def reject_instructor(
     """
     from ..models.user import InstructorVerificationStatus as IVS
 
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Instructor not found")
 
-    user = db.query(User).filter(User.id == instructor.user_id).first()
+    user = db.get(User, instructor.user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -404,6 +785,8 @@ async def reject_instructor(
     instructor.verification_status = IVS.REJECTED.value
     user.status = UserStatus.SUSPENDED
     db.commit()
+    _invalidate_stats_cache()
+    invalidate_pending_instructors_cache()
 
     from ..services.instructor_verification_service import InstructorVerificationService as IVSvc
     _notify_after_admin_decision(IVSvc, db, instructor, approved=False, reason=reason or "")
@@ -424,11 +807,11 @@ async def resend_instructor_verification(
     from datetime import timedelta
     from ..models.user import InstructorVerificationStatus as IVS
 
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Instructor not found")
 
-    user = db.query(User).filter(User.id == instructor.user_id).first()
+    user = db.get(User, instructor.user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -438,6 +821,8 @@ async def resend_instructor_verification(
     instructor.verification_status = IVS.PENDING_ADMIN.value
     instructor.is_verified = False
     db.commit()
+    _invalidate_stats_cache()
+    invalidate_pending_instructors_cache()
 
     # Re-send notification to all admins
     try:
@@ -457,15 +842,20 @@ async def resend_instructor_verification(
 
 @router.get("/users", response_model=List[UserManagementResponse])
 async def get_all_users(
+    response: Response,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
     role: Optional[UserRole] = Query(None),
     status: Optional[UserStatus] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[int] = Query(None, ge=0),
 ):
     """
     Get list of all users with filtering options
+
+    Paginate with ``skip`` (page total in X-Total-Count) or with ``cursor``
+    taken from the previous page's X-Next-Cursor header.
     
     Multi-role system: Users can have multiple profiles (Student, Instructor, Admin)
     When filtering by role, we check for the existence of the corresponding profile:
@@ -473,7 +863,26 @@ async def get_all_users(
     - INSTRUCTOR: users with instructor profiles  
     - ADMIN: users with role=ADMIN (admin is role-based, not profile-based)
     """
-    query = db.query(User)
+    # Only the columns UserManagementResponse needs (skips password_hash,
+    # SMTP/Twilio secrets, consent fields, ...), returned as plain rows
+    # bundled under one name rather than as User ORM instances
+    query = db.query(
+        Bundle(
+            "user",
+            User.id,
+            User.email,
+            User.phone,
+            User.first_name,
+            User.last_name,
+            User.full_name,
+            User.role,
+            User.status,
+            User.id_number,
+            User.address,
+            User.created_at,
+            User.last_login,
+        )
+    )
 
     # Filter by role - check for actual profiles in multi-role system
     if role == UserRole.STUDENT:
@@ -489,7 +898,14 @@ async def get_all_users(
     if status:
         query = query.filter(User.status == status)
 
-    users = query.offset(skip).limit(limit).all()
+    query = query.order_by(User.id)
+    if cursor is not None:
+        users = [row[0] for row in query.filter(User.id > cursor).limit(limit).all()]
+    else:
+        users, total = _paginate_with_total(query, skip, limit)
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if len(users) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(users[-1].id)
 
     result = []
 
@@ -614,7 +1030,7 @@ async def update_user_status(
     Admins can suspend their own Student/Instructor profiles.
     Only the main admin cannot suspend their own Admin profile.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -648,7 +1064,8 @@ async def update_user_status(
     old_status = user.status
     user.status = new_status
     db.commit()
-    db.refresh(user)
+    _invalidate_stats_cache()
+    invalidate_admin_principal_cache()
 
     return {
         "message": f"User status updated from {old_status.value} to {new_status.value}",
@@ -657,6 +1074,39 @@ async def update_user_status(
     }
 
 
+@router.put("/users/bulk-status")
+async def bulk_update_user_status(
+    payload: BulkUserStatusUpdate,
+    current_admin: Annotated[User, Depends(require_admin)],
+    db: Session = Depends(get_db),
+):
+    """
+    Activate, deactivate, or suspend several user accounts in one action.
+    The current admin's own account is always skipped, and admin accounts
+    are only changed when the original admin makes the request.
+    """
+    first_admin_id = (
+        db.query(func.min(User.id)).filter(User.role == UserRole.ADMIN).scalar()
+    )
+
+    stmt = update(User).where(User.id.in_(set(payload.ids)), User.id != current_admin.id)
+    if current_admin.id != first_admin_id:
+        stmt = stmt.where(User.role != UserRole.ADMIN)
+
+    result = db.execute(
+        stmt.values(status=payload.new_status).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    _invalidate_stats_cache()
+    invalidate_admin_principal_cache()
+
+    return {
+        "message": f"{result.rowcount} user(s) set to {payload.new_status.value}",
+        "updated": result.rowcount,
+        "new_status": payload.new_status.value,
+    }
+
+
 @router.delete("/admins/{admin_id}")
 async def delete_admin(
     admin_id: int,
@@ -692,7 +1142,7 @@ async def delete_admin(
             detail="Cannot delete the original admin account",
         )
 
-    admin_user = db.query(User).filter(User.id == admin_id).first()
+    admin_user = db.get(User, admin_id)
     if not admin_user or admin_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -701,6 +1151,8 @@ async def delete_admin(
 
     db.delete(admin_user)
     db.commit()
+    _invalidate_stats_cache()
+    invalidate_admin_principal_cache()
 
     return {
         "message": "Admin deleted successfully",
@@ -722,7 +1174,7 @@ async def delete_instructor(
     - User can re-register as instructor
     - Does NOT delete bookings (keeps history)
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -768,6 +1220,9 @@ async def delete_instructor(
         db.delete(user)
     
     db.commit()
+    _invalidate_stats_cache()
+    invalidate_pending_instructors_cache()
+    invalidate_instructor_schedule_cache(instructor.id)
 
     return {
         "message": "Instructor profile deleted successfully",
@@ -827,7 +1282,7 @@ async def delete_student(
     - User can re-register as student
     - Does NOT delete bookings (keeps history)
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -873,6 +1328,7 @@ async def delete_student(
         db.delete(user)
     
     db.commit()
+    _invalidate_stats_cache()
 
     return {
         "message": "Student profile deleted successfully",
@@ -940,7 +1396,7 @@ async def delete_user(
             detail="Cannot delete your own account",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -980,6 +1436,11 @@ async def delete_user(
     user_email = user.email
     db.delete(user)
     db.commit()
+    _invalidate_stats_cache()
+    invalidate_pending_instructors_cache()
+    invalidate_admin_principal_cache()
+    if instructor:
+        invalidate_instructor_schedule_cache(instructor.id)
 
     return {
         "message": "User account and all related data deleted successfully",
@@ -999,7 +1460,7 @@ async def update_instructor_booking_fee(
     """
     Update the booking fee for a specific instructor
     """
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1009,7 +1470,6 @@ async def update_instructor_booking_fee(
     old_fee = instructor.booking_fee
     instructor.booking_fee = booking_fee
     db.commit()
-    db.refresh(instructor)
 
     return {
         "message": f"Booking fee updated from R{old_fee:.2f} to R{booking_fee:.2f}",
@@ -1024,22 +1484,59 @@ async def update_instructor_booking_fee(
 
 @router.get("/bookings", response_model=List[BookingOverview])
 async def get_all_bookings(
+    response: Response,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
     status_filter: Optional[BookingStatus] = Query(None),
     instructor_id: Optional[int] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     """
     Get overview of all bookings with optional status filter and instructor filter
-    """
-    # Auto-update past pending bookings to completed
-    from ..routes.bookings import auto_update_past_bookings
-
-    auto_update_past_bookings(db)
 
-    query = db.query(Booking)
+    Paginate with ``skip`` (page total in X-Total-Count) or with ``cursor``
+    taken from the previous page's X-Next-Cursor header.
+    """
+    # Past PENDING bookings are marked COMPLETED by booking_status_scheduler,
+    # so this read endpoint never takes write locks.
+    # Student/instructor names and ID numbers come from the same SELECT via
+    # outer joins (a missing profile still yields the booking as "Unknown").
+    StudentUser = aliased(User)
+    InstructorUser = aliased(User)
+    query = (
+        db.query(
+            Booking,
+            Student.id_number,
+            StudentUser,
+            Instructor.id_number,
+            InstructorUser,
+        )
+        .outerjoin(Student, Student.id == Booking.student_id)
+        .outerjoin(StudentUser, StudentUser.id == Student.user_id)
+        .outerjoin(Instructor, Instructor.id == Booking.instructor_id)
+        .outerjoin(InstructorUser, InstructorUser.id == Instructor.user_id)
+    )
+    query = query.options(
+        load_only(StudentUser.full_name, StudentUser.phone),
+        load_only(InstructorUser.full_name),
+        load_only(
+            Booking.id,
+            Booking.booking_reference,
+            Booking.student_id,
+            Booking.instructor_id,
+            Booking.lesson_date,
+            Booking.duration_minutes,
+            Booking.lesson_type,
+            Booking.pickup_address,
+            Booking.dropoff_address,
+            Booking.status,
+            Booking.amount,
+            Booking.booking_fee,
+            Booking.created_at,
+        )
+    )
 
     if status_filter:
         query = query.filter(Booking.status == status_filter)
@@ -1047,46 +1544,43 @@ async def get_all_bookings(
     if instructor_id:
         query = query.filter(Booking.instructor_id == instructor_id)
 
-    bookings = (
-        query.order_by(Booking.lesson_date.desc()).offset(skip).limit(limit).all()
-    )
-
-    if len(bookings) > 0:
-        status_counts = {}
-        for b in bookings:
-            status_counts[b.status.value] = status_counts.get(b.status.value, 0) + 1
-
-    result = []
-    for booking in bookings:
-        student = db.query(Student).filter(Student.id == booking.student_id).first()
-        instructor = (
-            db.query(Instructor).filter(Instructor.id == booking.instructor_id).first()
-        )
-
-        student_user = (
-            db.query(User).filter(User.id == student.user_id).first()
-            if student
-            else None
-        )
-        instructor_user = (
-            db.query(User).filter(User.id == instructor.user_id).first()
-            if instructor
-            else None
+    # id breaks ties between bookings at the same lesson_date so the
+    # keyset cursor is unambiguous
+    query = query.order_by(Booking.lesson_date.desc(), Booking.id.desc())
+    if cursor:
+        try:
+            cursor_date, cursor_id = cursor.rsplit("_", 1)
+            after = (datetime.fromisoformat(cursor_date), int(cursor_id))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        rows = query.filter(tuple_(Booking.lesson_date, Booking.id) < after).limit(limit).all()
+    else:
+        rows, total = _paginate_with_total(query, skip, limit)
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if len(rows) == limit:
+        last_booking = rows[-1][0]
+        response.headers[NEXT_CURSOR_HEADER] = (
+            f"{last_booking.lesson_date.isoformat()}_{last_booking.id}"
         )
 
+    result = []
+    for booking, student_id_number, student_user, instructor_id_number, instructor_user in rows:
         result.append(
             BookingOverview(
                 id=booking.id,
                 booking_reference=booking.booking_reference,
                 student_id=booking.student_id,
                 student_name=student_user.full_name if student_user else "Unknown",
-                student_id_number=student.id_number if student else "Unknown",
+                student_id_number=student_id_number or "Unknown",
                 student_phone=student_user.phone if student_user else None,
                 instructor_id=booking.instructor_id,
                 instructor_name=(
                     instructor_user.full_name if instructor_user else "Unknown"
                 ),
-                instructor_id_number=instructor.id_number if instructor else "Unknown",
+                instructor_id_number=instructor_id_number or "Unknown",
                 lesson_date=booking.lesson_date,
                 duration_minutes=booking.duration_minutes,
                 lesson_type=booking.lesson_type,
@@ -1110,7 +1604,7 @@ async def cancel_booking_admin(
     """
     Admin: Cancel a booking (conflict resolution)
     """
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = db.get(Booking, booking_id)
     if not booking:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1124,6 +1618,7 @@ async def cancel_booking_admin(
     booking.cancelled_at = datetime.now(timezone.utc)
 
     db.commit()
+    _invalidate_stats_cache()
 
     return {
         "message": "Booking cancelled successfully by admin",
@@ -1132,11 +1627,43 @@ async def cancel_booking_admin(
     }
 
 
+@router.post("/bookings/bulk-cancel")
+async def bulk_cancel_bookings_admin(
+    payload: BulkBookingCancelRequest,
+    current_admin: Annotated[User, Depends(require_admin)],
+    db: Session = Depends(get_db),
+):
+    """
+    Admin: Cancel several bookings in one UPDATE (e.g. after suspending an
+    instructor). Bookings that are already cancelled are left untouched.
+    """
+    result = db.execute(
+        update(Booking)
+        .where(
+            Booking.id.in_(set(payload.ids)),
+            Booking.status != BookingStatus.CANCELLED,
+        )
+        .values(
+            status=BookingStatus.CANCELLED,
+            cancellation_reason="Cancelled by admin",
+            cancelled_at=datetime.now(timezone.utc),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    _invalidate_stats_cache()
+
+    return {
+        "message": f"{result.rowcount} booking(s) cancelled by admin",
+        "cancelled": result.rowcount,
+    }
+
+
 # ==================== Revenue & Analytics ====================
 
 
 @router.get("/revenue/stats", response_model=RevenueStats)
-async def get_revenue_stats(
+def get_revenue_stats(
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
     instructor_id: Optional[int] = Query(None),
@@ -1144,83 +1671,82 @@ async def get_revenue_stats(
     """
     Get detailed revenue statistics, optionally filtered by instructor
     """
-    # Build base query with optional instructor filter
-    completed_query = db.query(Booking).filter(
-        Booking.status == BookingStatus.COMPLETED
-    )
-    pending_query = db.query(Booking).filter(Booking.status == BookingStatus.PENDING)
-
-    if instructor_id:
-        completed_query = completed_query.filter(Booking.instructor_id == instructor_id)
-        pending_query = pending_query.filter(Booking.instructor_id == instructor_id)
-
-    # Total revenue from completed bookings
-    total_revenue_result = (
-        db.query(func.sum(Booking.amount))
-        .filter(Booking.status == BookingStatus.COMPLETED)
-        .filter(Booking.instructor_id == instructor_id if instructor_id else True)
-        .scalar()
-    )
-    total_revenue = float(total_revenue_result) if total_revenue_result else 0.0
-
-    # Pending revenue (bookings not yet completed)
-    pending_revenue_result = (
-        db.query(func.sum(Booking.amount))
-        .filter(Booking.status == BookingStatus.PENDING)
-        .filter(Booking.instructor_id == instructor_id if instructor_id else True)
-        .scalar()
-    )
-    pending_revenue = float(pending_revenue_result) if pending_revenue_result else 0.0
+    cache_key = f"revenue:{instructor_id or 'all'}"
+    cached = response_cache.get(STATS_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return RevenueStats(**cached)
+
+    # Headline totals: from mv_revenue_stats on PostgreSQL, otherwise one
+    # filtered aggregate over bookings.
+    totals = revenue_view.fetch_revenue_totals(db, instructor_id)
+    if totals is None:
+        totals_stmt = _REVENUE_TOTALS_STMT
+        if instructor_id:
+            totals_stmt = totals_stmt.where(Booking.instructor_id == instructor_id)
+        row = db.execute(totals_stmt).one()
+        totals = {
+            "total_revenue": float(row.completed) if row.completed else 0.0,
+            "pending_revenue": float(row.pending) if row.pending else 0.0,
+            "completed_bookings": row.completed_count,
+        }
 
-    # Count of completed bookings
-    completed_count = completed_query.count()
+    total_revenue = totals["total_revenue"]
+    pending_revenue = totals["pending_revenue"]
+    completed_count = totals["completed_bookings"]
 
     # Average booking value
     avg_booking_value = total_revenue / completed_count if completed_count > 0 else 0.0
 
     # Top earning instructors (top 10 or just the selected one)
-    top_instructors_base = (
-        db.query(
-            Instructor.id,
-            User.first_name,
-            User.last_name,
-            func.sum(Booking.amount).label("total_earnings"),
-            func.count(Booking.id).label("booking_count"),
+    # Served from the mv_instructor_revenue materialized view on PostgreSQL;
+    # falls back to the live aggregate when the view is unavailable.
+    top_instructors = revenue_view.fetch_top_instructors(db, instructor_id)
+    if top_instructors is None:
+        top_instructors_base = (
+            db.query(
+                Instructor.id,
+                User.full_name,
+                func.sum(Booking.amount).label("total_earnings"),
+                func.count(Booking.id).label("booking_count"),
+            )
+            .join(Booking, Booking.instructor_id == Instructor.id)
+            .join(User, User.id == Instructor.user_id)
+            .filter(Booking.status == BookingStatus.COMPLETED)
         )
-        .join(Booking, Booking.instructor_id == Instructor.id)
-        .join(User, User.id == Instructor.user_id)
-        .filter(Booking.status == BookingStatus.COMPLETED)
-    )
 
-    if instructor_id:
-        top_instructors_base = top_instructors_base.filter(
-            Instructor.id == instructor_id
-        )
+        if instructor_id:
+            top_instructors_base = top_instructors_base.filter(
+                Instructor.id == instructor_id
+            )
 
-    top_instructors_query = (
-        top_instructors_base.group_by(Instructor.id, User.first_name, User.last_name)
-        .order_by(func.sum(Booking.amount).desc())
-        .limit(10)
-        .all()
-    )
+        top_instructors_query = (
+            top_instructors_base.group_by(Instructor.id, User.full_name)
+            .order_by(func.sum(Booking.amount).desc())
+            .limit(10)
+            .all()
+        )
 
-    top_instructors = [
-        {
-            "instructor_id": row.id,
-            "name": f"{row.first_name} {row.last_name}",
-            "total_earnings": float(row.total_earnings),
-            "booking_count": row.booking_count,
-        }
-        for row in top_instructors_query
-    ]
+        top_instructors = [
+            {
+                "instructor_id": row.id,
+                "name": row.full_name,
+                "total_earnings": float(row.total_earnings),
+                "booking_count": row.booking_count,
+            }
+            for row in top_instructors_query
+        ]
 
-    return RevenueStats(
+    revenue_stats = RevenueStats(
         total_revenue=total_revenue,
         pending_revenue=pending_revenue,
         completed_bookings=completed_count,
         avg_booking_value=avg_booking_value,
         top_instructors=top_instructors,
     )
+    response_cache.set(
+        STATS_CACHE_NAMESPACE, cache_key, revenue_stats.model_dump(), REVENUE_CACHE_TTL_SECONDS
+    )
+    return revenue_stats
 
 
 # ==================== Advanced Analytics ====================
@@ -1241,12 +1767,13 @@ async def get_analytics_timeseries(
     end_date = date.today()
     start_date = end_date - timedelta(days=days - 1)
 
-    # Pull all bookings in window in one query, bucket in Python.
+    # Stream just the three columns needed for bucketing instead of
+    # materialising every booking in the window as a full ORM object.
     bookings = (
-        db.query(Booking)
+        db.query(Booking.lesson_date, Booking.status, Booking.amount)
         .filter(func.date(Booking.lesson_date) >= start_date)
         .filter(func.date(Booking.lesson_date) <= end_date)
-        .all()
+        .yield_per(1000)
     )
 
     buckets: dict = {}
@@ -1364,32 +1891,41 @@ async def get_instructor_revenue(
     """
     Get revenue details for a specific instructor
     """
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    # Only the columns the response uses, instructor + user in one SELECT
+    instructor = (
+        db.query(
+            Instructor.hourly_rate,
+            Instructor.rating,
+            User.full_name,
+        )
+        .outerjoin(User, User.id == Instructor.user_id)
+        .filter(Instructor.id == instructor_id)
+        .first()
+    )
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Instructor not found",
         )
 
-    user = db.query(User).filter(User.id == instructor.user_id).first()
-
-    # Get completed bookings
-    completed_bookings = (
-        db.query(Booking)
+    # Aggregate completed bookings in SQL rather than loading every row
+    total_earnings, booking_count = (
+        db.query(
+            func.coalesce(func.sum(Booking.amount), 0.0),
+            func.count(Booking.id),
+        )
         .filter(
             Booking.instructor_id == instructor_id,
             Booking.status == BookingStatus.COMPLETED,
         )
-        .all()
+        .one()
     )
-
-    total_earnings = sum(float(booking.amount) for booking in completed_bookings)
-    booking_count = len(completed_bookings)
+    total_earnings = float(total_earnings)
     avg_per_booking = total_earnings / booking_count if booking_count > 0 else 0.0
 
     return {
         "instructor_id": instructor_id,
-        "instructor_name": user.full_name if user else "Unknown",
+        "instructor_name": instructor.full_name or "Unknown",
         "total_earnings": total_earnings,
         "completed_bookings": booking_count,
         "avg_per_booking": avg_per_booking,
@@ -1412,7 +1948,7 @@ async def get_user_details(
     
     Restriction: Only the original admin can view/edit the original admin's profile
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1498,7 +2034,7 @@ async def update_user_details(
     """
     Update user basic details (name, phone, email, id_number, address)
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1507,11 +2043,10 @@ async def update_user_details(
 
     # Check email uniqueness if being changed
     if email is not None and email != user.email:
-        existing = db.query(User).filter(
-            User.email == email,
-            User.id != user_id
-        ).first()
-        if existing:
+        taken = db.query(
+            db.query(User.id).filter(User.email == email, User.id != user_id).exists()
+        ).scalar()
+        if taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="This email is already in use by another user",
@@ -1520,11 +2055,10 @@ async def update_user_details(
 
     # Check id_number uniqueness if being changed
     if id_number is not None and id_number != user.id_number:
-        existing = db.query(User).filter(
-            User.id_number == id_number,
-            User.id != user_id
-        ).first()
-        if existing:
+        taken = db.query(
+            db.query(User.id).filter(User.id_number == id_number, User.id != user_id).exists()
+        ).scalar()
+        if taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="This ID number is already in use by another user",
@@ -1542,7 +2076,7 @@ async def update_user_details(
         user.address = address
 
     db.commit()
-    db.refresh(user)
+    invalidate_pending_instructors_cache()
 
     return {
         "message": "User details updated successfully",
@@ -1568,7 +2102,7 @@ async def admin_reset_password(
     """
     Reset a user's password (admin only)
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1585,6 +2119,7 @@ async def admin_reset_password(
     # Update password
     user.password_hash = get_password_hash(new_password)
     db.commit()
+    invalidate_admin_principal_cache()
 
     return {
         "message": f"Password reset successfully for {user.full_name}",
@@ -1596,7 +2131,7 @@ async def admin_reset_password(
 
 
 @router.get("/instructors/{instructor_id}/schedule")
-async def get_instructor_schedule(
+def get_instructor_schedule(
     instructor_id: int,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
@@ -1604,7 +2139,12 @@ async def get_instructor_schedule(
     """
     Get instructor's weekly schedule (admin view)
     """
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    cache_key = f"{instructor_id}:schedule"
+    cached = response_cache.get(SCHEDULE_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return cached
+
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1612,7 +2152,13 @@ async def get_instructor_schedule(
         )
 
     schedules = (
-        db.query(InstructorSchedule)
+        db.query(
+            InstructorSchedule.id,
+            InstructorSchedule.day_of_week,
+            InstructorSchedule.start_time,
+            InstructorSchedule.end_time,
+            InstructorSchedule.is_active,
+        )
         .filter(InstructorSchedule.instructor_id == instructor_id)
         .all()
     )
@@ -1628,11 +2174,12 @@ async def get_instructor_schedule(
         for sched in schedules
     ]
 
+    response_cache.set(SCHEDULE_CACHE_NAMESPACE, cache_key, result, SCHEDULE_CACHE_TTL_SECONDS)
     return result
 
 
 @router.get("/instructors/{instructor_id}/time-off")
-async def get_instructor_time_off(
+def get_instructor_time_off(
     instructor_id: int,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
@@ -1640,7 +2187,12 @@ async def get_instructor_time_off(
     """
     Get instructor's time off dates - ALL dates including past ones (admin view)
     """
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    cache_key = f"{instructor_id}:time_off"
+    cached = response_cache.get(SCHEDULE_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return cached
+
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1649,12 +2201,20 @@ async def get_instructor_time_off(
 
     # Get ALL time off dates (no filtering by date)
     time_offs = (
-        db.query(TimeOffException)
+        db.query(
+            TimeOffException.id,
+            TimeOffException.start_date,
+            TimeOffException.end_date,
+            TimeOffException.start_time,
+            TimeOffException.end_time,
+            TimeOffException.reason,
+            TimeOffException.notes,
+        )
         .filter(TimeOffException.instructor_id == instructor_id)
         .all()
     )
 
-    return [
+    result = [
         {
             "id": time_off.id,
             "start_date": time_off.start_date.strftime("%Y-%m-%d"),
@@ -1671,6 +2231,9 @@ async def get_instructor_time_off(
         for time_off in time_offs
     ]
 
+    response_cache.set(SCHEDULE_CACHE_NAMESPACE, cache_key, result, SCHEDULE_CACHE_TTL_SECONDS)
+    return result
+
 
 # ==================== Admin Manage Instructor Schedule & Time Off ====================
 
@@ -1686,7 +2249,7 @@ async def admin_create_instructor_schedule(
     Admin creates a schedule entry for an instructor
     """
     # Verify instructor exists
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1720,7 +2283,7 @@ async def admin_create_instructor_schedule(
     
     db.add(new_schedule)
     db.commit()
-    db.refresh(new_schedule)
+    invalidate_instructor_schedule_cache(instructor_id)
     
     return {
         "id": new_schedule.id,
@@ -1768,7 +2331,7 @@ async def admin_update_instructor_schedule(
         schedule.is_active = schedule_data.is_active
     
     db.commit()
-    db.refresh(schedule)
+    invalidate_instructor_schedule_cache(instructor_id)
     
     return {
         "id": schedule.id,
@@ -1808,6 +2371,7 @@ async def admin_delete_instructor_schedule(
     
     db.delete(schedule)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
     
     return {"message": "Schedule entry deleted successfully"}
 
@@ -1823,7 +2387,7 @@ async def admin_create_instructor_time_off(
     Admin creates a time-off entry for an instructor
     """
     # Verify instructor exists
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1843,7 +2407,7 @@ async def admin_create_instructor_time_off(
     
     db.add(new_time_off)
     db.commit()
-    db.refresh(new_time_off)
+    invalidate_instructor_schedule_cache(instructor_id)
     
     return {
         "id": new_time_off.id,
@@ -1889,6 +2453,7 @@ async def admin_delete_instructor_time_off(
     
     db.delete(time_off)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
     
     return {"message": "Time off entry deleted successfully"}
 
@@ -1896,75 +2461,52 @@ async def admin_delete_instructor_time_off(
 # ==================== Admin Update Instructor Profile ====================
 
 
+def _reject_cleared_required_fields(model, changes: dict) -> None:
+    """400 when an explicit null targets a NOT NULL column (instead of an IntegrityError)"""
+    required = [
+        field for field, value in changes.items()
+        if value is None and not model.__table__.c[field].nullable
+    ]
+    if required:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot clear required field(s): {', '.join(required)}",
+        )
+
+
 @router.put("/instructors/{instructor_id}")
 async def admin_update_instructor(
     instructor_id: int,
+    payload: AdminInstructorUpdate,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
-    license_number: Optional[str] = Query(None),
-    license_types: Optional[str] = Query(None),
-    vehicle_registration: Optional[str] = Query(None),
-    vehicle_make: Optional[str] = Query(None),
-    vehicle_model: Optional[str] = Query(None),
-    vehicle_year: Optional[int] = Query(None),
-    province: Optional[str] = Query(None),
-    city: Optional[str] = Query(None),
-    suburb: Optional[str] = Query(None),
-    hourly_rate: Optional[float] = Query(None),
-    service_radius_km: Optional[float] = Query(None),
-    max_travel_distance_km: Optional[float] = Query(None),
-    rate_per_km_beyond_radius: Optional[float] = Query(None),
-    bio: Optional[str] = Query(None),
-    is_available: Optional[bool] = Query(None),
 ):
     """
     Admin update instructor profile details
     """
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
-    if not instructor:
+    # Only supplied fields change; an explicit null clears a nullable field
+    changes = payload.model_dump(exclude_unset=True)
+    _reject_cleared_required_fields(Instructor, changes)
+    if changes:
+        result = db.execute(
+            update(Instructor).where(Instructor.id == instructor_id).values(**changes)
+        )
+        found = result.rowcount > 0
+    else:
+        found = db.query(Instructor.id).filter(Instructor.id == instructor_id).first() is not None
+
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Instructor not found",
         )
 
-    # Update fields if provided
-    if license_number is not None:
-        instructor.license_number = license_number
-    if license_types is not None:
-        instructor.license_types = license_types
-    if vehicle_registration is not None:
-        instructor.vehicle_registration = vehicle_registration
-    if vehicle_make is not None:
-        instructor.vehicle_make = vehicle_make
-    if vehicle_model is not None:
-        instructor.vehicle_model = vehicle_model
-    if vehicle_year is not None:
-        instructor.vehicle_year = vehicle_year
-    if province is not None:
-        instructor.province = province
-    if city is not None:
-        instructor.city = city
-    if suburb is not None:
-        instructor.suburb = suburb
-    if hourly_rate is not None:
-        instructor.hourly_rate = hourly_rate
-    if service_radius_km is not None:
-        instructor.service_radius_km = service_radius_km
-    if max_travel_distance_km is not None:
-        instructor.max_travel_distance_km = max_travel_distance_km
-    if rate_per_km_beyond_radius is not None:
-        instructor.rate_per_km_beyond_radius = rate_per_km_beyond_radius
-    if bio is not None:
-        instructor.bio = bio
-    if is_available is not None:
-        instructor.is_available = is_available
-
     db.commit()
-    db.refresh(instructor)
+    invalidate_pending_instructors_cache()
 
     return {
         "message": "Instructor profile updated successfully",
-        "instructor_id": instructor.id,
+        "instructor_id": instructor_id,
     }
 
 
@@ -1974,57 +2516,35 @@ async def admin_update_instructor(
 @router.put("/students/{student_id}")
 async def admin_update_student(
     student_id: int,
+    payload: AdminStudentUpdate,
     current_admin: Annotated[User, Depends(require_admin)],
     db: Session = Depends(get_db),
-    address_line1: Optional[str] = Query(None),
-    address_line2: Optional[str] = Query(None),
-    city: Optional[str] = Query(None),
-    province: Optional[str] = Query(None),
-    suburb: Optional[str] = Query(None),
-    postal_code: Optional[str] = Query(None),
-    emergency_contact_name: Optional[str] = Query(None),
-    emergency_contact_phone: Optional[str] = Query(None),
-    learners_permit_number: Optional[str] = Query(None),
-    id_number: Optional[str] = Query(None),
 ):
     """
     Admin update student profile details
     """
-    student = db.query(Student).filter(Student.id == student_id).first()
-    if not student:
+    # Only supplied fields change; an explicit null clears a nullable field
+    changes = payload.model_dump(exclude_unset=True)
+    _reject_cleared_required_fields(Student, changes)
+    if changes:
+        result = db.execute(
+            update(Student).where(Student.id == student_id).values(**changes)
+        )
+        found = result.rowcount > 0
+    else:
+        found = db.query(Student.id).filter(Student.id == student_id).first() is not None
+
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Student not found",
         )
 
-    # Update fields if provided
-    if address_line1 is not None:
-        student.address_line1 = address_line1
-    if address_line2 is not None:
-        student.address_line2 = address_line2
-    if city is not None:
-        student.city = city
-    if province is not None:
-        student.province = province
-    if suburb is not None:
-        student.suburb = suburb
-    if postal_code is not None:
-        student.postal_code = postal_code
-    if emergency_contact_name is not None:
-        student.emergency_contact_name = emergency_contact_name
-    if emergency_contact_phone is not None:
-        student.emergency_contact_phone = emergency_contact_phone
-    if learners_permit_number is not None:
-        student.learners_permit_number = learners_permit_number
-    if id_number is not None:
-        student.id_number = id_number
-
     db.commit()
-    db.refresh(student)
 
     return {
         "message": "Student profile updated successfully",
-        "student_id": student.id,
+        "student_id": student_id,
     }
 
 
@@ -2040,13 +2560,13 @@ async def get_instructor_earnings_report_admin(
     """
     Get comprehensive earnings report for a specific instructor (Admin only)
     """
-    instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()
+    instructor = db.get(Instructor, instructor_id)
     if not instructor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Instructor not found"
         )
 
-    user = db.query(User).filter(User.id == instructor.user_id).first()
+    user = db.get(User, instructor.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -2092,9 +2612,9 @@ async def get_instructor_earnings_report_admin(
 
     recent_earnings = []
     for booking in all_recent_bookings:
-        student = db.query(Student).filter(Student.id == booking.student_id).first()
+        student = db.get(Student, booking.student_id)
         student_user = (
-            db.query(User).filter(User.id == student.user_id).first()
+            db.get(User, student.user_id)
             if student
             else None
         )
@@ -2145,7 +2665,7 @@ async def get_all_instructors_earnings_summary(
 
     summary = []
     for instructor in instructors:
-        user = db.query(User).filter(User.id == instructor.user_id).first()
+        user = db.get(User, instructor.user_id)
         if not user:
             continue
 
@@ -2300,7 +2820,7 @@ async def update_admin_settings(
             first_admin.inactivity_timeout_minutes = settings_update.inactivity_timeout_minutes
 
         db.commit()
-        db.refresh(first_admin)
+        invalidate_admin_config()
 
         return {
             "message": "Global settings updated successfully for all admins",
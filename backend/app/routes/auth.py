@@ -2,37 +2,128 @@
 Authentication routes
 """
 
+import hashlib
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Cookie, Depends, Form, HTTPException, Query, Request, Response, status
+from fastapi import APIRouter, BackgroundTasks, Cookie, Depends, Form, HTTPException, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete, exists, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import func
 
 from ..config import settings
 from ..database import get_db
+from ..models.instructor_verification import InstructorVerificationToken
 from ..models.password_reset import PasswordResetToken
-from ..models.user import Instructor, Student, User, UserRole
+from ..models.user import (
+    PROFILE_INSTRUCTOR,
+    PROFILE_STUDENT,
+    Instructor,
+    InstructorVerificationStatus,
+    Student,
+    User,
+    UserRole,
+    UserStatus,
+)
+from ..models.verification_token import VerificationToken
 from ..schemas.user import (
     ChangePasswordRequest,
     ForgotPasswordRequest,
     InstructorCreate,
+    InstructorRegistrationResponse,
     ResetPasswordRequest,
     StudentCreate,
+    StudentRegistrationResponse,
     UserResponse,
     UserUpdate,
 )
+from ..services.admin_config import get_admin_config
 from ..services.auth import AuthService
 from ..services.email_service import email_service
-from ..utils.auth import decode_access_token, get_password_hash, verify_password
-from ..utils.rate_limiter import limiter
+from ..services.instructor_verification_service import InstructorVerificationService
+from ..services.verification_service import VerificationService
+from ..utils.auth import (
+    decode_access_token_cached,
+    forget_access_token,
+    get_password_hash,
+    is_session_revoked,
+    revoke_session,
+    verify_password,
+)
+from ..utils.rate_limiter import RATE_LIMITED_RESPONSES, AccountRateLimit, RateLimit
+from ..utils.response_cache import response_cache
 from ..utils.encryption import EncryptionService  # For SMTP password decryption
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 logger = logging.getLogger(__name__)
 
+# Forgot-password lookup, built once; selects only what the reset email needs
+_RESET_USER_BY_EMAIL_STMT = select(User.id, User.email, User.first_name).where(
+    User.email == bindparam("email")
+)
+
+# Role profile JOINed into get_current_user's lookup, limited to the columns
+# read through current_user (/me). Anything else on the row is loaded on
+# first access.
+_PROFILE_LOAD_OPTIONS = {
+    UserRole.INSTRUCTOR.value: [
+        joinedload(User.instructor_profile).load_only(
+            Instructor.user_id,
+            Instructor.license_types,
+            Instructor.hourly_rate,
+            Instructor.is_available,
+            Instructor.rating,
+            Instructor.total_earnings,
+        )
+    ],
+    UserRole.STUDENT.value: [
+        joinedload(User.student_profile).load_only(
+            Student.user_id,
+            Student.id_number,
+            Student.learners_permit_number,
+            Student.emergency_contact_name,
+            Student.emergency_contact_phone,
+        )
+    ],
+}
+
+# Who the caller is, per session (JWT ``jti``): id, role, status and active
+# role. Shared through the response cache (Redis when available), so identity-
+# only checks such as require_admin skip the users SELECT on every worker.
+# Primed at login. Logged-out and superseded sessions are rejected by the
+# revocation list before this cache is consulted.
+SESSION_PRINCIPAL_CACHE_NAMESPACE = "session_principal"
+SESSION_PRINCIPAL_CACHE_TTL_SECONDS = 60
+
+# Auth cookie is Secure (HTTPS-only) in production; settings don't change at runtime
+_SECURE_COOKIE = settings.ENVIRONMENT.lower() == "production"
+
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE (forgot-password upsert)
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def _credentials_error() -> HTTPException:
+    """401 for a missing/invalid token - only built when authentication fails."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _session_invalidated_error() -> HTTPException:
+    """401 for a token whose session was ended by a logout or newer login."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Your session has been ended from another device. Please log in again.",
+        headers={"WWW-Authenticate": "Bearer", "X-Error-Code": "SESSION_INVALIDATED"},
+    )
+
 
 # Handle CORS preflight requests for registration endpoints
 @router.options("/register/student")
@@ -59,13 +150,16 @@ async def options_me():
     return {"ok": True}
 
 
-async def get_current_user(
+def get_current_user(
     request: Request,
     db: Session = Depends(get_db),
     access_token: Optional[str] = Cookie(None)
 ) -> User:
     """
     Get current authenticated user from HTTP-only cookie (preferred) or Authorization header (fallback)
+
+    Plain ``def`` (like the handlers below): the session is synchronous, so
+    FastAPI runs this in its threadpool instead of blocking the event loop.
     """
     # Try cookie first (HTTP-only, more secure)
     token = access_token
@@ -75,41 +169,43 @@ async def get_current_user(
         authorization = request.headers.get("Authorization")
         if authorization and authorization.startswith("Bearer "):
             token = authorization.replace("Bearer ", "")
-    
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
+
     if not token:
-        raise credentials_exception
+        raise _credentials_error()
 
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_error()
 
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
+    # `sub` is the user id as a string; anything else is not one of our tokens
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        raise _credentials_error()
+
+    # Logged out / replaced by a newer login: reject without a DB lookup
+    jti = payload.get("jti")
+    if jti is not None and is_session_revoked(jti):
+        raise _session_invalidated_error()
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # Primary-key lookup: served from the identity map if already loaded.
+    # The profile for the role the token was issued for is JOINed in the same
+    # statement, so /me and role-specific routes don't issue a second SELECT.
+    token_role = payload.get("role")
+    options = _PROFILE_LOAD_OPTIONS.get(token_role)
+    user = db.get(User, user_id, options=options)
     if user is None:
-        raise credentials_exception
+        raise _credentials_error()
 
     # ── Single-session validation ─────────────────────────────────────────────
     # Each JWT carries a `jti` (session token ID). If the DB no longer holds this
-    # token (because the user logged in elsewhere), reject the request.
-    jti = payload.get("jti")
+    # token (because the user logged in elsewhere), reject the request. The
+    # revocation list above catches most of these first; this check stays
+    # authoritative (e.g. for sessions replaced before the list existed).
     if jti is not None and user.active_session_token != jti:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Your session has been ended from another device. Please log in again.",
-            headers={"WWW-Authenticate": "Bearer", "X-Error-Code": "SESSION_INVALIDATED"},
-        )
+        raise _session_invalidated_error()
     # ─────────────────────────────────────────────────────────────────────────
 
-    token_role = payload.get("role")
     if token_role:
         logger.debug("JWT token role: %s, database role: %s", token_role, user.role.value)
         setattr(user, "active_role", token_role)
@@ -120,6 +216,66 @@ async def get_current_user(
     return user
 
 
+def _principal_cache_key(jti: str) -> str:
+    return hashlib.blake2b(jti.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _remember_principal(jti: str, user: User, active_role: str) -> None:
+    response_cache.set(
+        SESSION_PRINCIPAL_CACHE_NAMESPACE,
+        _principal_cache_key(jti),
+        {
+            "id": user.id,
+            "role": user.role.value,
+            "status": user.status.value,
+            "active_role": active_role,
+        },
+        SESSION_PRINCIPAL_CACHE_TTL_SECONDS,
+    )
+
+
+def forget_session_principals() -> None:
+    """Drop every cached principal (after a user's status or role changes)."""
+    response_cache.clear(SESSION_PRINCIPAL_CACHE_NAMESPACE)
+
+
+def get_current_principal(
+    request: Request,
+    db: Session = Depends(get_db),
+    access_token: Optional[str] = Cookie(None),
+) -> User:
+    """
+    get_current_user() for callers that only need to know who is calling.
+
+    On a cache hit the returned User is a transient object carrying only id,
+    role, status and active_role, and no database connection is used. On a
+    miss it falls back to get_current_user() and caches the result.
+    """
+    token = access_token
+    if not token:
+        authorization = request.headers.get("Authorization")
+        if authorization and authorization.startswith("Bearer "):
+            token = authorization.replace("Bearer ", "")
+
+    payload = decode_access_token_cached(token) if token else None
+    jti = payload.get("jti") if payload else None
+    if jti is not None and not is_session_revoked(jti):
+        cached = response_cache.get(SESSION_PRINCIPAL_CACHE_NAMESPACE, _principal_cache_key(jti))
+        if cached is not None:
+            principal = User(
+                id=cached["id"],
+                role=UserRole(cached["role"]),
+                status=UserStatus(cached["status"]),
+            )
+            setattr(principal, "active_role", cached["active_role"])
+            return principal
+
+    user = get_current_user(request, db, access_token)
+    if jti is not None:
+        _remember_principal(jti, user, get_active_role(user))
+    return user
+
+
 def get_active_role(user: User) -> str:
     """
     Get the active role from the current user session (from JWT token or fallback to database role)
@@ -127,69 +283,182 @@ def get_active_role(user: User) -> str:
     return getattr(user, "active_role", user.role.value)
 
 
+def _send_student_verification(
+    user_id: int,
+    token_id: int,
+    smtp_email: Optional[str],
+    smtp_password: Optional[str],
+    validity_minutes: int,
+) -> None:
+    """
+    Background task: send the student's verification email/WhatsApp and the
+    admin notifications. Runs after the response in its own session.
+    """
+    # Looked up at call time: SessionLocal is rebuilt when the DB is configured
+    from ..database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        verification_token = db.get(VerificationToken, token_id)
+        if user is None or verification_token is None:
+            return
+        result = VerificationService.send_verification_messages(
+            db=db,
+            user=user,
+            verification_token=verification_token,
+            frontend_url=settings.FRONTEND_URL,
+            admin_smtp_email=smtp_email,
+            admin_smtp_password=smtp_password,
+            notify_admins=True,  # Enable admin notifications for student registrations
+            user_type="student",
+            validity_minutes=validity_minutes,
+        )
+        logger.info(
+            "Student %s verification sent: email=%s whatsapp=%s admins=%s",
+            user_id,
+            result.get("email_sent", False),
+            result.get("whatsapp_sent", False),
+            result.get("total_admins_notified", 0),
+        )
+    except Exception as e:
+        logger.error("Sending student verification for user %s failed: %s", user_id, e)
+    finally:
+        db.close()
+
+
+def _send_instructor_registration_messages(
+    user_id: int,
+    instructor_id: int,
+    user_token_id: int,
+    instructor_token_id: int,
+    smtp_email: Optional[str],
+    smtp_password: Optional[str],
+    validity_minutes: int,
+) -> None:
+    """
+    Background task: account verification to the instructor, credential
+    verification to all admins, the company owner request (if joining a
+    company) and the "registration received" notice.
+    """
+    # Looked up at call time: SessionLocal is rebuilt when the DB is configured
+    from ..database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        instructor = db.get(Instructor, instructor_id)
+        if user is None or instructor is None:
+            return
+
+        # 1. User account verification link → instructor
+        user_verification_token = db.get(VerificationToken, user_token_id)
+        if user_verification_token is not None:
+            VerificationService.send_verification_messages(
+                db=db,
+                user=user,
+                verification_token=user_verification_token,
+                frontend_url=settings.FRONTEND_URL,
+                admin_smtp_email=smtp_email,
+                admin_smtp_password=smtp_password,
+                validity_minutes=validity_minutes,
+            )
+
+        # 2. Instructor credential verification link → all admins
+        instructor_ver_token = db.get(InstructorVerificationToken, instructor_token_id)
+        if instructor_ver_token is not None:
+            InstructorVerificationService.send_verification_to_all_admins(
+                db=db,
+                instructor=instructor,
+                verification_token=instructor_ver_token,
+                frontend_url=settings.FRONTEND_URL,
+            )
+
+        # 3. If joining a company, notify company owner as well
+        if instructor.company_id and not instructor.is_company_owner:
+            InstructorVerificationService.send_company_verification(
+                db=db,
+                instructor=instructor,
+                frontend_url=settings.FRONTEND_URL,
+            )
+
+        # 4. Notify instructor that registration is received and pending
+        try:
+            InstructorVerificationService.send_pending_notification(db=db, instructor=instructor)
+        except Exception:
+            pass
+    except Exception as e:
+        logger.error("Sending instructor registration messages for instructor %s failed: %s", instructor_id, e)
+    finally:
+        db.close()
+
+
 @router.post(
-    "/register/student", response_model=dict, status_code=status.HTTP_201_CREATED
+    "/register/student",
+    response_model=StudentRegistrationResponse,
+    # Fields the handler didn't set (e.g. company_owner_queued for students) stay out
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_201_CREATED,
+    # Max 3 student registrations per hour per IP
+    dependencies=[Depends(RateLimit("register_student", 3, 3600))],
+    responses=RATE_LIMITED_RESPONSES,
 )
-@limiter.limit("3/hour")  # Max 3 student registrations per hour per IP
-async def register_student(
-    request: Request,  # Required for rate limiter
-    response: Response,  # Required for rate limiter to inject headers
+def register_student(
+    request: Request,
     student_data: StudentCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Register a new student
     Note: Admin user must exist before students can register
-    Creates user as inactive and sends email/WhatsApp verification
+    Creates user as inactive; the email/WhatsApp verification is sent in the
+    background after the response.
     """
-    from ..services.initialization import InitializationService
-    from ..services.verification_service import VerificationService
-    from ..config import settings
-    
-    # Check if admin exists
-    if not InitializationService.admin_exists(db):
+    # Check if admin exists - the same (cached) read of the admin settings
+    # row supplies the SMTP/validity settings used below
+    admin = get_admin_config(db)
+    if admin is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="System is not initialized. Please contact administrator to complete initial setup first.",
         )
+    validity_minutes = admin["verification_link_validity_minutes"] or 30
     
     # Create student (user will be inactive)
     client_ip = request.client.host if request.client else None
-    user, student = AuthService.create_student(db, student_data, client_ip=client_ip)
-    
-    # Get admin SMTP settings
-    admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-    validity_minutes = admin.verification_link_validity_minutes if admin else 30
+    # The account and its verification token are committed together, so a
+    # failure can't leave an account with no way to verify it
+    user, student = AuthService.create_student(db, student_data, client_ip=client_ip, commit=False)
     
     # Create verification token
     verification_token = VerificationService.create_verification_token(
         db=db,
         user_id=user.id,
         token_type="email",
-        validity_minutes=validity_minutes
+        validity_minutes=validity_minutes,
+        commit=False,
     )
+    db.commit()
+    AuthService.after_role_created(user.id, "student")
     
-    # Send verification messages (WhatsApp always attempted, email only if SMTP configured)
+    # Queue verification messages (WhatsApp always attempted, email only if SMTP configured)
     # Decrypt admin's SMTP password before passing to email service
-    smtp_password = EncryptionService.decrypt(admin.smtp_password) if admin and admin.smtp_password else None
-    
-    result = VerificationService.send_verification_messages(
-        db=db,
-        user=user,
-        verification_token=verification_token,
-        frontend_url=settings.FRONTEND_URL,
-        admin_smtp_email=admin.smtp_email if admin else None,
-        admin_smtp_password=smtp_password,
-        notify_admins=True,  # Enable admin notifications for student registrations
-        user_type="student"
+    smtp_email = admin["smtp_email"]
+    smtp_password = EncryptionService.decrypt(admin["smtp_password"]) if admin["smtp_password"] else None
+    background_tasks.add_task(
+        _send_student_verification,
+        user.id,
+        verification_token.id,
+        smtp_email,
+        smtp_password,
+        validity_minutes,
     )
     verification_result = {
-        "email_sent": result.get("email_sent", False),
-        "whatsapp_sent": result.get("whatsapp_sent", False),
+        "status": "queued",
+        "email_queued": bool(smtp_email and smtp_password),
+        "whatsapp_queued": True,
         "expires_in_minutes": validity_minutes,
-        "admins_notified": result.get("total_admins_notified", 0),
-        "admin_emails_sent": result.get("admin_emails_sent", 0),
-        "admin_whatsapp_sent": result.get("admin_whatsapp_sent", 0),
     }
     
     return {
@@ -202,90 +471,79 @@ async def register_student(
 
 
 @router.post(
-    "/register/instructor", response_model=dict, status_code=status.HTTP_201_CREATED
+    "/register/instructor",
+    response_model=InstructorRegistrationResponse,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_201_CREATED,
+    # Max 3 instructor registrations per hour per IP
+    dependencies=[Depends(RateLimit("register_instructor", 3, 3600))],
+    responses=RATE_LIMITED_RESPONSES,
 )
-@limiter.limit("3/hour")  # Max 3 instructor registrations per hour per IP
-async def register_instructor(
-    request: Request,  # Required for rate limiter
-    response: Response,  # Required for rate limiter to inject headers
+def register_instructor(
+    request: Request,
     instructor_data: InstructorCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Register a new instructor.
     Creates instructor with pending verification status, sends account verification
     to instructor, credential verification to all admins, and (if joining a company)
-    a verification request to the company owner.
+    a verification request to the company owner. Messages go out in the
+    background after the response.
     """
-    from ..services.initialization import InitializationService
-    from ..services.instructor_verification_service import InstructorVerificationService
-    from ..services.verification_service import VerificationService
-    from ..config import settings
-
-    if not InitializationService.admin_exists(db):
+    # Admin settings double as the "system initialised" check
+    admin = get_admin_config(db)
+    if admin is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="System is not initialized. Please contact administrator to complete initial setup first.",
         )
+    validity_minutes = admin["verification_link_validity_minutes"] or 60
 
     try:
         logger.debug("Instructor registration data received for: %s", getattr(instructor_data, 'email', 'unknown'))
 
         # Create instructor (user INACTIVE, instructor pending verification)
         client_ip = request.client.host if request.client else None
-        user, instructor = AuthService.create_instructor(db, instructor_data, client_ip=client_ip)
-
-        admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-        validity_minutes = admin.verification_link_validity_minutes if admin else 60
+        # The account and both verification tokens are committed together
+        user, instructor = AuthService.create_instructor(
+            db, instructor_data, client_ip=client_ip, commit=False
+        )
 
-        # 1. User account verification link → instructor
+        # Links are created now so they exist before the response; the
+        # messages carrying them are sent in the background.
         user_verification_token = VerificationService.create_verification_token(
             db=db,
             user_id=user.id,
             token_type="email",
             validity_minutes=validity_minutes,
+            commit=False,
         )
-        smtp_password = (
-            EncryptionService.decrypt(admin.smtp_password)
-            if admin and admin.smtp_password
-            else None
-        )
-        user_verification_result = VerificationService.send_verification_messages(
-            db=db,
-            user=user,
-            verification_token=user_verification_token,
-            frontend_url=settings.FRONTEND_URL,
-            admin_smtp_email=admin.smtp_email if admin else None,
-            admin_smtp_password=smtp_password,
-        )
-
-        # 2. Instructor credential verification link → all admins
         instructor_ver_token = InstructorVerificationService.create_verification_token(
             db=db,
             instructor_id=instructor.id,
             validity_minutes=validity_minutes,
+            commit=False,
         )
-        admin_verification_result = InstructorVerificationService.send_verification_to_all_admins(
-            db=db,
-            instructor=instructor,
-            verification_token=instructor_ver_token,
-            frontend_url=settings.FRONTEND_URL,
+        db.commit()
+        AuthService.after_role_created(user.id, "instructor")
+        smtp_email = admin["smtp_email"]
+        smtp_password = (
+            EncryptionService.decrypt(admin["smtp_password"])
+            if admin["smtp_password"]
+            else None
+        )
+        background_tasks.add_task(
+            _send_instructor_registration_messages,
+            user.id,
+            instructor.id,
+            user_verification_token.id,
+            instructor_ver_token.id,
+            smtp_email,
+            smtp_password,
+            validity_minutes,
         )
-
-        # 3. If joining a company, notify company owner as well
-        company_verification_result: dict = {"sent": False}
-        if instructor.company_id and not instructor.is_company_owner:
-            company_verification_result = InstructorVerificationService.send_company_verification(
-                db=db,
-                instructor=instructor,
-                frontend_url=settings.FRONTEND_URL,
-            )
-
-        # 4. Notify instructor that registration is received and pending
-        try:
-            InstructorVerificationService.send_pending_notification(db=db, instructor=instructor)
-        except Exception:
-            pass
 
         return {
             "message": "Registration successful! Please verify your account via email/WhatsApp.",
@@ -296,33 +554,35 @@ async def register_instructor(
             "company_id": instructor.company_id,
             "is_company_owner": instructor.is_company_owner,
             "verification_sent": {
-                "email_sent": user_verification_result.get("email_sent", False),
-                "whatsapp_sent": user_verification_result.get("whatsapp_sent", False),
+                "status": "queued",
+                "email_queued": bool(smtp_email and smtp_password),
+                "whatsapp_queued": True,
                 "expires_in_minutes": validity_minutes,
-                "emails_sent": admin_verification_result["emails_sent"],
-                "whatsapp_sent_to_admins": admin_verification_result["whatsapp_sent"],
-                "total_admins": admin_verification_result["total_admins"],
-                "company_owner_notified": company_verification_result.get("sent", False),
+                "company_owner_queued": bool(
+                    instructor.company_id and not instructor.is_company_owner
+                ),
             },
-            "note": (
-                f"Please verify your account to log in. "
-                f"Admins ({admin_verification_result['total_admins']}) have been notified."
-            ),
+            "note": "Please verify your account to log in. Admins are being notified.",
         }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("Registration failed: %s: %s", type(e).__name__, str(e))
-        import traceback
-        traceback.print_exc()
+        logger.exception("Registration failed: %s: %s", type(e).__name__, str(e))
         raise
 
 
-@router.post("/login", response_model=dict)
-@limiter.limit("5/minute")  # Max 5 login attempts per minute per IP
-async def login(
+@router.post(
+    "/login",
+    response_model=dict,
+    # Max 5 login attempts per minute per IP, and 10 per 15 minutes per IP + account
+    dependencies=[
+        Depends(RateLimit("login", 5, 60)),
+        Depends(AccountRateLimit("login_account", 10, 900, field="username")),
+    ],
+    responses=RATE_LIMITED_RESPONSES,
+)
+def login(
     response: Response,  # Required for setting cookies
-    request: Request,  # Required for rate limiter
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     role: str | None = Form(None),
     force_login: bool = Form(False),
@@ -358,12 +618,21 @@ async def login(
     if user.role == UserRole.STUDENT:
         available_roles.add(UserRole.STUDENT.value)
 
-    if db.query(Instructor).filter(Instructor.user_id == user.id).first():
+    if db.get_bind().dialect.name == "postgresql":
+        # Trigger-maintained bitmask on the already-loaded user row
+        has_instructor = bool(user.profile_roles & PROFILE_INSTRUCTOR)
+        has_student = bool(user.profile_roles & PROFILE_STUDENT)
+    else:
+        # Both profile checks in one round-trip (user_id is unique on both tables)
+        has_instructor, has_student = db.query(
+            exists().where(Instructor.user_id == user.id),
+            exists().where(Student.user_id == user.id),
+        ).one()
+    if has_instructor:
         available_roles.add(UserRole.INSTRUCTOR.value)
-    if db.query(Student).filter(Student.user_id == user.id).first():
+    if has_student:
         available_roles.add(UserRole.STUDENT.value)
 
-
     if role is None and len(available_roles) > 1:
         return {
             "requires_role_selection": True,
@@ -381,12 +650,19 @@ async def login(
     # Block instructor login until their credentials have been verified by admin
     # (or company owner). Admins are never blocked even if they hold an instructor profile.
     if selected_role == UserRole.INSTRUCTOR.value and user.role != UserRole.ADMIN:
-        from ..models.user import InstructorVerificationStatus as IVS
-        instructor = db.query(Instructor).filter(Instructor.user_id == user.id).first()
-        if instructor and instructor.verification_status not in (
-            IVS.VERIFIED.value, None
-        ):
-            admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
+        # Only the status column (and, when blocked, the admin contact columns)
+        verification_status = (
+            db.query(Instructor.verification_status)
+            .filter(Instructor.user_id == user.id)
+            .scalar()
+        )
+        if verification_status not in (InstructorVerificationStatus.VERIFIED.value, None):
+            admin = (
+                db.query(User.email, User.phone, User.first_name, User.last_name)
+                .filter(User.role == UserRole.ADMIN)
+                .order_by(User.id)
+                .first()
+            )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={
@@ -395,7 +671,7 @@ async def login(
                         "Your instructor account is pending verification. "
                         "Please contact the administrator."
                     ),
-                    "verification_status": instructor.verification_status,
+                    "verification_status": verification_status,
                     "admin_email": admin.email if admin else None,
                     "admin_phone": admin.phone if admin else None,
                     "admin_name": (
@@ -406,14 +682,19 @@ async def login(
     # ─────────────────────────────────────────────────────────────────────────
 
     access_token = AuthService.create_user_token(user, selected_role, db=db)
+
+    # Prime the token and principal caches, so the first authenticated
+    # request after login neither re-verifies the JWT nor SELECTs the user
+    payload = decode_access_token_cached(access_token)
+    if payload and payload.get("jti"):
+        _remember_principal(payload["jti"], user, selected_role)
     
     # Set HTTP-only cookie for web security (prevents XSS token theft)
-    is_secure_cookie = settings.ENVIRONMENT.lower() == "production"
     response.set_cookie(
         key="access_token",
         value=access_token,
         httponly=True,  # JavaScript cannot access (XSS protection)
-        secure=is_secure_cookie,  # True in production with HTTPS
+        secure=_SECURE_COOKIE,  # True in production with HTTPS
         samesite="lax",  # CSRF protection
         max_age=3600 * 24 * 7,  # 7 days
     )
@@ -426,7 +707,7 @@ async def login(
 
 
 @router.post("/logout")
-async def logout(
+def logout(
     request: Request,
     response: Response,
     db: Session = Depends(get_db),
@@ -445,22 +726,32 @@ async def logout(
             token = authorization.replace("Bearer ", "")
 
     if token:
-        payload = decode_access_token(token)
+        payload = decode_access_token_cached(token)
         if payload:
+            jti = payload.get("jti")
+            exp = payload.get("exp")
+            if jti:
+                ttl = int(exp - time.time()) + 1 if isinstance(exp, (int, float)) else None
+                revoke_session(jti, ttl)
             user_id = payload.get("sub")
             if user_id:
-                user = db.query(User).filter(User.id == int(user_id)).first()
+                user = db.get(User, int(user_id))
                 if user:
                     user.active_session_token = None
                     db.commit()
                     logger.debug("Cleared active session token for user_id: %s", user.id)
 
+        forget_access_token(token)
+        # Lazy import: middleware.admin imports this module
+        from ..middleware.admin import invalidate_admin_principal_cache
+        invalidate_admin_principal_cache(token)
+
     response.delete_cookie(key="access_token")
     return {"message": "Successfully logged out"}
 
 
 @router.get("/me")
-async def get_current_user_info(
+def get_current_user_info(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
@@ -482,36 +773,40 @@ async def get_current_user_info(
 
     # Add role-specific details
     if active_role == UserRole.INSTRUCTOR.value:
-        instructor = (
-            db.query(Instructor).filter(Instructor.user_id == current_user.id).first()
-        )
+        # Loaded alongside the user by get_current_user
+        instructor = current_user.instructor_profile
         if instructor:
-            # Calculate total earnings from completed bookings
-            from ..models.booking import Booking, BookingStatus, PaymentStatus
-            total_earnings = (
-                db.query(func.sum(Booking.amount))
-                .filter(
-                    Booking.instructor_id == instructor.id,
-                    Booking.status == BookingStatus.COMPLETED,
-                    Booking.payment_status == PaymentStatus.PAID,
+            # Total earnings from completed + paid bookings: kept on the row
+            # by a bookings trigger on PostgreSQL (no extra query), summed
+            # live elsewhere from ix_bookings_instructor_paid_amount
+            if db.get_bind().dialect.name == "postgresql":
+                total_earnings = instructor.total_earnings or 0.0
+            else:
+                from ..models.booking import Booking, BookingStatus, PaymentStatus
+                total_earnings = (
+                    db.query(func.sum(Booking.amount))
+                    .filter(
+                        Booking.instructor_id == instructor.id,
+                        Booking.status == BookingStatus.COMPLETED,
+                        Booking.payment_status == PaymentStatus.PAID,
+                    )
+                    .scalar()
+                    or 0.0
                 )
-                .scalar()
-                or 0.0
-            )
-            
+
             user_data.update(
                 {
                     "instructor_id": instructor.id,
                     "license_types": instructor.license_types,
-                    "hourly_rate": float(instructor.hourly_rate),
+                    "hourly_rate": instructor.hourly_rate,
                     "is_available": instructor.is_available,
-                    "total_earnings": float(total_earnings),
+                    "total_earnings": total_earnings,
                     "rating": float(instructor.rating) if instructor.rating else 0.0,
                 }
             )
 
     elif active_role == UserRole.STUDENT.value:
-        student = db.query(Student).filter(Student.user_id == current_user.id).first()
+        student = current_user.student_profile
         if student:
             user_data.update(
                 {
@@ -526,30 +821,36 @@ async def get_current_user_info(
 
 
 @router.get("/inactivity-timeout")
-async def get_inactivity_timeout(db: Session = Depends(get_db)):
+def get_inactivity_timeout(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get global inactivity timeout setting (public endpoint - no auth required)
     Used by frontend to configure auto-logout timer
+
+    Cacheable by clients/proxies; revalidation with If-None-Match returns 304.
     """
     try:
         # Get first admin's settings (global config)
-        from ..models.user import UserRole
-        
-        admin = db.query(User).filter(User.role == UserRole.ADMIN).order_by(User.id.asc()).first()
-        
-        if admin and admin.inactivity_timeout_minutes:
-            return {"inactivity_timeout_minutes": admin.inactivity_timeout_minutes}
-        
-        # Default to 15 minutes if not configured
-        return {"inactivity_timeout_minutes": 15}
+        admin = get_admin_config(db)
+        timeout = (admin["inactivity_timeout_minutes"] if admin else None) or 15
     except Exception as e:
         logger.error("Error fetching inactivity timeout: %s", str(e))
-        # Return default on error
+        # Return default on error (not cached)
         return {"inactivity_timeout_minutes": 15}
 
+    etag = f'W/"inactivity-{timeout}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=300, stale-while-revalidate=60",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return {"inactivity_timeout_minutes": timeout}
+
 
 @router.get("/check-unique")
-async def check_unique_fields(
+def check_unique_fields(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Session = Depends(get_db),
     email: Optional[str] = Query(None),
@@ -563,27 +864,32 @@ async def check_unique_fields(
     exclude_id = exclude_user_id or current_user.id
     conflicts = {}
 
+    # One EXISTS per supplied field, all answered in a single round-trip
+    checks = []
     if email:
-        existing = db.query(User).filter(
-            User.email == email,
-            User.id != exclude_id
-        ).first()
-        if existing:
-            conflicts["email"] = "This email is already in use by another user"
-
+        checks.append((
+            "email",
+            exists().where(User.email == email, User.id != exclude_id),
+            "This email is already in use by another user",
+        ))
     if id_number:
-        existing = db.query(User).filter(
-            User.id_number == id_number,
-            User.id != exclude_id
-        ).first()
-        if existing:
-            conflicts["id_number"] = "This ID number is already in use by another user"
+        checks.append((
+            "id_number",
+            exists().where(User.id_number == id_number, User.id != exclude_id),
+            "This ID number is already in use by another user",
+        ))
+
+    if checks:
+        taken = db.query(*(clause for _, clause, _ in checks)).one()
+        for (field, _, message), is_taken in zip(checks, taken):
+            if is_taken:
+                conflicts[field] = message
 
     return {"conflicts": conflicts, "is_unique": len(conflicts) == 0}
 
 
 @router.put("/me", response_model=UserResponse)
-async def update_user_profile(
+def update_user_profile(
     user_update: UserUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Session = Depends(get_db),
@@ -593,10 +899,9 @@ async def update_user_profile(
     """
     # Check email uniqueness if email is being changed
     if user_update.email is not None and user_update.email != current_user.email:
-        existing = db.query(User).filter(
-            User.email == user_update.email,
-            User.id != current_user.id
-        ).first()
+        existing = db.query(
+            exists().where(User.email == user_update.email, User.id != current_user.id)
+        ).scalar()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -606,10 +911,9 @@ async def update_user_profile(
 
     # Check id_number uniqueness if being changed
     if user_update.id_number is not None and user_update.id_number != current_user.id_number:
-        existing = db.query(User).filter(
-            User.id_number == user_update.id_number,
-            User.id != current_user.id
-        ).first()
+        existing = db.query(
+            exists().where(User.id_number == user_update.id_number, User.id != current_user.id)
+        ).scalar()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -627,14 +931,15 @@ async def update_user_profile(
     if user_update.address is not None:
         current_user.address = user_update.address
 
+    # No refresh: every UserResponse field is already on the object
+    # (expire_on_commit=False, and eager_defaults fetches server-side values)
     db.commit()
-    db.refresh(current_user)
 
     return current_user
 
 
 @router.post("/change-password")
-async def change_password(
+def change_password(
     password_data: ChangePasswordRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Session = Depends(get_db),
@@ -656,19 +961,37 @@ async def change_password(
     return {"message": "Password changed successfully"}
 
 
-@router.post("/forgot-password")
-@limiter.limit("3/hour")  # Max 3 password reset requests per hour per IP
-async def forgot_password(
-    request: Request,  # Required for rate limiter
-    response: Response,  # Required for rate limiter to inject headers
+def _send_password_reset_email(to_email: str, reset_token: str, user_name: str) -> None:
+    """Background task for forgot_password"""
+    email_sent = email_service.send_password_reset_email(
+        to_email=to_email, reset_token=reset_token, user_name=user_name
+    )
+    if not email_sent:
+        logger.warning("Password reset email could not be sent (SMTP not configured).")
+
+
+@router.post(
+    "/forgot-password",
+    # Max 3 password reset requests per hour per IP, and per IP + account
+    dependencies=[
+        Depends(RateLimit("forgot_password", 3, 3600)),
+        Depends(AccountRateLimit("forgot_password_account", 3, 3600, field="email")),
+    ],
+    responses=RATE_LIMITED_RESPONSES,
+)
+def forgot_password(
     password_request: ForgotPasswordRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
     Request password reset - sends email with reset token
+
+    The email goes out after the response, so response time doesn't reveal
+    whether the address belongs to an account.
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == password_request.email).first()
+    # Find user by email (only the columns the reset email needs)
+    user = db.execute(_RESET_USER_BY_EMAIL_STMT, {"email": password_request.email}).first()
 
     # Always return success to prevent email enumeration attacks
     if not user:
@@ -676,60 +999,78 @@ async def forgot_password(
             "message": "If an account with that email exists, a password reset link has been sent."
         }
 
-    # Delete any existing unused tokens for this user
-    db.query(PasswordResetToken).filter(
-        PasswordResetToken.user_id == user.id, PasswordResetToken.used_at.is_(None)
-    ).delete()
-    db.commit()
-
-    # Generate new reset token
+    # Replace any existing unused token for this user with a new one. On
+    # PostgreSQL/SQLite that's a single upsert against the one-active-token
+    # partial unique index; elsewhere a DELETE + INSERT in one transaction.
     reset_token = PasswordResetToken.generate_token()
-    expires_at = PasswordResetToken.get_expiration_time()
-
-    # Save token to database
-    token_record = PasswordResetToken(
-        user_id=user.id, token=reset_token, expires_at=expires_at
-    )
-    db.add(token_record)
+    values = {
+        "user_id": user.id,
+        "token": PasswordResetToken.hash_token(reset_token),
+        "expires_at": PasswordResetToken.get_expiration_time(),
+    }
+    upsert_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if upsert_insert is not None:
+        stmt = upsert_insert(PasswordResetToken).values(**values)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PasswordResetToken.user_id],
+                index_where=PasswordResetToken.used_at.is_(None),
+                set_={
+                    "token": stmt.excluded.token,
+                    "expires_at": stmt.excluded.expires_at,
+                    "created_at": func.now(),
+                },
+            )
+        )
+    else:
+        db.execute(
+            delete(PasswordResetToken).where(
+                PasswordResetToken.user_id == user.id, PasswordResetToken.used_at.is_(None)
+            )
+        )
+        db.execute(insert(PasswordResetToken).values(**values))
     db.commit()
 
     # Send email with reset link
-    email_sent = email_service.send_password_reset_email(
-        to_email=user.email, reset_token=reset_token, user_name=user.first_name
+    background_tasks.add_task(
+        _send_password_reset_email, user.email, reset_token, user.first_name
     )
 
-    if not email_sent:
-        # Log the token for development/testing purposes
-        logger.warning("Password reset email could not be sent (SMTP not configured).")
-
     return {
         "message": "If an account with that email exists, a password reset link has been sent."
     }
 
 
-@router.post("/reset-password")
-@limiter.limit("5/hour")  # Max 5 password resets per hour per IP
-async def reset_password(
-    request: Request,  # Required for rate limiter
-    response: Response,  # Required for rate limiter to inject headers
+@router.post(
+    "/reset-password",
+    # Max 5 password resets per hour per IP
+    dependencies=[Depends(RateLimit("reset_password", 5, 3600))],
+    responses=RATE_LIMITED_RESPONSES,
+)
+def reset_password(
     reset_data: ResetPasswordRequest,
     db: Session = Depends(get_db),
 ):
     """
     Reset password using token from email
     """
-    # Find token
-    token_record = (
-        db.query(PasswordResetToken)
-        .filter(PasswordResetToken.token == reset_data.token)
+    # Find token (stored hashed; unique index on the digest) together with
+    # its user in one round-trip
+    row = (
+        db.query(PasswordResetToken, User)
+        .join(User, User.id == PasswordResetToken.user_id)
+        .filter(PasswordResetToken.token == PasswordResetToken.hash_token(reset_data.token))
         .first()
     )
 
-    if not token_record:
+    # A token without a user can't exist (ON DELETE CASCADE), so a miss on
+    # the JOIN is just an unknown token
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired reset token",
         )
+    token_record, user = row
 
     # Check if token is valid
     if not token_record.is_valid():
@@ -738,13 +1079,6 @@ async def reset_password(
             detail="Invalid or expired reset token",
         )
 
-    # Get user
-    user = db.query(User).filter(User.id == token_record.user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="User not found"
-        )
-
     # Update password
     user.password_hash = get_password_hash(reset_data.new_password)
 
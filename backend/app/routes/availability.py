@@ -2,6 +2,7 @@
 Availability routes for instructor scheduling
 """
 
+import logging
 from datetime import date, datetime, time, timedelta
 from typing import Annotated, List
 
@@ -30,6 +31,9 @@ from ..schemas.availability import (
     TimeOffExceptionResponse,
     TimeSlot,
 )
+from ..services.schedule_cache import invalidate_instructor_schedule_cache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/availability", tags=["Availability"])
 
@@ -68,8 +72,10 @@ def is_time_slot_available(
         .all()
     )
 
-    print(f"DEBUG: Checking slot {slot_start} - {slot_end} for instructor {instructor_id}")
-    print(f"DEBUG: Found {len(bookings)} active bookings")
+    logger.debug(
+        "Checking slot %s - %s for instructor %s against %d active bookings",
+        slot_start, slot_end, instructor_id, len(bookings),
+    )
 
     # SAST timezone for comparison
     sast_tz = pytz.timezone("Africa/Johannesburg")
@@ -82,14 +88,11 @@ def is_time_slot_available(
             booking_start = sast_tz.localize(booking_start)
         booking_end = booking_start + timedelta(minutes=booking.duration_minutes)
 
-        print(f"DEBUG: Checking against booking {booking.id}: {booking_start} - {booking_end}")
-
         # Check if there's any overlap
         if not (booking_end <= slot_start or booking_start >= slot_end):
-            print(f"DEBUG: CONFLICT FOUND! Slot overlaps with booking {booking.id}")
+            logger.debug("Slot overlaps with booking %s", booking.id)
             return False  # Conflict found
 
-    print(f"DEBUG: Slot is AVAILABLE")
     return True  # No conflicts
 
 
@@ -106,7 +109,7 @@ def get_available_slots_for_date(
 
     slots = []
     day_of_week = get_day_of_week_enum(target_date)
-    print(f"DEBUG: target_date={target_date}, weekday={target_date.weekday()}, day_of_week={day_of_week}")
+    logger.debug("Slots for %s (day_of_week=%s)", target_date, day_of_week)
 
     # Check if there's time off on this date
     time_off = (
@@ -285,10 +288,6 @@ def get_all_slots_with_booking_status(
                 # Check if slot is booked
                 is_booked = not is_time_slot_available(instructor_id, current_time, slot_end, db)
 
-                # Debug logging
-                if is_booked:
-                    print(f"DEBUG: Slot {current_time.isoformat()} is BOOKED")
-
                 slots.append(
                     TimeSlot(
                         start_time=current_time.isoformat(),
@@ -326,6 +325,7 @@ async def create_schedule(
 
     db.add(schedule)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor.id)
     db.refresh(schedule)
 
     return schedule
@@ -353,6 +353,7 @@ async def create_bulk_schedule(
         schedules.append(schedule)
 
     db.commit()
+    invalidate_instructor_schedule_cache(instructor.id)
 
     for schedule in schedules:
         db.refresh(schedule)
@@ -404,6 +405,7 @@ async def update_schedule(
         setattr(schedule, field, value)
 
     db.commit()
+    invalidate_instructor_schedule_cache(instructor.id)
     db.refresh(schedule)
 
     return schedule
@@ -431,6 +433,7 @@ async def delete_schedule(
 
     db.delete(schedule)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor.id)
 
     return {"message": "Schedule deleted successfully"}
 
@@ -457,6 +460,7 @@ async def create_time_off(
 
     db.add(time_off)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor.id)
     db.refresh(time_off)
 
     return time_off
@@ -503,6 +507,7 @@ async def delete_time_off(
 
     db.delete(time_off)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor.id)
 
     return {"message": "Time off deleted successfully"}
 
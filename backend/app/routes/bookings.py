@@ -360,8 +360,6 @@ async def create_booking(
         logger = logging.getLogger(__name__)
         logger.error(f"❌ Failed to send WhatsApp confirmation: {e}")
         logger.error(traceback.format_exc())
-        print(f"Failed to send WhatsApp confirmation: {e}")
-        print(traceback.format_exc())
 
     return BookingResponse.from_orm(booking)
 
@@ -839,14 +837,6 @@ async def get_my_bookings(
                 else None
             )
 
-            # DEBUG: Log student information
-            print(f"🔍 DEBUG - Booking ID: {booking.id}")
-            print(f"🔍 DEBUG - Student: {student}")
-            print(
-                f"🔍 DEBUG - Student ID Number: {student.id_number if student else 'NO STUDENT'}"
-            )
-            print(f"🔍 DEBUG - Student User: {student_user}")
-
             booking_dict = {
                 "id": booking.id,
                 "booking_reference": booking.booking_reference,
@@ -869,10 +859,6 @@ async def get_my_bookings(
                 "pickup_location": booking.pickup_address,
                 "student_notes": booking.student_notes,
             }
-            print(f"🔍 DEBUG - booking_dict keys: {booking_dict.keys()}")
-            print(
-                f"🔍 DEBUG - student_id_number value: {booking_dict.get('student_id_number')}"
-            )
             bookings_list.append(booking_dict)
 
     return bookings_list
@@ -20,6 +20,8 @@ from ..models.password_reset import PasswordResetToken
 from ..models.payment import Transaction
 from ..models.payment_session import PaymentSession
 from ..models.user import Instructor, Student, User
+from ..services.admin_config import invalidate_admin_config
+from ..services.initialization import InitializationService
 
 router = APIRouter(prefix="/admin/database", tags=["admin-database"], dependencies=[Depends(require_admin)])
 
@@ -440,6 +442,8 @@ def reset_database(db: Session = Depends(get_db)):
         db.query(User).delete()
         
         db.commit()
+        InitializationService.forget_admin_exists()
+        invalidate_admin_config()
         
         return {
             "message": "Database reset successfully. All data has been deleted.",
@@ -555,6 +559,8 @@ async def restore_database(file: UploadFile = File(...), db: Session = Depends(g
         db.query(User).delete()
         
         db.commit()
+        InitializationService.forget_admin_exists()
+        invalidate_admin_config()
         
         # Restore users
         for user_data in backup_data.get('users', []):
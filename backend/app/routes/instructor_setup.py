@@ -16,6 +16,7 @@ from ..schemas.availability import (
     InstructorScheduleUpdate,
     TimeOffExceptionCreate,
 )
+from ..services.schedule_cache import invalidate_instructor_schedule_cache
 
 router = APIRouter(prefix="/instructors/setup", tags=["Instructor Initial Setup"])
 
@@ -118,6 +119,7 @@ async def setup_create_schedule(
 
     db.add(new_schedule)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
     db.refresh(new_schedule)
 
     return {
@@ -163,6 +165,7 @@ async def setup_update_schedule(
         schedule.is_active = schedule_data.is_active
 
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
     db.refresh(schedule)
 
     return {
@@ -201,6 +204,7 @@ async def setup_delete_schedule(
 
     db.delete(schedule)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
 
     return {"message": "Schedule entry deleted successfully"}
 
@@ -261,6 +265,7 @@ async def setup_create_time_off(
 
     db.add(new_time_off)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
     db.refresh(new_time_off)
 
     return {
@@ -305,5 +310,6 @@ async def setup_delete_time_off(
 
     db.delete(time_off)
     db.commit()
+    invalidate_instructor_schedule_cache(instructor_id)
 
     return {"message": "Time-off entry deleted successfully"}
@@ -2,6 +2,7 @@
 Instructor routes
 """
 
+import logging
 from datetime import datetime, timezone
 from typing import Annotated, List, Optional
 
@@ -19,6 +20,7 @@ from ..routes.auth import get_current_user, get_active_role
 from ..schemas.user import InstructorLocation, InstructorResponse, InstructorUpdate
 
 router = APIRouter(prefix="/instructors", tags=["Instructors"])
+logger = logging.getLogger(__name__)
 
 
 @router.get("/", response_model=List[InstructorResponse])
@@ -126,10 +128,7 @@ async def get_instructors(
 
         return responses
     except Exception as e:
-        import traceback
-
-        print(f"ERROR in get_instructors: {e}")
-        traceback.print_exc()
+        logger.exception("Error in get_instructors")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -206,9 +205,7 @@ async def get_earnings_report(
     """
     
     active_role = get_active_role(current_user)
-    print(
-        f"🔍 EARNINGS ENDPOINT CALLED for user: {current_user.email}, active_role: {active_role}"
-    )
+    logger.debug("Earnings report for user %s, active_role: %s", current_user.id, active_role)
 
     if active_role != UserRole.INSTRUCTOR.value:
         raise HTTPException(
@@ -321,7 +318,6 @@ async def get_earnings_report(
         "recent_earnings": recent_earnings,
     }
 
-    print(f"✅ RETURNING EARNINGS DATA: {response_data}")
     return response_data
 
 
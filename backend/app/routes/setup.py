@@ -21,6 +21,7 @@ from sqlalchemy.orm import Session
 from ..database import get_db
 from ..models.user import User, UserRole, UserStatus
 from ..schemas.admin import AdminCreateRequest
+from ..services.admin_config import invalidate_admin_config
 from ..utils.auth import get_password_hash
 from ..utils.encryption import EncryptionService  # For SMTP password encryption
 
@@ -111,6 +112,7 @@ def create_initial_admin(admin_data: AdminCreateRequest, db: Session = Depends(g
     db.add(new_admin)
     db.commit()
     db.refresh(new_admin)
+    invalidate_admin_config()
     _persist_twilio_to_env(admin_data.twilio_account_sid, admin_data.twilio_auth_token)
     return {
         "message": "Admin account created successfully! You can now log in.",
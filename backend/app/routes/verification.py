@@ -2,15 +2,17 @@
 Verification routes for email/phone confirmation
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from app.database import get_db
 from app.config import settings
 from app.services.verification_service import VerificationService
+from app.services.admin_config import get_admin_config, invalidate_admin_config
 from app.services.email_service import EmailService
 from app.models.user import User, UserRole
-from app.utils.rate_limiter import limiter
+from app.models.verification_token import VerificationToken
+from app.utils.rate_limiter import RATE_LIMITED_RESPONSES, limiter
 from app.utils.encryption import EncryptionService
 import logging
 
@@ -39,6 +41,7 @@ def _resolve_email_config(db: Session, request: "TestEmailRequest") -> tuple[str
         admin.verification_link_validity_minutes = request.verification_link_validity_minutes
         db.commit()
         db.refresh(admin)
+        invalidate_admin_config()
         
         # Retrieve decrypted password for testing
         smtp_password = (
@@ -65,21 +68,60 @@ def _get_user_or_404(db: Session, email: str) -> User:
     return user
 
 
-def _get_admin_email_config_or_503(db: Session) -> tuple[User, str]:
+def _get_admin_email_config_or_503(db: Session) -> tuple[dict, str]:
     """
-    Get admin email config or raise 503 if not configured
+    Get admin email config (settings columns only) or raise 503 if not configured
     """
-    admin = _get_admin(db)
-    if not admin or not admin.smtp_email or not admin.smtp_password:
+    admin = get_admin_config(db)
+    if not admin or not admin["smtp_email"] or not admin["smtp_password"]:
         raise HTTPException(
             status_code=503,
             detail="Email service not configured. Please contact admin."
         )
 
-    smtp_password = EncryptionService.decrypt(admin.smtp_password)
+    smtp_password = EncryptionService.decrypt(admin["smtp_password"])
     return admin, smtp_password
 
 
+def _send_resent_verification(
+    user_id: int,
+    token_id: int,
+    smtp_email: str,
+    smtp_password: str,
+) -> None:
+    """
+    Background task: send a fresh verification email/WhatsApp after the
+    resend response has gone out. Runs in its own session.
+    """
+    # Looked up at call time: SessionLocal is rebuilt when the DB is configured
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        verification_token = db.get(VerificationToken, token_id)
+        if user is None or verification_token is None:
+            return
+        result = VerificationService.send_verification_messages(
+            db=db,
+            user=user,
+            verification_token=verification_token,
+            frontend_url=settings.FRONTEND_URL,
+            admin_smtp_email=smtp_email,
+            admin_smtp_password=smtp_password,
+        )
+        logger.info(
+            "Verification resent to user %s: email=%s whatsapp=%s",
+            user_id,
+            result.get("email_sent", False),
+            result.get("whatsapp_sent", False),
+        )
+    except Exception as e:
+        logger.error("Resending verification for user %s failed: %s", user_id, e)
+    finally:
+        db.close()
+
+
 def _format_phone(phone_num: str) -> str:
     """
     Convert local format to international format
@@ -204,7 +246,7 @@ def test_email_configuration(request: TestEmailRequest, db: Session = Depends(ge
         )
 
 
-@router.post("/account")
+@router.post("/account", responses=RATE_LIMITED_RESPONSES)
 @limiter.limit("10/hour")  # Max 10 verification attempts per hour per IP
 async def verify_account(
     request: Request,  # Required for rate limiter
@@ -255,11 +297,12 @@ async def verify_account(
         )
 
 
-@router.get("/resend")
+@router.get("/resend", responses=RATE_LIMITED_RESPONSES)
 @limiter.limit("3/hour")  # Max 3 resend requests per hour per IP
 async def resend_verification(
     request: Request,  # Required for rate limiter
     response: Response,  # Required for rate limiter to inject headers
+    background_tasks: BackgroundTasks,
     email: str = Query(...),
     db: Session = Depends(get_db)
 ):
@@ -278,7 +321,7 @@ async def resend_verification(
             )
 
         admin, smtp_password = _get_admin_email_config_or_503(db)
-        validity_minutes = admin.verification_link_validity_minutes or 30
+        validity_minutes = admin["verification_link_validity_minutes"] or 30
         verification_token = VerificationService.create_verification_token(
             db=db,
             user_id=user.id,
@@ -286,22 +329,22 @@ async def resend_verification(
             validity_minutes=validity_minutes
         )
 
-        from app.config import settings
-        result = VerificationService.send_verification_messages(
-            db=db,
-            user=user,
-            verification_token=verification_token,
-            frontend_url=settings.FRONTEND_URL,
-            admin_smtp_email=admin.smtp_email,
-            admin_smtp_password=smtp_password,
+        # Delivery (SMTP + WhatsApp round trips) happens after the response
+        background_tasks.add_task(
+            _send_resent_verification,
+            user.id,
+            verification_token.id,
+            admin["smtp_email"],
+            smtp_password,
         )
 
         return {
             "success": True,
             "message": "Verification link resent! Please check your email and WhatsApp.",
-            "email_sent": result["email_sent"],
-            "whatsapp_sent": result["whatsapp_sent"],
-            "expires_in_minutes": result["expires_in_minutes"],
+            "status": "queued",
+            "email_queued": True,
+            "whatsapp_queued": True,
+            "expires_in_minutes": validity_minutes,
         }
     except HTTPException:
         raise
@@ -466,7 +509,7 @@ You're all set to receive booking confirmations and reminders.""",
             detail=f"Failed to send test WhatsApp: {str(e)}"
         )
 
-@router.get("/instructor")
+@router.get("/instructor", responses=RATE_LIMITED_RESPONSES)
 @limiter.limit("10/minute")
 async def verify_instructor(
     request: Request,  # Required for rate limiter
@@ -530,7 +573,7 @@ class AdminVerifyRequest(BaseModel):
     reason: str = ""
 
 
-@router.post("/instructor/admin")
+@router.post("/instructor/admin", responses=RATE_LIMITED_RESPONSES)
 @limiter.limit("10/minute")
 async def admin_decide_instructor(
     request: Request,
@@ -620,7 +663,7 @@ class CompanyVerifyRequest(BaseModel):
     approve: bool = True
 
 
-@router.post("/instructor/company")
+@router.post("/instructor/company", responses=RATE_LIMITED_RESPONSES)
 @limiter.limit("10/minute")
 async def verify_instructor_by_company(
     request: Request,
@@ -157,6 +157,29 @@ class AdminStats(BaseModel):
     avg_booking_value: float
 
 
+class AdminStatsCounters(BaseModel):
+    """Cheap dashboard counters (user/instructor/booking tallies only)"""
+
+    total_users: int
+    active_users: int
+    total_instructors: int
+    total_students: int
+    verified_instructors: int
+    pending_verification: int
+    total_bookings: int
+    pending_bookings: int
+    completed_bookings: int
+    cancelled_bookings: int
+
+
+class AdminRevenueSummary(BaseModel):
+    """Dashboard revenue figures (completed bookings only)"""
+
+    total_revenue: float
+    completed_bookings: int
+    avg_booking_value: float
+
+
 # ==================== Instructor Verification Schemas ====================
 
 
@@ -167,6 +190,14 @@ class InstructorVerificationRequest(BaseModel):
     deactivate_account: bool = False  # If rejecting, optionally deactivate account
 
 
+class BulkInstructorVerificationRequest(BaseModel):
+    """Schema for verifying/rejecting several instructors in one action"""
+
+    ids: List[int] = Field(..., min_length=1)
+    is_verified: bool
+    deactivate_account: bool = False  # If rejecting, optionally deactivate accounts
+
+
 class InstructorVerificationResponse(BaseModel):
     """Schema for instructor verification response"""
 
@@ -219,6 +250,48 @@ class UserManagementResponse(BaseModel):
         from_attributes = True
 
 
+class BulkUserStatusUpdate(BaseModel):
+    """Schema for changing the status of several user accounts in one action"""
+
+    ids: List[int] = Field(..., min_length=1)
+    new_status: UserStatus
+
+
+class AdminInstructorUpdate(BaseModel):
+    """Schema for admin partial update of an instructor profile (only supplied fields change)"""
+
+    license_number: Optional[str] = None
+    license_types: Optional[str] = None
+    vehicle_registration: Optional[str] = None
+    vehicle_make: Optional[str] = None
+    vehicle_model: Optional[str] = None
+    vehicle_year: Optional[int] = None
+    province: Optional[str] = None
+    city: Optional[str] = None
+    suburb: Optional[str] = None
+    hourly_rate: Optional[float] = None
+    service_radius_km: Optional[float] = None
+    max_travel_distance_km: Optional[float] = None
+    rate_per_km_beyond_radius: Optional[float] = None
+    bio: Optional[str] = None
+    is_available: Optional[bool] = None
+
+
+class AdminStudentUpdate(BaseModel):
+    """Schema for admin partial update of a student profile (only supplied fields change)"""
+
+    address_line1: Optional[str] = None
+    address_line2: Optional[str] = None
+    city: Optional[str] = None
+    province: Optional[str] = None
+    suburb: Optional[str] = None
+    postal_code: Optional[str] = None
+    emergency_contact_name: Optional[str] = None
+    emergency_contact_phone: Optional[str] = None
+    learners_permit_number: Optional[str] = None
+    id_number: Optional[str] = None
+
+
 # ==================== Booking Oversight Schemas ====================
 
 
@@ -247,6 +320,12 @@ class BookingOverview(BaseModel):
         from_attributes = True
 
 
+class BulkBookingCancelRequest(BaseModel):
+    """Schema for cancelling several bookings in one admin action"""
+
+    ids: List[int] = Field(..., min_length=1)
+
+
 # ==================== Revenue & Analytics Schemas ====================
 
 
@@ -438,3 +438,40 @@ class StudentResponse(UserResponse):
 
     class Config:
         from_attributes = True
+
+
+# ==================== Registration Schemas ====================
+
+
+class VerificationQueued(BaseModel):
+    """Verification messages queued for sending after registration"""
+
+    status: str
+    email_queued: bool
+    whatsapp_queued: bool
+    expires_in_minutes: Optional[int] = None
+    company_owner_queued: Optional[bool] = None
+
+
+class StudentRegistrationResponse(BaseModel):
+    """Student registration response schema"""
+
+    message: str
+    user_id: int
+    student_id: int
+    verification_sent: VerificationQueued
+    note: str
+
+
+class InstructorRegistrationResponse(BaseModel):
+    """Instructor registration response schema"""
+
+    message: str
+    user_id: int
+    instructor_id: int
+    setup_token: Optional[str] = None
+    verification_status: Optional[str] = None
+    company_id: Optional[int] = None
+    is_company_owner: Optional[bool] = None
+    verification_sent: VerificationQueued
+    note: str
@@ -0,0 +1,67 @@
+"""
+Global settings held on the first admin account
+
+SMTP credentials, verification-link validity and the inactivity timeout live
+on the first admin's ``users`` row. Public endpoints (registration, the
+inactivity-timeout lookup) read them on every call, so the handful of
+columns are cached per process for a short TTL. Call
+``invalidate_admin_config()`` after writing any of them.
+
+The cache is process-local on purpose: it holds the (encrypted) SMTP
+password, which should not be copied into the shared response cache.
+"""
+
+import time
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.user import User, UserRole
+
+ADMIN_CONFIG_TTL_SECONDS = 60
+
+# Only the settings columns - no full User hydration
+_ADMIN_CONFIG_STMT = (
+    select(
+        User.smtp_email,
+        User.smtp_password,
+        User.verification_link_validity_minutes,
+        User.inactivity_timeout_minutes,
+    )
+    .where(User.role == UserRole.ADMIN)
+    .order_by(User.id)
+    .limit(1)
+)
+
+_cached: Optional[tuple[float, Optional[dict]]] = None
+_lock = Lock()
+
+
+def get_admin_config(db: Session) -> Optional[dict]:
+    """
+    Settings columns of the first admin as a dict, or None when no admin
+    exists yet. ``smtp_password`` is returned still encrypted.
+    """
+    global _cached
+
+    now = time.monotonic()
+    with _lock:
+        if _cached is not None and now < _cached[0]:
+            return _cached[1]
+
+    row = db.execute(_ADMIN_CONFIG_STMT).first()
+    config = dict(row._mapping) if row else None
+
+    with _lock:
+        _cached = (now + ADMIN_CONFIG_TTL_SECONDS, config)
+    return config
+
+
+def invalidate_admin_config() -> None:
+    """Drop the cached settings (after admin settings are saved)."""
+    global _cached
+
+    with _lock:
+        _cached = None
@@ -2,12 +2,14 @@
 Authentication service
 """
 
+import logging
 import secrets
 import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -15,7 +17,28 @@ from ..config import settings
 from ..models.availability import InstructorSchedule
 from ..models.user import Instructor, InstructorVerificationStatus, Student, User, UserRole, UserStatus
 from ..schemas.user import InstructorCreate, StudentCreate, UserCreate
-from ..utils.auth import create_access_token, get_password_hash, verify_password
+from ..utils.auth import (
+    create_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    revoke_session,
+    verify_dummy_password,
+    verify_password,
+)
+
+logger = logging.getLogger(__name__)
+
+# Login lookup, built once; only the identifier is bound per call
+_USER_BY_LOGIN_STMT = select(User).where(
+    or_(User.email == bindparam("login"), User.phone == bindparam("login"))
+)
+
+
+def _invalid_login_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Incorrect email/phone number or password",
+    )
 
 
 class AuthService:
@@ -82,9 +105,13 @@ class AuthService:
         db: Session,
         instructor_data: InstructorCreate,
         client_ip: Optional[str] = None,
+        commit: bool = True,
     ) -> tuple[User, Instructor]:
         """
         Create a new instructor with profile
+
+        With ``commit=False`` the rows are only flushed: the caller commits
+        (together with its own writes) and then calls ``after_role_created``.
         """
         try:
             # Check if email exists - allow multi-role users
@@ -108,7 +135,6 @@ class AuthService:
                 
                 # User is adding instructor role - allow phone/ID to be reused for same user
                 user = existing_user
-                print(f"[DEBUG] Adding instructor role to existing user {user.id} with email {user.email}")
             else:
                 # New user - check if ID number belongs to another user
                 existing_instructor_id = db.query(Instructor).filter(Instructor.id_number == instructor_data.id_number).first()
@@ -137,7 +163,6 @@ class AuthService:
                 )
                 db.add(user)
                 db.flush()  # Flush to get user.id without committing
-                print(f"[DEBUG] Created new user {user.id} with email {user.email} for instructor role (INACTIVE - awaiting verification)")
 
             # Record POPIA/GDPR consent (terms + channel opt-ins + IP)
             AuthService._apply_consent(user, instructor_data, client_ip)
@@ -175,10 +200,10 @@ class AuthService:
                 instructor.is_verified = True
                 instructor.verified_at = datetime.now(timezone.utc)
                 instructor.verification_status = InstructorVerificationStatus.VERIFIED.value
-                print(f"[DEBUG] Auto-verified instructor {instructor.id} (debug mode enabled)")
+                logger.info("Auto-verified instructor %s (debug mode enabled)", instructor.id)
             else:
                 instructor.verification_status = InstructorVerificationStatus.PENDING_ADMIN.value
-                print(f"[INFO] Instructor {instructor.id} created - requires manual verification")
+                logger.info("Instructor %s created - requires manual verification", instructor.id)
 
             # Generate one-time setup token for pre-auth schedule setup
             instructor.setup_token = str(uuid.uuid4())
@@ -200,7 +225,7 @@ class AuthService:
                 instructor.company_id = company.id
                 instructor.is_company_owner = True
                 # Company owner is still verified by admin (they ARE the main instructor)
-                print(f"[INFO] Created new company '{company.name}' owned by instructor {instructor.id}")
+                logger.info("Created new company '%s' owned by instructor %s", company.name, instructor.id)
 
             elif instructor_data.company_id:
                 # Join an existing company — if it already has a verified owner,
@@ -218,7 +243,11 @@ class AuthService:
                 # Generate company verification token as well
                 instructor.company_verification_token = secrets.token_urlsafe(32)
                 instructor.verification_status = InstructorVerificationStatus.PENDING_COMPANY.value
-                print(f"[INFO] Instructor {instructor.id} joining company {company.id} – pending company + admin verification")
+                logger.info(
+                    "Instructor %s joining company %s – pending company + admin verification",
+                    instructor.id,
+                    company.id,
+                )
 
             # —— Schedule ——
             for slot in instructor_data.schedule:
@@ -231,20 +260,16 @@ class AuthService:
                 )
                 db.add(schedule_entry)
 
+            if not commit:
+                # Surface constraint violations here, where they get a clear message
+                db.flush()
+                return user, instructor
+
             # Commit everything
             db.commit()
             db.refresh(user)
             db.refresh(instructor)
-
-            # Trigger backup after successful role creation
-            try:
-                from .backup_scheduler import backup_scheduler
-                backup_scheduler.create_backup(
-                    f"role_creation_instructor_{user.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                )
-            except Exception as e:
-                # Log but don't fail the request if backup fails
-                print(f"Warning: Backup after instructor role creation failed: {e}")
+            AuthService.after_role_created(user.id, "instructor")
 
             return user, instructor
 
@@ -273,9 +298,13 @@ class AuthService:
         db: Session,
         student_data: StudentCreate,
         client_ip: Optional[str] = None,
+        commit: bool = True,
     ) -> tuple[User, Student]:
         """
         Create a new student with profile
+
+        With ``commit=False`` the rows are only flushed: the caller commits
+        (together with its own writes) and then calls ``after_role_created``.
         """
         try:
             # Check if email exists - allow multi-role users
@@ -351,20 +380,16 @@ class AuthService:
 
             db.add(student)
 
+            if not commit:
+                # Surface constraint violations here, where they get a clear message
+                db.flush()
+                return user, student
+
             # Commit both user and student together
             db.commit()
             db.refresh(user)
             db.refresh(student)
-
-            # Trigger backup after successful role creation
-            try:
-                from .backup_scheduler import backup_scheduler
-                backup_scheduler.create_backup(
-                    f"role_creation_student_{user.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                )
-            except Exception as e:
-                # Log but don't fail the request if backup fails
-                print(f"Warning: Backup after student role creation failed: {e}")
+            AuthService.after_role_created(user.id, "student")
 
             return user, student
 
@@ -382,6 +407,27 @@ class AuthService:
             db.rollback()
             raise
 
+    @staticmethod
+    def after_role_created(user_id: int, role: str) -> None:
+        """
+        Post-commit housekeeping for a new student/instructor profile:
+        refresh the admin pending list (instructors start unverified) and
+        take a backup.
+        """
+        if role == "instructor":
+            from ..routes.admin import invalidate_pending_instructors_cache
+
+            invalidate_pending_instructors_cache()
+
+        try:
+            from .backup_scheduler import backup_scheduler
+            backup_scheduler.create_backup(
+                f"role_creation_{role}_{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            )
+        except Exception as e:
+            # Log but don't fail the request if backup fails
+            logger.warning("Backup after %s role creation failed: %s", role, e)
+
     @staticmethod
     def authenticate_user(db: Session, email_or_phone: str, password: str) -> Optional[User]:
         """
@@ -389,19 +435,16 @@ class AuthService:
         Raises HTTPException with specific error messages
         """
         # Try to find user by email or phone
-        user = db.query(User).filter((User.email == email_or_phone) | (User.phone == email_or_phone)).first()
+        user = db.execute(_USER_BY_LOGIN_STMT, {"login": email_or_phone}).scalars().first()
 
+        # Unknown account and wrong password get the same response and the
+        # same hashing cost, so neither reveals which accounts exist
         if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User does not exist. Please register first.",
-            )
+            verify_dummy_password(password)
+            raise _invalid_login_error()
 
         if not verify_password(password, user.password_hash):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect password",
-            )
+            raise _invalid_login_error()
 
         # Check user status - only active users can log in
         from ..models.user import UserStatus
@@ -417,6 +460,10 @@ class AuthService:
                 detail="Your account is SUSPENDED. Please contact support for more information.",
             )
 
+        # Upgrade legacy / higher-cost hashes while we have the plaintext
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = get_password_hash(password)
+
         # Update last login
         user.last_login = datetime.now(timezone.utc)
         db.commit()
@@ -430,17 +477,19 @@ class AuthService:
         The JWT embeds a `jti` claim that must match `user.active_session_token` on every request.
         """
         selected_role = role or user.role.value
-        print(f"🔑 [CREATE_TOKEN] User: {user.email}, role param: {role}, user.role: {user.role.value}, selected_role: {selected_role}")
+        logger.debug("Creating token for user %s with role %s", user.id, selected_role)
 
         # Generate a unique session token (JWT ID)
         session_token = str(uuid.uuid4())
 
         # Persist the session token so we can validate it on every authenticated request
         if db is not None:
+            previous_session = user.active_session_token
             user.active_session_token = session_token
             db.commit()
+            # The replaced session's token may still be unexpired elsewhere
+            if previous_session:
+                revoke_session(previous_session)
 
         token_data = {"sub": str(user.id), "email": user.email, "role": selected_role}
-        print(f"🔑 [CREATE_TOKEN] Token data: {token_data}")
-
         return create_access_token(token_data, jti=session_token)
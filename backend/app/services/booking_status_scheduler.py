@@ -0,0 +1,93 @@
+"""
+Booking status scheduler - Marks past PENDING bookings as COMPLETED
+"""
+
+import asyncio
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+class BookingStatusScheduler:
+    """Background task that keeps booking statuses current so read endpoints stay read-only"""
+
+    def __init__(self, interval_minutes: int = 5):
+        """
+        Initialize scheduler
+
+        Args:
+            interval_minutes: How often to sweep past bookings (default: every 5 minutes)
+        """
+        self.interval_minutes = interval_minutes
+        self._task = None
+        self._running = False
+
+    async def start(self):
+        """Start the background sweep task"""
+        if self._running:
+            logger.warning("Booking status scheduler already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_scheduler())
+        logger.info(
+            "Booking status scheduler started (runs every %s minutes)", self.interval_minutes
+        )
+
+    async def stop(self):
+        """Stop the background sweep task"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Booking status scheduler stopped")
+
+    async def _run_scheduler(self):
+        """Main scheduler loop"""
+        while self._running:
+            try:
+                # Blocking DB work - run it off the event loop
+                await run_in_threadpool(self._complete_past_bookings)
+                await asyncio.sleep(self.interval_minutes * 60)
+            except asyncio.CancelledError:
+                logger.info("Booking status scheduler cancelled")
+                break
+            except Exception as e:
+                logger.error("Error in booking status scheduler: %s", e)
+                await asyncio.sleep(60)
+
+    @staticmethod
+    def _complete_past_bookings():
+        """Run auto_update_past_bookings in a short-lived session"""
+        from ..database import SessionLocal
+        from ..routes.admin import STATS_CACHE_NAMESPACE
+        from ..routes.bookings import auto_update_past_bookings
+        from ..utils.response_cache import response_cache
+
+        if SessionLocal is None:
+            return
+        db = SessionLocal()
+        try:
+            updated = auto_update_past_bookings(db)
+            if updated:
+                logger.info("Booking status sweep: marked %s booking(s) completed", updated)
+                # Completed counts/revenue on the admin dashboard just changed
+                response_cache.clear(STATS_CACHE_NAMESPACE)
+        except Exception as e:
+            db.rollback()
+            logger.error("Failed to update past bookings: %s", e)
+        finally:
+            db.close()
+
+
+# Global scheduler instance
+booking_status_scheduler = BookingStatusScheduler(interval_minutes=5)
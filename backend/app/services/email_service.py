@@ -4,8 +4,10 @@ Email Service for sending password reset emails
 
 import logging
 import smtplib
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from threading import Lock, Thread
 from typing import Optional
 
 from ..config import settings
@@ -13,6 +15,173 @@ from .notifiers.base import EmailNotifier
 
 logger = logging.getLogger(__name__)
 
+# Registration and booking flows send several messages from the same account
+# back to back. Authenticated SMTP connections are pooled per account and
+# reused, so only the first message pays the TCP + STARTTLS + AUTH handshake.
+# Each send checks a connection out, so concurrent sends still run in
+# parallel. Connections idle longer than this are closed by a reaper thread
+# (servers drop them anyway); the reaper exits when nothing is left idle.
+SMTP_SESSION_IDLE_SECONDS = 60
+# Idle connections kept per account; extras are closed when returned.
+SMTP_POOL_MAX_IDLE = 4
+
+
+def _quit(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+class _SMTPPool:
+    """Idle authenticated connections for one SMTP account (smtplib isn't thread-safe, so one user each)."""
+
+    def __init__(self, host: str, port: int, username: str, password: str):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self._idle: list[tuple[smtplib.SMTP, float]] = []  # (connection, last used)
+        self._lock = Lock()
+        self._closed = False
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=30)
+        try:
+            server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _checkout(self) -> Optional[smtplib.SMTP]:
+        """Most recently used idle connection that is still fresh, if any."""
+        now = time.monotonic()
+        stale = []
+        server = None
+        with self._lock:
+            while self._idle:
+                candidate, last_used = self._idle.pop()
+                if now - last_used <= SMTP_SESSION_IDLE_SECONDS:
+                    server = candidate
+                    break
+                stale.append(candidate)
+        for old in stale:
+            _quit(old)
+        return server
+
+    def _checkin(self, server: smtplib.SMTP) -> None:
+        with self._lock:
+            if not self._closed and len(self._idle) < SMTP_POOL_MAX_IDLE:
+                self._idle.append((server, time.monotonic()))
+                server = None
+        if server is not None:
+            _quit(server)
+        else:
+            _ensure_reaper()
+
+    def send(self, msg: MIMEMultipart) -> None:
+        server = self._checkout()
+        reused = server is not None
+        if not reused:
+            server = self._connect()
+        try:
+            server.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            _quit(server)
+            if not reused:
+                raise
+            # The kept-open connection went stale; retry once on a fresh one
+            server = self._connect()
+            try:
+                server.send_message(msg)
+            except Exception:
+                _quit(server)
+                raise
+        except Exception:
+            # Leave no half-finished transaction on a pooled connection
+            _quit(server)
+            raise
+        self._checkin(server)
+
+    def reap(self) -> None:
+        """Close connections idle past SMTP_SESSION_IDLE_SECONDS."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [srv for srv, last_used in self._idle if now - last_used > SMTP_SESSION_IDLE_SECONDS]
+            self._idle = [(srv, ts) for srv, ts in self._idle if now - ts <= SMTP_SESSION_IDLE_SECONDS]
+        for server in expired:
+            _quit(server)
+
+    def has_idle(self) -> bool:
+        with self._lock:
+            return bool(self._idle)
+
+    def close(self) -> None:
+        """Close every idle connection; connections in use are closed when returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            _quit(server)
+
+
+# One pool per (host, port, username). A credential change replaces the pool,
+# so an old password is never kept around.
+_smtp_pools: dict[tuple[str, int, str], _SMTPPool] = {}
+_smtp_pools_lock = Lock()
+_reaper: Optional[Thread] = None
+
+
+def _smtp_pool(host: str, port: int, username: str, password: str) -> _SMTPPool:
+    key = (host, port, username)
+    replaced = None
+    with _smtp_pools_lock:
+        pool = _smtp_pools.get(key)
+        if pool is None or pool.password != password:
+            replaced = pool
+            pool = _smtp_pools[key] = _SMTPPool(host, port, username, password)
+    if replaced is not None:
+        replaced.close()
+    return pool
+
+
+def _ensure_reaper() -> None:
+    """Start the idle-connection reaper unless it is already running."""
+    global _reaper
+
+    with _smtp_pools_lock:
+        if _reaper is None:
+            _reaper = Thread(target=_reap_idle_connections, name="smtp-reaper", daemon=True)
+            _reaper.start()
+
+
+def _reap_idle_connections() -> None:
+    global _reaper
+
+    while True:
+        time.sleep(SMTP_SESSION_IDLE_SECONDS / 2)
+        with _smtp_pools_lock:
+            pools = list(_smtp_pools.values())
+        for pool in pools:
+            pool.reap()
+        # Decided under the registry lock so a concurrent checkin either sees
+        # this thread still running or starts a new one
+        with _smtp_pools_lock:
+            if not any(pool.has_idle() for pool in _smtp_pools.values()):
+                _reaper = None
+                return
+
+
+def close_smtp_sessions() -> None:
+    """Close all pooled SMTP connections (application shutdown)."""
+    with _smtp_pools_lock:
+        pools = list(_smtp_pools.values())
+        _smtp_pools.clear()
+    for pool in pools:
+        pool.close()
+
 
 class EmailService(EmailNotifier):
     """Service for sending emails via SMTP."""
@@ -50,10 +219,9 @@ class EmailService(EmailNotifier):
     def _smtp_send(self, msg: MIMEMultipart) -> None:
         """Apply compliance headers and dispatch a prepared MIME message."""
         self._apply_compliance_headers(msg)
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            server.send_message(msg)
+        _smtp_pool(
+            self.smtp_server, self.smtp_port, self.smtp_username, self.smtp_password
+        ).send(msg)
 
     def send_email(
         self,
@@ -9,11 +9,29 @@ from ..models.user import User, UserRole
 class InitializationService:
     """Service to manage system initialization status"""
 
+    # Engine on which an admin has been seen. Once the system is initialised
+    # it stays that way, so registration skips the lookup; switching
+    # databases (setup wizard) or a full reset starts over.
+    _admin_seen_on = None
+
     @staticmethod
     def admin_exists(db: Session) -> bool:
         """Check if any admin user exists"""
-        admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
-        return admin is not None
+        bind = db.get_bind()
+        if InitializationService._admin_seen_on is bind:
+            return True
+        exists = (
+            db.query(User.id).filter(User.role == UserRole.ADMIN).limit(1).scalar()
+            is not None
+        )
+        if exists:
+            InitializationService._admin_seen_on = bind
+        return exists
+
+    @staticmethod
+    def forget_admin_exists() -> None:
+        """Re-check on the next call (after users were wiped)"""
+        InitializationService._admin_seen_on = None
 
     @staticmethod
     def get_initialization_status(db: Session) -> dict:
@@ -22,10 +22,12 @@ class InstructorVerificationService:
     def create_verification_token(
         db: Session,
         instructor_id: int,
-        validity_minutes: int = 60
+        validity_minutes: int = 60,
+        commit: bool = True,
     ) -> InstructorVerificationToken:
         """
-        Create an instructor verification token
+        Create an instructor verification token (``commit=False`` only
+        flushes, for callers committing it with their own writes)
         """
         token = secrets.token_urlsafe(32)
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=validity_minutes)
@@ -37,9 +39,12 @@ class InstructorVerificationService:
         )
         
         db.add(verification_token)
-        db.commit()
-        db.refresh(verification_token)
-        
+        if commit:
+            db.commit()
+            db.refresh(verification_token)
+        else:
+            db.flush()
+
         return verification_token
 
     @staticmethod
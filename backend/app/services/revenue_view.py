@@ -0,0 +1,225 @@
+"""
+Revenue materialized views (PostgreSQL only)
+
+``mv_instructor_revenue`` pre-aggregates completed-booking earnings per
+instructor so /admin/revenue/stats can read its top-10 list from an indexed
+view instead of re-running the instructors/users/bookings JOIN + GROUP BY on
+every request. ``mv_revenue_stats`` holds completed/pending revenue and the
+completed count per instructor, so the headline totals are a SUM over one
+small row per instructor rather than a scan of ``bookings``.
+
+Both views are refreshed every few minutes by ``revenue_view_scheduler``; on
+other databases (SQLite dev installs) callers fall back to the live
+aggregate queries.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+VIEW_NAME = "mv_instructor_revenue"
+STATS_VIEW_NAME = "mv_revenue_stats"
+
+_CREATE_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {VIEW_NAME} AS
+SELECT i.id AS instructor_id,
+       u.first_name,
+       u.last_name,
+       SUM(b.amount) AS total_earnings,
+       COUNT(b.id) AS booking_count
+FROM instructors i
+JOIN users u ON u.id = i.user_id
+JOIN bookings b ON b.instructor_id = i.id
+WHERE b.status = 'COMPLETED'
+GROUP BY i.id, u.first_name, u.last_name
+"""
+
+_CREATE_STATS_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {STATS_VIEW_NAME} AS
+SELECT b.instructor_id,
+       COALESCE(SUM(b.amount) FILTER (WHERE b.status = 'COMPLETED'), 0) AS completed_revenue,
+       COUNT(*) FILTER (WHERE b.status = 'COMPLETED') AS completed_count,
+       COALESCE(SUM(b.amount) FILTER (WHERE b.status = 'PENDING'), 0) AS pending_revenue
+FROM bookings b
+WHERE b.status IN ('COMPLETED', 'PENDING')
+GROUP BY b.instructor_id
+"""
+
+_CREATE_INDEXES_SQL = (
+    # Unique indexes are required for REFRESH ... CONCURRENTLY
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{VIEW_NAME}_instructor_id ON {VIEW_NAME}(instructor_id)",
+    f"CREATE INDEX IF NOT EXISTS ix_{VIEW_NAME}_total_earnings ON {VIEW_NAME}(total_earnings DESC)",
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{STATS_VIEW_NAME}_instructor_id ON {STATS_VIEW_NAME}(instructor_id)",
+)
+
+# Set once ensure_view() has succeeded in this process
+_view_ready = False
+
+
+def ensure_view(engine) -> bool:
+    """Create the materialized views and their indexes if missing. Idempotent."""
+    global _view_ready
+
+    if engine is None or engine.dialect.name != "postgresql":
+        return False
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(_CREATE_VIEW_SQL))
+            conn.execute(text(_CREATE_STATS_VIEW_SQL))
+            for stmt in _CREATE_INDEXES_SQL:
+                conn.execute(text(stmt))
+            conn.commit()
+        _view_ready = True
+    except Exception as exc:
+        logger.warning("Could not create revenue views: %s", exc)
+        _view_ready = False
+    return _view_ready
+
+
+def refresh_view(db: Session) -> None:
+    """Re-aggregate the views without blocking concurrent readers."""
+    if not _view_ready:
+        return
+    db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {VIEW_NAME}"))
+    db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATS_VIEW_NAME}"))
+    db.commit()
+
+
+def fetch_revenue_totals(db: Session, instructor_id: Optional[int] = None) -> Optional[dict]:
+    """
+    Completed/pending revenue and completed booking count from the view, or
+    None when the view is not available (caller should query bookings).
+    """
+    if not _view_ready or db.get_bind().dialect.name != "postgresql":
+        return None
+
+    sql = (
+        f"SELECT COALESCE(SUM(completed_revenue), 0) AS completed_revenue, "
+        f"COALESCE(SUM(completed_count), 0) AS completed_count, "
+        f"COALESCE(SUM(pending_revenue), 0) AS pending_revenue "
+        f"FROM {STATS_VIEW_NAME}"
+    )
+    params: dict = {}
+    if instructor_id:
+        sql += " WHERE instructor_id = :instructor_id"
+        params["instructor_id"] = instructor_id
+
+    row = db.execute(text(sql), params).one()
+    return {
+        "total_revenue": float(row.completed_revenue),
+        "pending_revenue": float(row.pending_revenue),
+        "completed_bookings": int(row.completed_count),
+    }
+
+
+def fetch_top_instructors(
+    db: Session, instructor_id: Optional[int] = None, limit: int = 10
+) -> Optional[list[dict]]:
+    """
+    Top earning instructors from the view, or None when the view is not
+    available (caller should then run the live aggregate query).
+    """
+    if not _view_ready or db.get_bind().dialect.name != "postgresql":
+        return None
+
+    sql = (
+        f"SELECT instructor_id, first_name, last_name, total_earnings, booking_count "
+        f"FROM {VIEW_NAME}"
+    )
+    params: dict = {"limit": limit}
+    if instructor_id:
+        sql += " WHERE instructor_id = :instructor_id"
+        params["instructor_id"] = instructor_id
+    sql += " ORDER BY total_earnings DESC LIMIT :limit"
+
+    rows = db.execute(text(sql), params).all()
+    return [
+        {
+            "instructor_id": row.instructor_id,
+            "name": f"{row.first_name} {row.last_name}",
+            "total_earnings": float(row.total_earnings),
+            "booking_count": row.booking_count,
+        }
+        for row in rows
+    ]
+
+
+class RevenueViewScheduler:
+    """Background task that periodically refreshes the revenue views"""
+
+    def __init__(self, interval_minutes: int = 5):
+        """
+        Initialize scheduler
+
+        Args:
+            interval_minutes: How often to refresh the view (default: every 5 minutes)
+        """
+        self.interval_minutes = interval_minutes
+        self._task = None
+        self._running = False
+
+    async def start(self):
+        """Start the background refresh task"""
+        if self._running:
+            logger.warning("Revenue view scheduler already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_scheduler())
+        logger.info(
+            "Revenue view scheduler started (refreshes every %s minutes)", self.interval_minutes
+        )
+
+    async def stop(self):
+        """Stop the background refresh task"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Revenue view scheduler stopped")
+
+    async def _run_scheduler(self):
+        """Main scheduler loop"""
+        while self._running:
+            try:
+                await asyncio.sleep(self.interval_minutes * 60)
+                # Blocking DB work - run it off the event loop
+                await run_in_threadpool(self._refresh)
+            except asyncio.CancelledError:
+                logger.info("Revenue view scheduler cancelled")
+                break
+            except Exception as e:
+                logger.error("Error in revenue view scheduler: %s", e)
+
+    @staticmethod
+    def _refresh():
+        """Refresh the views in a short-lived session"""
+        from ..database import SessionLocal
+
+        if SessionLocal is None:
+            return
+        db = SessionLocal()
+        try:
+            refresh_view(db)
+        except Exception as e:
+            db.rollback()
+            logger.error("Failed to refresh revenue views: %s", e)
+        finally:
+            db.close()
+
+
+# Global scheduler instance
+revenue_view_scheduler = RevenueViewScheduler(interval_minutes=5)
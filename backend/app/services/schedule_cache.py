@@ -0,0 +1,19 @@
+"""
+Cached instructor schedule / time-off payloads
+
+Instructor weekly schedules and time-off change rarely but are re-read on
+every calendar render, so the admin views cache them per instructor. Any
+route that writes a schedule or time-off entry calls
+``invalidate_instructor_schedule_cache()``.
+"""
+
+from ..utils.response_cache import response_cache
+
+SCHEDULE_CACHE_NAMESPACE = "instructor_schedule"
+SCHEDULE_CACHE_TTL_SECONDS = 60
+
+
+def invalidate_instructor_schedule_cache(instructor_id: int) -> None:
+    """Drop cached schedule and time-off payloads for one instructor."""
+    response_cache.delete(SCHEDULE_CACHE_NAMESPACE, f"{instructor_id}:schedule")
+    response_cache.delete(SCHEDULE_CACHE_NAMESPACE, f"{instructor_id}:time_off")
@@ -44,7 +44,8 @@ class VerificationService:
         db: Session,
         user_id: int,
         token_type: str,
-        validity_minutes: int = 30
+        validity_minutes: int = 30,
+        commit: bool = True,
     ) -> VerificationToken:
         """
         Create a new verification token
@@ -54,6 +55,8 @@ class VerificationService:
             user_id: ID of the user to verify
             token_type: Type of token ("email" or "phone")
             validity_minutes: How long the token is valid (default 30 minutes)
+            commit: Commit now; pass False to only flush and let the caller
+                commit it together with its own writes
 
         Returns:
             VerificationToken object
@@ -69,8 +72,11 @@ class VerificationService:
         )
 
         db.add(verification_token)
-        db.commit()
-        db.refresh(verification_token)
+        if commit:
+            db.commit()
+            db.refresh(verification_token)
+        else:
+            db.flush()
 
         logger.info(f"Created {token_type} verification token for user {user_id}, expires at {expires_at}")
         return verification_token
@@ -147,7 +153,8 @@ class VerificationService:
         admin_smtp_email: str = None,
         admin_smtp_password: str = None,
         notify_admins: bool = False,
-        user_type: str = "user"
+        user_type: str = "user",
+        validity_minutes: Optional[int] = None,
     ) -> dict:
         """
         Send verification email and WhatsApp message to user and optionally notify admins
@@ -161,6 +168,8 @@ class VerificationService:
             admin_smtp_password: Admin's Gmail app password
             notify_admins: Whether to notify all admins about new registration
             user_type: Type of user ("student", "instructor", "admin")
+            validity_minutes: Link validity shown in the messages (looked up
+                from the admin settings when not given)
 
         Returns:
             dict with email_sent, whatsapp_sent, and admin_notifications_sent status
@@ -169,14 +178,30 @@ class VerificationService:
         logger.info("Verification link base URL: %s", frontend_url)
         logger.info("Verification link generated: %s", verification_link)
         
-        # Get admin settings from first admin user
-        admin = db.query(User).filter(User.role == "admin").first()
-        validity_minutes = admin.verification_link_validity_minutes if admin else 30
+        # Get admin settings from first admin user (callers that already
+        # hold them pass validity_minutes)
+        if validity_minutes is None:
+            admin = db.query(User).filter(User.role == "admin").first()
+            validity_minutes = admin.verification_link_validity_minutes if admin else 30
+
+        # One sender per channel for the user and every admin notification.
+        # WhatsAppService() reads and decrypts the admin's Twilio credentials
+        # and builds a client, so it's constructed once here rather than per
+        # message (fresh per call, so credential changes still apply).
+        email_service = (
+            EmailService(admin_smtp_email, admin_smtp_password)
+            if admin_smtp_email and admin_smtp_password
+            else None
+        )
+        try:
+            whatsapp_service = WhatsAppService()
+        except Exception as e:
+            logger.error(f"Failed to initialise WhatsApp service: {str(e)}")
+            whatsapp_service = None
 
         # Send email to user
         email_sent = False
-        if admin_smtp_email and admin_smtp_password:
-            email_service = EmailService(admin_smtp_email, admin_smtp_password)
+        if email_service is not None:
             email_sent = email_service.send_verification_email(
                 to_email=user.email,
                 first_name=user.first_name,
@@ -189,13 +214,13 @@ class VerificationService:
         # Send WhatsApp to user
         whatsapp_sent = False
         try:
-            whatsapp_service = WhatsAppService()
-            whatsapp_sent = whatsapp_service.send_verification_message(
-                phone=user.phone,
-                first_name=user.first_name,
-                verification_link=verification_link,
-                validity_minutes=validity_minutes
-            )
+            if whatsapp_service is not None:
+                whatsapp_sent = whatsapp_service.send_verification_message(
+                    phone=user.phone,
+                    first_name=user.first_name,
+                    verification_link=verification_link,
+                    validity_minutes=validity_minutes
+                )
         except Exception as e:
             logger.error(f"Failed to send WhatsApp verification to {user.phone}: {str(e)}")
 
@@ -204,16 +229,16 @@ class VerificationService:
         admin_whatsapp_sent = 0
         if notify_admins:
             all_admins = db.query(User).filter(User.role == "admin").all()
-            
+            student_name = f"{user.first_name} {user.last_name}"
+
             for admin_user in all_admins:
                 # Send email notification to admin
-                if admin_smtp_email and admin_smtp_password:
+                if email_service is not None:
                     try:
-                        email_service = EmailService(admin_smtp_email, admin_smtp_password)
                         admin_email_sent = email_service.send_admin_student_registration_notification(
                             admin_email=admin_user.email,
                             admin_name=admin_user.first_name,
-                            student_name=f"{user.first_name} {user.last_name}",
+                            student_name=student_name,
                             student_email=user.email,
                             student_phone=user.phone,
                             verification_link=verification_link
@@ -224,12 +249,13 @@ class VerificationService:
                         logger.error(f"Failed to send admin email notification to {admin_user.email}: {str(e)}")
                 
                 # Send WhatsApp notification to admin
+                if whatsapp_service is None:
+                    continue
                 try:
-                    whatsapp_service = WhatsAppService()
                     admin_wa_sent = whatsapp_service.send_admin_student_registration_notification(
                         admin_phone=admin_user.phone,
                         admin_name=admin_user.first_name,
-                        student_name=f"{user.first_name} {user.last_name}",
+                        student_name=student_name,
                         student_email=user.email,
                         student_phone=user.phone,
                         verification_link=verification_link
@@ -2,32 +2,156 @@
 Authentication utilities for JWT and password hashing
 """
 
+import base64
+import hashlib
+import hmac
+import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from threading import BoundedSemaphore, Lock
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from ..config import settings
+from .response_cache import response_cache
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context - built once per process and shared by every
+# hash/verify call. New hashes are argon2id (memory-hard, so a modest time
+# cost gives the same resistance as a much slower bcrypt); existing bcrypt
+# hashes still verify and are marked deprecated, so they're rehashed on the
+# user's next successful login. Costs are pinned via the ARGON2_* settings.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# Hashing is pure CPU. The auth handlers run in FastAPI's threadpool, so
+# cap concurrent hash/verify calls at the core count - a burst of logins
+# then queues here instead of oversubscribing the CPU for every other
+# request on the worker.
+_hash_slots = BoundedSemaphore(os.cpu_count() or 1)
+
+# Verified JWT payloads, keyed by a digest of the raw token. Clients reuse the
+# same token for every request until it expires, so the signature check only
+# has to run once per token per process. Failed decodes are never cached.
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache: dict[bytes, tuple[float, Mapping]] = {}
+_token_cache_lock = Lock()
+
+# Revoked session IDs (the JWT ``jti``), held until the token would have
+# expired anyway. Stored through the response cache, so on Redis the list is
+# shared by every worker and a logged-out or superseded token is turned away
+# before get_current_user touches the database.
+REVOKED_SESSION_NAMESPACE = "revoked_jti"
+
+
+# Marks hashes of HMAC-SHA256(pepper, password) as
+# ``hmac-sha256$<pepper id>$<passlib hash>``; the part after the id is a
+# regular passlib hash (argon2id, or bcrypt for hashes written before the
+# switch). The id says which pepper to verify with, so a rotated pepper can
+# still check older hashes. Hashes written before ids were recorded have an
+# empty id and used the current pepper. Without a pepper configured,
+# passwords are hashed unprefixed.
+PEPPERED_HASH_PREFIX = "hmac-sha256$"
+
+if "$" in settings.PASSWORD_PEPPER_ID:
+    raise ValueError("PASSWORD_PEPPER_ID must not contain '$'")
+
+
+def _pepper_keys() -> dict[str, str]:
+    """Pepper id -> key: the current pepper, retired ones, and the unversioned form"""
+    keys = {"": settings.PASSWORD_PEPPER}
+    for entry in settings.PASSWORD_PEPPERS_PREVIOUS.split(","):
+        pepper_id, sep, key = entry.strip().partition(":")
+        if sep and key:
+            keys[pepper_id] = key
+    if settings.PASSWORD_PEPPER:
+        keys[settings.PASSWORD_PEPPER_ID] = settings.PASSWORD_PEPPER
+    return keys
+
+
+_PEPPER_KEYS = _pepper_keys()
+
+
+def _prehash(password: str, pepper: str) -> str:
+    """
+    Peppered HMAC of the password, base64-encoded (44 chars) - fits bcrypt's
+    72-byte input limit whatever the password length, and contains no NULs.
+    Kept for argon2 too, so both schemes hash the same input.
+    """
+    digest = hmac.new(pepper.encode("utf-8"), password.encode("utf-8"), hashlib.sha256).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _split_peppered(hashed_password: str) -> tuple[Optional[str], str]:
+    """(pepper id, passlib hash); the id is None for unpeppered hashes"""
+    if not hashed_password.startswith(PEPPERED_HASH_PREFIX):
+        return None, hashed_password
+    pepper_id, _, inner = hashed_password[len(PEPPERED_HASH_PREFIX):].partition("$")
+    # Passlib hashes start with '$', so the separator is followed by another
+    return pepper_id, "$" + inner
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against its hash
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    pepper_id, inner = _split_peppered(hashed_password)
+    if pepper_id is not None:
+        pepper = _PEPPER_KEYS.get(pepper_id)
+        if pepper is None:
+            # Hashed with a pepper that is no longer configured
+            return False
+        plain_password = _prehash(plain_password, pepper)
+    with _hash_slots:
+        return pwd_context.verify(plain_password, inner)
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password (bcrypt has 72-byte limit)
+    Hash a password (peppered HMAC prehash when a pepper is set, then argon2id)
     """
-    # Truncate password to 72 bytes to comply with bcrypt limitation
-    password_bytes = password.encode("utf-8")[:72]
-    return pwd_context.hash(password_bytes.decode("utf-8", errors="ignore"))
+    if not settings.PASSWORD_PEPPER:
+        with _hash_slots:
+            return pwd_context.hash(password)
+    prefix = f"{PEPPERED_HASH_PREFIX}{settings.PASSWORD_PEPPER_ID}"
+    with _hash_slots:
+        return prefix + pwd_context.hash(_prehash(password, settings.PASSWORD_PEPPER))
+
+
+# Peppered hash of a throwaway password, built once per process on first use.
+# Checked against when no account matches, so a missing user costs the same
+# hashing work as a wrong password.
+_dummy_password_hash: Optional[str] = None
+
+
+def verify_dummy_password(plain_password: str) -> None:
+    """Spend one verify_password() worth of CPU without a real hash to check"""
+    global _dummy_password_hash
+
+    if _dummy_password_hash is None:
+        _dummy_password_hash = get_password_hash(base64.b64encode(os.urandom(24)).decode("ascii"))
+    verify_password(plain_password, _dummy_password_hash)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True for hashes not made with the current pepper (or made with one when
+    none is configured any more), bcrypt hashes and outdated argon2 costs
+    """
+    pepper_id, inner = _split_peppered(hashed_password)
+    current_id = settings.PASSWORD_PEPPER_ID if settings.PASSWORD_PEPPER else None
+    if pepper_id != current_id:
+        return True
+    return pwd_context.needs_update(inner)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None, jti: Optional[str] = None) -> str:
@@ -61,3 +185,72 @@ def decode_access_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def forget_access_token(token: str) -> None:
+    """Drop a token's cached payload (on logout)."""
+    with _token_cache_lock:
+        _token_cache.pop(_token_cache_key(token), None)
+
+
+def decode_access_token_cached(token: str) -> Optional[Mapping]:
+    """
+    decode_access_token() with a per-process cache of verified payloads.
+
+    Entries live for TOKEN_CACHE_TTL_SECONDS or until the token's own ``exp``,
+    whichever comes first. The payload is returned read-only and shared
+    between callers, so a cache hit allocates nothing.
+    """
+    key = _token_cache_key(token)
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if now < expires_at:
+                return payload
+            _token_cache.pop(key, None)
+
+    decoded = decode_access_token(token)
+    if decoded is None:
+        return None
+    payload = MappingProxyType(decoded)
+
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+    if expires_at > now:
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+                # Drop expired entries first; if still full, evict the oldest insert
+                for k in [k for k, (exp_at, _) in _token_cache.items() if exp_at <= now]:
+                    _token_cache.pop(k, None)
+                if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+                    _token_cache.pop(next(iter(_token_cache)), None)
+            _token_cache[key] = (expires_at, payload)
+    return payload
+
+
+def _session_key(jti: str) -> str:
+    return hashlib.blake2b(jti.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def revoke_session(jti: str, ttl_seconds: Optional[int] = None) -> None:
+    """
+    Deny a session ID for ``ttl_seconds`` (default: a full token lifetime,
+    for callers that don't know when the token expires).
+    """
+    if ttl_seconds is None:
+        ttl_seconds = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    if ttl_seconds > 0:
+        response_cache.set(REVOKED_SESSION_NAMESPACE, _session_key(jti), 1, ttl_seconds)
+
+
+def is_session_revoked(jti: str) -> bool:
+    """True if the session ID was revoked by logout or a newer login"""
+    return response_cache.get(REVOKED_SESSION_NAMESPACE, _session_key(jti)) is not None
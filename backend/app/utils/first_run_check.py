@@ -24,6 +24,7 @@ IMPORT_TO_PACKAGE = {
     "psycopg2": "psycopg2-binary",
     "jose": "python-jose[cryptography]",
     "passlib": "passlib",
+    "argon2": "argon2-cffi",
     "bcrypt": "bcrypt",
     "pydantic_settings": "pydantic-settings",
     "dotenv": "python-dotenv",
@@ -3,11 +3,16 @@ Rate Limiting Utility
 Prevents brute force attacks on authentication and critical endpoints
 """
 
+import hashlib
 import logging
+import math
 import os
+import time
+from threading import Lock
 
 import redis
-from fastapi import Request, Response
+from fastapi import HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
@@ -34,28 +39,200 @@ limiter = Limiter(
     key_func=get_remote_address,  # Rate limit by IP address
     storage_uri=storage_uri,
     headers_enabled=True,  # Add X-RateLimit-* headers to responses
-    strategy="fixed-window",  # Fixed time window strategy
+    # Rolling window: a fixed window admits up to 2x the limit across a
+    # window boundary. On Redis the check-and-record runs as one Lua script,
+    # so the limit holds across workers.
+    strategy="moving-window",
     enabled=os.getenv("RATE_LIMIT_ENABLED", "true").lower() != "false",
 )
 
+# Stable code for clients to branch on (X-Error-Code header / "code" field)
+RATE_LIMITED_ERROR_CODE = "RATE_LIMITED"
+
+# OpenAPI entry for rate-limited routes: responses=RATE_LIMITED_RESPONSES
+RATE_LIMITED_RESPONSES = {
+    429: {
+        "description": "Rate limit exceeded",
+        "headers": {
+            "Retry-After": {
+                "description": "Seconds to wait before retrying",
+                "schema": {"type": "integer"},
+            },
+            "X-Error-Code": {
+                "description": RATE_LIMITED_ERROR_CODE,
+                "schema": {"type": "string"},
+            },
+        },
+    },
+}
+
+# Token bucket refill + take in one atomic server-side step, timed by the
+# Redis clock so every worker/replica agrees. Returns {allowed, tokens_left}.
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, tostring(tokens)}
+"""
+
+_token_bucket_script = redis_client.register_script(_TOKEN_BUCKET_LUA) if redis_client else None
+
+
+# Cap on in-process buckets per limiter (Redis-less fallback only); full
+# buckets are dropped first since they hold no state.
+LOCAL_BUCKETS_MAX_ENTRIES = 10_000
+
+
+class RateLimit:
+    """
+    Per-IP token bucket, used as a route dependency:
+
+        @router.post("/login", dependencies=[Depends(RateLimit("login", 5, 60))])
+
+    Allows ``capacity`` requests per ``per_seconds``, refilled continuously.
+    Shared across workers via Redis; falls back to an in-process bucket
+    (single worker only) when Redis is unavailable.
+    """
+
+    def __init__(self, scope: str, capacity: int, per_seconds: int):
+        self.scope = scope
+        self.capacity = capacity
+        self.rate = capacity / per_seconds
+        self._local: dict[str, tuple[float, float]] = {}
+        self._lock = Lock()
+
+    def __call__(self, request: Request) -> None:
+        if not limiter.enabled:
+            return
+        self._check(f"rl:{self.scope}:{get_remote_address(request)}")
+
+    def _check(self, key: str) -> None:
+        """Take a token from ``key``'s bucket or raise 429."""
+        allowed, tokens = self._take(key)
+        if not allowed:
+            retry_after = max(1, math.ceil((1 - tokens) / self.rate))
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="You have exceeded the rate limit. Please try again later.",
+                headers={"Retry-After": str(retry_after), "X-Error-Code": RATE_LIMITED_ERROR_CODE},
+            )
+
+    def _take(self, key: str) -> tuple[bool, float]:
+        if _token_bucket_script is not None:
+            try:
+                allowed, tokens = _token_bucket_script(
+                    keys=[key], args=[self.capacity, self.rate]
+                )
+                return bool(int(allowed)), float(tokens)
+            except redis.RedisError as e:
+                logger.warning("Rate limit check failed (%s); using in-process bucket", e)
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._local.get(key, (float(self.capacity), now))
+            tokens = min(self.capacity, tokens + (now - ts) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            if key not in self._local and len(self._local) >= LOCAL_BUCKETS_MAX_ENTRIES:
+                self._prune_local(now)
+            self._local[key] = (tokens, now)
+        return allowed, tokens
+
+    def _prune_local(self, now: float) -> None:
+        """Drop buckets that have refilled completely, then the oldest (caller holds the lock)."""
+        refill_seconds = self.capacity / self.rate
+        for k in [k for k, (_, ts) in self._local.items() if now - ts >= refill_seconds]:
+            self._local.pop(k, None)
+        while len(self._local) >= LOCAL_BUCKETS_MAX_ENTRIES:
+            self._local.pop(next(iter(self._local)), None)
+
+
+class AccountRateLimit(RateLimit):
+    """
+    Token bucket keyed by client IP plus the account identifier in the
+    request body, so one client hammering one account is capped more tightly
+    than its overall per-IP budget. Keying on the IP too means nobody else
+    can use up an account's bucket and lock its owner out. Use alongside the
+    per-IP RateLimit:
+
+        dependencies=[
+            Depends(RateLimit("login", 5, 60)),
+            Depends(AccountRateLimit("login_account", 10, 900, field="username")),
+        ]
+
+    ``field`` is read from the form or JSON body (already parsed and cached
+    by FastAPI). Requests without it are left to the per-IP limit.
+    """
+
+    def __init__(self, scope: str, capacity: int, per_seconds: int, field: str):
+        super().__init__(scope, capacity, per_seconds)
+        self.field = field
+
+    async def __call__(self, request: Request) -> None:
+        if not limiter.enabled:
+            return
+        if request.headers.get("content-type", "").startswith("application/json"):
+            try:
+                body = await request.json()
+            except ValueError:
+                return
+        else:
+            body = await request.form()
+        value = body.get(self.field) if hasattr(body, "get") else None
+        if not isinstance(value, str) or not value.strip():
+            return
+        # Identifiers are hashed so the limiter store never holds email addresses
+        account = hashlib.blake2b(value.strip().lower().encode("utf-8"), digest_size=16).hexdigest()
+        # Redis round-trip is blocking; keep it off the event loop
+        await run_in_threadpool(self._check, f"rl:{self.scope}:{get_remote_address(request)}:{account}")
+
+
+def _seconds_until_reset(request: Request, exc: RateLimitExceeded) -> int:
+    """Seconds until the exceeded limit admits another request."""
+    current = getattr(request.state, "view_rate_limit", None)
+    if current is not None:
+        try:
+            reset_at, _ = limiter.limiter.get_window_stats(current[0], *current[1])
+            return max(1, math.ceil(reset_at - time.time()))
+        except Exception as e:
+            logger.warning("Could not read rate limit window (%s)", e)
+    # Worst case: a whole window
+    return exc.limit.limit.get_expiry()
+
 
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Response:
     """
     Custom handler for rate limit exceeded errors
     Returns user-friendly error message with retry information
     """
-    retry_after = exc.detail.split("Retry after ")[1] if "Retry after" in exc.detail else "unknown"
-    
+    retry_after = _seconds_until_reset(request, exc)
+
     return JSONResponse(
         status_code=429,
         content={
+            "ok": False,
+            "code": RATE_LIMITED_ERROR_CODE,
             "error": "Too Many Requests",
             "message": "You have exceeded the rate limit. Please try again later.",
             "retry_after": retry_after,
-            "detail": "Too many login attempts. Please wait before trying again."
+            "detail": "Too many attempts. Please wait before trying again."
         },
         headers={
             "Retry-After": str(retry_after),
+            "X-Error-Code": RATE_LIMITED_ERROR_CODE,
             "X-RateLimit-Limit": str(exc.detail),
         }
     )
@@ -0,0 +1,147 @@
+"""
+Short-TTL response cache for global (non-user-specific) read endpoints.
+
+Backed by the same Redis connection as the rate limiter when one is
+available; otherwise falls back to an in-process TTL dict (fine for a
+single worker, NOT shared across workers).
+
+Response payloads cached here must be identical for every caller — never
+cache a response containing PII. The auth layer also keeps small per-user
+security state here, under its own namespaces, so every worker sees it:
+resolved session principals (user id, role, status) and revoked session
+IDs. Both are short-lived and are dropped on status/role changes and logout.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from threading import Lock
+from typing import Any, Optional
+
+import redis
+
+from .rate_limiter import redis_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "drivealive"
+# Entry cap for the in-process fallback; expired entries are swept first,
+# then the oldest go, so keys derived from request input can't grow it.
+LOCAL_CACHE_MAX_ENTRIES = 10_000
+
+
+# On Redis every key carries its namespace's generation
+# (``<prefix>:<namespace>:<gen>:<key>``). clear() bumps the generation, so old
+# entries become unreachable and age out on their TTL - one INCR instead of a
+# SCAN over the keyspace. Each script reads the generation and touches the
+# entry in one round trip. KEYS[1] = generation key, ARGV[1] = namespace
+# prefix, ARGV[2] = key.
+_GET_LUA = """
+local gen = redis.call('GET', KEYS[1]) or '0'
+return redis.call('GET', ARGV[1] .. gen .. ':' .. ARGV[2])
+"""
+_SET_LUA = """
+local gen = redis.call('GET', KEYS[1]) or '0'
+return redis.call('SET', ARGV[1] .. gen .. ':' .. ARGV[2], ARGV[3], 'EX', ARGV[4])
+"""
+_DELETE_LUA = """
+local gen = redis.call('GET', KEYS[1]) or '0'
+return redis.call('DEL', ARGV[1] .. gen .. ':' .. ARGV[2])
+"""
+
+
+class ResponseCache:
+    """JSON value cache keyed by ``<prefix>:<namespace>:<key>`` with per-entry TTL."""
+
+    def __init__(self, client: Optional["redis.Redis"] = None, prefix: str = CACHE_PREFIX):
+        self._client = client
+        self._prefix = prefix
+        self._local: dict[str, tuple[float, str]] = {}
+        self._lock = Lock()
+        if client is not None:
+            self._get_script = client.register_script(_GET_LUA)
+            self._set_script = client.register_script(_SET_LUA)
+            self._delete_script = client.register_script(_DELETE_LUA)
+
+    def _full_key(self, namespace: str, key: str) -> str:
+        return f"{self._prefix}:{namespace}:{key}"
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self._prefix}:gen:{namespace}"
+
+    def _script_args(self, namespace: str, key: str) -> dict:
+        return {
+            "keys": [self._generation_key(namespace)],
+            "args": [f"{self._prefix}:{namespace}:", key],
+        }
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss / expiry / backend error."""
+        full_key = self._full_key(namespace, key)
+        if self._client is not None:
+            try:
+                raw = self._get_script(**self._script_args(namespace, key))
+            except redis.RedisError as e:
+                logger.warning("Response cache read failed (%s); treating as miss", e)
+                return None
+        else:
+            with self._lock:
+                entry = self._local.get(full_key)
+                if entry is None:
+                    return None
+                expires_at, raw = entry
+                if time.monotonic() >= expires_at:
+                    self._local.pop(full_key, None)
+                    return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: int) -> None:
+        """Store a JSON-serialisable value for ``ttl`` seconds."""
+        full_key = self._full_key(namespace, key)
+        raw = json.dumps(value, default=str)
+        if self._client is not None:
+            try:
+                script_args = self._script_args(namespace, key)
+                script_args["args"] += [raw, int(ttl)]
+                self._set_script(**script_args)
+            except redis.RedisError as e:
+                logger.warning("Response cache write failed (%s)", e)
+            return
+        now = time.monotonic()
+        with self._lock:
+            if full_key not in self._local and len(self._local) >= LOCAL_CACHE_MAX_ENTRIES:
+                for k in [k for k, (expires_at, _) in self._local.items() if expires_at <= now]:
+                    self._local.pop(k, None)
+                while len(self._local) >= LOCAL_CACHE_MAX_ENTRIES:
+                    self._local.pop(next(iter(self._local)), None)
+            self._local[full_key] = (now + ttl, raw)
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Drop a single entry."""
+        full_key = self._full_key(namespace, key)
+        if self._client is not None:
+            try:
+                self._delete_script(**self._script_args(namespace, key))
+            except redis.RedisError as e:
+                logger.warning("Response cache delete failed (%s)", e)
+            return
+        with self._lock:
+            self._local.pop(full_key, None)
+
+    def clear(self, namespace: str) -> None:
+        """Drop every entry in ``namespace`` (call after writes that change the data)."""
+        pattern = f"{self._prefix}:{namespace}:"
+        if self._client is not None:
+            try:
+                self._client.incr(self._generation_key(namespace))
+            except redis.RedisError as e:
+                logger.warning("Response cache clear failed (%s)", e)
+            return
+        with self._lock:
+            for k in [k for k in self._local if k.startswith(pattern)]:
+                self._local.pop(k, None)
+
+
+response_cache = ResponseCache(client=redis_client)
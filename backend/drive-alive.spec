@@ -46,6 +46,7 @@ hiddenimports = [
     'sqlalchemy.ext.asyncio',
     'sqlalchemy.dialects.postgresql',
     'pydantic',
+    'passlib.handlers.argon2',
     'passlib.handlers.bcrypt',
     'jose',
     'stripe',
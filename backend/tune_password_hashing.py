@@ -0,0 +1,85 @@
+"""
+Measure argon2id verify time on this machine and suggest ARGON2_* settings
+Usage: python tune_password_hashing.py [target_ms]
+
+Run it on the production host: login throughput is bounded by one verify per
+attempt, so pick the strongest parameters that stay near the target (80 ms by
+default). Never go below the configured defaults (OWASP minimum).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from passlib.context import CryptContext
+
+from app.config import settings
+
+SAMPLE_PASSWORD = "correct horse battery staple"
+ROUNDS = 5
+
+# (time_cost, memory_cost KiB, parallelism) from the configured floor upwards
+CANDIDATES = [
+    (settings.ARGON2_TIME_COST, settings.ARGON2_MEMORY_COST, settings.ARGON2_PARALLELISM),
+    (2, 19456, 1),
+    (2, 32768, 1),
+    (2, 47104, 1),
+    (2, 65536, 1),
+    (2, 65536, 2),
+    (3, 65536, 2),
+    (4, 65536, 2),
+]
+
+
+def time_verify(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    """Median verify time in milliseconds for one parameter set"""
+    context = CryptContext(
+        schemes=["argon2"],
+        argon2__type="ID",
+        argon2__time_cost=time_cost,
+        argon2__memory_cost=memory_cost,
+        argon2__parallelism=parallelism,
+    )
+    hashed = context.hash(SAMPLE_PASSWORD)
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        context.verify(SAMPLE_PASSWORD, hashed)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 80.0
+
+    print(f"\n🔐 argon2id verify timings (target {target_ms:.0f} ms)")
+    print("=" * 60)
+    print(f"{'time_cost':>10} {'memory_kib':>12} {'parallelism':>12} {'verify_ms':>10}")
+
+    best = None
+    floor = CANDIDATES[0]
+    for params in sorted(set(CANDIDATES), key=lambda p: (p[1], p[0], p[2])):
+        if params[0] < floor[0] or params[1] < floor[1]:
+            continue
+        elapsed = time_verify(*params)
+        print(f"{params[0]:>10} {params[1]:>12} {params[2]:>12} {elapsed:>10.1f}")
+        if elapsed <= target_ms:
+            best = params
+
+    print("=" * 60)
+    if best is None:
+        print("⚠️  Even the configured defaults exceed the target; keep the defaults.")
+        best = floor
+    print("Suggested .env settings:")
+    print(f"ARGON2_TIME_COST={best[0]}")
+    print(f"ARGON2_MEMORY_COST={best[1]}")
+    print(f"ARGON2_PARALLELISM={best[2]}")
+    print("\nExisting hashes are upgraded to the new parameters on each user's next login.")
+
+
+if __name__ == "__main__":
+    main()
@@ -62,7 +62,7 @@ MIN_NODE_VERSION = 18
 CRITICAL_PACKAGES = [
     "fastapi", "uvicorn", "sqlalchemy", "psycopg2", "jose",
     "passlib", "pydantic_settings", "dotenv", "stripe", "twilio",
-    "geopy", "slowapi", "cryptography", "bcrypt",
+    "geopy", "slowapi", "cryptography", "argon2", "bcrypt",
 ]
 
 
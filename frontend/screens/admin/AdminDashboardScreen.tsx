@@ -40,13 +40,18 @@ interface AdminStats {
   pending_bookings: number;
   completed_bookings: number;
   cancelled_bookings: number;
+}
+
+interface RevenueSummary {
   total_revenue: number;
+  completed_bookings: number;
   avg_booking_value: number;
 }
 
 export default function AdminDashboardScreen({ navigation }: any) {
   const { colors } = useTheme();
   const [stats, setStats] = useState<AdminStats | null>(null);
+  const [revenue, setRevenue] = useState<RevenueSummary | null>(null);
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
   const [error, setError] = useState('');
@@ -62,8 +67,13 @@ export default function AdminDashboardScreen({ navigation }: any) {
   const loadStats = async () => {
     try {
       setError('');
-      const data = await apiService.getAdminStats();
+      const data = await apiService.getAdminStatsCounters();
       setStats(data);
+      // Revenue aggregates are slower; load them after the counters render
+      apiService
+        .getAdminRevenueSummary()
+        .then(setRevenue)
+        .catch(() => setRevenue(null));
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Failed to load statistics');
     } finally {
@@ -442,18 +452,22 @@ export default function AdminDashboardScreen({ navigation }: any) {
             {/* Revenue Overview */}
             <Card variant="elevated" style={styles.section}>
               <Text style={[styles.sectionTitle, { color: colors.text }]}>Revenue Overview</Text>
-              <View style={styles.statsGrid}>
-                <View style={[styles.statCard, { backgroundColor: colors.backgroundSecondary }]}>
-                  <Text style={[styles.statValue, { color: colors.success }]}>
-                    R{stats.total_revenue.toFixed(0)}
-                  </Text>
-                  <Text style={[styles.statLabel, { color: colors.textSecondary }]}>Total Revenue</Text>
+              {revenue ? (
+                <View style={styles.statsGrid}>
+                  <View style={[styles.statCard, { backgroundColor: colors.backgroundSecondary }]}>
+                    <Text style={[styles.statValue, { color: colors.success }]}>
+                      R{revenue.total_revenue.toFixed(0)}
+                    </Text>
+                    <Text style={[styles.statLabel, { color: colors.textSecondary }]}>Total Revenue</Text>
+                  </View>
+                  <View style={[styles.statCard, { backgroundColor: colors.backgroundSecondary }]}>
+                    <Text style={[styles.statValue, { color: colors.text }]}>R{revenue.avg_booking_value.toFixed(0)}</Text>
+                    <Text style={[styles.statLabel, { color: colors.textSecondary }]}>Avg Booking</Text>
+                  </View>
                 </View>
-                <View style={[styles.statCard, { backgroundColor: colors.backgroundSecondary }]}>
-                  <Text style={[styles.statValue, { color: colors.text }]}>R{stats.avg_booking_value.toFixed(0)}</Text>
-                  <Text style={[styles.statLabel, { color: colors.textSecondary }]}>Avg Booking</Text>
-                </View>
-              </View>
+              ) : (
+                <ActivityIndicator color={colors.primary} />
+              )}
             </Card>
           </>
         )}
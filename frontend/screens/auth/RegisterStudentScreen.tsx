@@ -176,8 +176,9 @@ export default function RegisterStudentScreen({ navigation }: any) {
         email: formData.email,
         phone: formData.phone,
         firstName: formData.first_name,
-        emailSent: verificationData.email_sent,
-        whatsappSent: verificationData.whatsapp_sent,
+        // Messages are sent after the response; "queued" means on its way
+        emailSent: verificationData.email_sent ?? verificationData.email_queued,
+        whatsappSent: verificationData.whatsapp_sent ?? verificationData.whatsapp_queued,
         expiryMinutes: verificationData.expires_in_minutes || 30,
       });
     } catch (error: any) {
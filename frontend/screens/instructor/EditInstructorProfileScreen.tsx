@@ -268,7 +268,7 @@ export default function EditInstructorProfileScreen({ navigation: navProp }: any
         );
 
         // Update instructor profile via admin endpoint
-        const instructorParams = new URLSearchParams({
+        const instructorPayload = {
           license_number: formData.license_number,
           license_types: formData.license_types.join(','),
           vehicle_registration: formData.vehicle_registration,
@@ -283,10 +283,10 @@ export default function EditInstructorProfileScreen({ navigation: navProp }: any
           max_travel_distance_km: formData.max_travel_distance_km || '50',
           rate_per_km_beyond_radius: formData.rate_per_km_beyond_radius || '5',
           bio: formData.bio,
-          is_available: formData.is_available.toString(),
-        });
+          is_available: formData.is_available,
+        };
 
-        await ApiService.put(`/admin/instructors/${instructorId}?${instructorParams.toString()}`);
+        await ApiService.put(`/admin/instructors/${instructorId}`, instructorPayload);
         console.log('✅ Admin save successful');
       } else {
         // Self-editing mode - use regular endpoints
@@ -217,20 +217,21 @@ export default function EditStudentProfileScreen({ navigation: navProp }: any) {
         );
 
         // Update student profile via admin endpoint
-        const studentParams = new URLSearchParams({
+        // Optional fields are sent as null when emptied so the admin endpoint clears them
+        const studentPayload: Record<string, string | null> = {
           address_line1: formData.address_line1,
+          address_line2: formData.address_line2 || null,
           city: formData.city,
           province: formData.province,
+          suburb: formData.suburb || null,
           emergency_contact_name: formData.emergency_contact_name,
           emergency_contact_phone: formData.emergency_contact_phone,
-        });
-        if (formData.address_line2) studentParams.set('address_line2', formData.address_line2);
-        if (formData.suburb) studentParams.set('suburb', formData.suburb);
-        if (formData.postal_code) studentParams.set('postal_code', formData.postal_code);
-        if (formData.learners_permit_number) studentParams.set('learners_permit_number', formData.learners_permit_number);
-        if (formData.id_number) studentParams.set('id_number', formData.id_number);
+          learners_permit_number: formData.learners_permit_number || null,
+        };
+        if (formData.postal_code) studentPayload.postal_code = formData.postal_code;
+        if (formData.id_number) studentPayload.id_number = formData.id_number;
 
-        await ApiService.put(`/admin/students/${studentId}?${studentParams.toString()}`);
+        await ApiService.put(`/admin/students/${studentId}`, studentPayload);
         console.log('✅ Admin save successful');
       } else {
         // Self-editing mode - use regular endpoints
@@ -316,6 +316,16 @@ class ApiService {
     return response.data;
   }
 
+  async getAdminStatsCounters() {
+    const response = await this.api.get('/admin/stats/counters');
+    return response.data;
+  }
+
+  async getAdminRevenueSummary() {
+    const response = await this.api.get('/admin/stats/revenue-summary');
+    return response.data;
+  }
+
   async getPendingInstructors(skip = 0, limit = 50) {
     const response = await this.api.get('/admin/instructors/pending-verification', {
       params: { skip, limit },